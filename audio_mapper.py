@@ -9,6 +9,7 @@ from tkinter import ttk, filedialog, messagebox, simpledialog
 import json
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
 
 try:
@@ -819,13 +820,13 @@ class AudioMapperGUI:
         """
         return MarkerVersionManager.rollback_to_version(marker, version_num)
 
-    def migrate_marker_to_version_format(self, marker):
+    def migrate_marker_to_version_format(self, marker, now_iso=None):
         """
         Migrate a marker to the new version-based format
 
         Handles both old format (no versions) and ensures version structure exists
         """
-        return MarkerVersionManager.migrate_marker_to_version_format(marker)
+        return MarkerVersionManager.migrate_marker_to_version_format(marker, now_iso=now_iso)
 
     def get_prompt_preview(self, marker):
         """Get a short preview string of the prompt for display in marker list"""
@@ -1750,11 +1751,14 @@ class AudioMapperGUI:
 
             # Migrate markers from old format to new format if needed
             migrated_markers = []
+            migrated_at = datetime.now().isoformat()  # One timestamp for the whole import
             for i, marker in enumerate(data["markers"]):
-                # First migrate prompt format (old string -> new prompt_data)
-                migrated = self.migrate_marker_to_new_format(marker)
+                # First migrate prompt format (old string -> new prompt_data); most are already new
+                migrated = marker
+                if not MarkerVersionManager.is_new_format(marker):
+                    migrated = self.migrate_marker_to_new_format(marker)
                 # Then migrate to version format
-                migrated = self.migrate_marker_to_version_format(migrated)
+                migrated = self.migrate_marker_to_version_format(migrated, now_iso=migrated_at)
 
                 # Validate marker time_ms
                 if migrated.get("time_ms", 0) < 0:
@@ -1808,7 +1812,7 @@ class AudioMapperGUI:
             "template_id": self.template_id or "TEMPLATE",
             "template_name": self.template_name or "Untitled",
             "duration_ms": self.video_player.get_duration(),
-            "markers": self.markers
+            "markers": [MarkerVersionManager.strip_runtime_fields(m) for m in self.markers]
         }
 
         # Write to file
@@ -1825,6 +1829,9 @@ def main():
     app = AudioMapperGUI(root)
     root.mainloop()
 
+    # Drop queued generation requests so exit doesn't wait for them
+    AudioGenerationService.shutdown()
+
 
 if __name__ == "__main__":
     main()
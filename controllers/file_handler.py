@@ -8,6 +8,8 @@ import json
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+from managers.version_manager import MarkerVersionManager
+
 
 class FileHandler:
     """
@@ -94,7 +96,7 @@ class FileHandler:
                 "template_id": template_id or "TEMPLATE",
                 "template_name": template_name or "Untitled",
                 "duration_ms": duration_ms,
-                "markers": markers
+                "markers": [MarkerVersionManager.strip_runtime_fields(m) for m in markers]
             }
 
             # Ensure parent directory exists
@@ -160,9 +162,7 @@ class FileHandler:
             prompt_data = {"description": old_prompt}
 
         # Create new marker without "prompt" field
-        new_marker = marker.copy()
-        if "prompt" in new_marker:
-            del new_marker["prompt"]
+        new_marker = {k: v for k, v in marker.items() if k != "prompt"}
         new_marker["prompt_data"] = prompt_data
 
         return new_marker
@@ -185,7 +185,7 @@ class FileHandler:
             return marker
 
         # Ensure prompt_data exists (call migrate_marker_to_new_format first if needed)
-        if "prompt_data" not in marker:
+        if not MarkerVersionManager.is_new_format(marker):
             marker = FileHandler.migrate_marker_to_new_format(marker)
 
         prompt_data = marker.get("prompt_data", FileHandler._create_default_prompt_data(marker.get("type", "sfx")))
@@ -158,9 +158,8 @@ class GenerateAudioCommand(Command):
         """
         # Store the new state (after generation)
         if self.new_marker_state is None:
-            marker = self.repository.get_marker(self.marker_index)
-            if marker:
-                self.new_marker_state = copy.deepcopy(marker)
+            # get_marker already returns a deep copy
+            self.new_marker_state = self.repository.get_marker(self.marker_index)
         else:
             self.repository.update_marker(self.marker_index, self.new_marker_state)
 
@@ -4,12 +4,17 @@ Data Models - Type-safe data structures for Audio Mapper
 Replaces dictionary-based data with proper dataclasses for type safety and validation
 """
 
+import sys
 from dataclasses import dataclass, field, asdict
 from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 from enum import Enum
 
 
+# dataclass(slots=True) needs Python 3.10+; fall back to a regular dataclass on 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 # ============================================================================
 # ENUMS
 # ============================================================================
@@ -124,9 +129,14 @@ PromptData = Union[SFXPromptData, VoicePromptData, MusicPromptData]
 # VERSION MODEL
 # ============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class AudioVersion:
-    """Represents a version of generated audio for a marker"""
+    """
+    Represents a version of generated audio for a marker
+
+    Slotted: markers can accumulate many versions, and slots drop the
+    per-instance __dict__ (smaller objects, faster attribute access).
+    """
     version: int
     asset_file: str
     asset_id: Optional[str] = None
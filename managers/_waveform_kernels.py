@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Waveform Kernels - Numba-compiled helpers for waveform downsampling
+Used for very long clips where numpy temporaries dominate the cost.
+
+Numba is optional: if it isn't installed, NUMBA_AVAILABLE is False and
+callers fall back to their numpy implementation.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def rms_downsample(audio: np.ndarray, out: np.ndarray, samples_per_pixel: int):
+        """
+        Fill out[i] with the RMS of audio[i*spp:(i+1)*spp] (fused square + sum)
+
+        Bins that start past the end of the audio are set to 0.
+
+        Args:
+            audio: Mono audio samples (1-D, contiguous)
+            out: Output buffer, one value per pixel
+            samples_per_pixel: Number of samples per output bin
+        """
+        total_samples = audio.shape[0]
+        for i in prange(out.shape[0]):
+            start = i * samples_per_pixel
+            end = min(start + samples_per_pixel, total_samples)
+            if start >= total_samples:
+                out[i] = 0.0
+                continue
+
+            s = 0.0
+            for k in range(start, end):
+                s += audio[k] * audio[k]
+            out[i] = math.sqrt(s / (end - start))
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def rms_downsample_multichannel(audio: np.ndarray, out: np.ndarray, samples_per_pixel: int):
+        """
+        Same as rms_downsample for (N, channels) audio, mixing to mono on the fly
+
+        Args:
+            audio: Audio samples shaped (N, channels), C-contiguous
+            out: Output buffer, one value per pixel
+            samples_per_pixel: Number of samples per output bin
+        """
+        total_samples = audio.shape[0]
+        channels = audio.shape[1]
+        for i in prange(out.shape[0]):
+            start = i * samples_per_pixel
+            end = min(start + samples_per_pixel, total_samples)
+            if start >= total_samples:
+                out[i] = 0.0
+                continue
+
+            s = 0.0
+            for k in range(start, end):
+                mono = 0.0
+                for c in range(channels):
+                    mono += audio[k, c]
+                mono /= channels
+                s += mono * mono
+            out[i] = math.sqrt(s / (end - start))
+else:
+    rms_downsample = None
+    rms_downsample_multichannel = None
@@ -10,10 +10,52 @@ Key Responsibilities:
 - Ensure version data structure integrity
 """
 
+import pickle
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
 
+def _fast_deepcopy(data: Any) -> Any:
+    """
+    Deep copy JSON-shaped data via a pickle round-trip
+
+    Much faster than copy.deepcopy for plain dicts/lists/strings because
+    all of the work happens in C.
+    """
+    return pickle.loads(pickle.dumps(data, protocol=-1))
+
+
+def _clone_prompt_data(prompt_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a prompt_data dict so the clone shares no mutable state with the original
+
+    SFX and voice prompts are flat dicts of strings, so a shallow copy is
+    enough. Music prompts (positiveGlobalStyles + nested sections) and
+    anything unexpected go through _fast_deepcopy.
+
+    Args:
+        prompt_data: prompt_data dict for any marker type
+
+    Returns:
+        Independent copy of prompt_data
+    """
+    if "positiveGlobalStyles" not in prompt_data and all(
+            not isinstance(value, (dict, list)) for value in prompt_data.values()):
+        return dict(prompt_data)
+    return _fast_deepcopy(prompt_data)
+
+
+# Template for version objects; copy() it and fill in the per-version fields
+_VERSION_PROTO: Dict[str, Any] = {
+    "version": 0,
+    "asset_file": "",
+    "asset_id": None,  # Will be set when generated via API
+    "created_at": "",
+    "status": "not yet generated",
+    "prompt_data_snapshot": None
+}
+
+
 class MarkerVersionManager:
     """
     Manages marker versioning and format migrations
@@ -24,6 +66,21 @@ class MarkerVersionManager:
     - Version format migration (ensure version structure exists)
     """
 
+    @staticmethod
+    def is_new_format(marker: Dict[str, Any]) -> bool:
+        """
+        Check whether a marker already uses the prompt_data format
+
+        Loaders can test this first and skip migration for the common case.
+
+        Args:
+            marker: Marker dict
+
+        Returns:
+            True if the marker has prompt_data
+        """
+        return "prompt_data" in marker
+
     @staticmethod
     def migrate_marker_to_new_format(marker: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -75,9 +132,8 @@ class MarkerVersionManager:
                 "description": old_prompt
             }
 
-        # Update marker with new format
-        new_marker = marker.copy()
-        del new_marker["prompt"]  # Remove old field
+        # Build new-format marker directly, leaving out the old "prompt" field
+        new_marker = {k: v for k, v in marker.items() if k != "prompt"}
         new_marker["prompt_data"] = prompt_data
         new_marker["asset_id"] = marker.get("asset_id", None)
         new_marker["status"] = marker.get("status", "not yet generated")
@@ -101,21 +157,104 @@ class MarkerVersionManager:
         current_version = marker.get("current_version", 1)
 
         # Find version object matching current_version
-        for version_obj in marker["versions"]:
-            if version_obj["version"] == current_version:
-                return version_obj
+        version_obj = MarkerVersionManager.get_version(marker, current_version)
+        if version_obj is not None:
+            return version_obj
 
         # Fallback to latest version if current not found
         return marker["versions"][-1] if marker["versions"] else None
 
     @staticmethod
-    def add_new_version(marker: Dict[str, Any], prompt_data: Dict[str, Any]) -> int:
+    def get_version(marker: Dict[str, Any], version_num: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific version object from a marker (O(1) via the version index)
+
+        Args:
+            marker: Marker dict with versions
+            version_num: Version number to look up
+
+        Returns:
+            Version object, or None if the marker has no such version
+        """
+        if not marker.get("versions"):
+            return None
+
+        position = MarkerVersionManager._find_version_position(marker, version_num)
+        return marker["versions"][position] if position is not None else None
+
+    @staticmethod
+    def _find_version_position(marker: Dict[str, Any], version_num: int) -> Optional[int]:
+        """
+        Look up a version's list position via the cached "_version_index"
+
+        The index is validated on every hit and rebuilt when it is missing or
+        stale (versions edited elsewhere, or string keys after a JSON round-trip).
+
+        Args:
+            marker: Marker dict with a non-empty versions list
+            version_num: Version number to find
+
+        Returns:
+            Index into marker["versions"], or None if the version doesn't exist
+        """
+        versions = marker["versions"]
+        index = marker.get("_version_index")
+        if isinstance(index, dict):
+            position = index.get(version_num)
+            if position is not None and position < len(versions) and versions[position]["version"] == version_num:
+                return position
+
+        index = {v["version"]: i for i, v in enumerate(versions)}
+        marker["_version_index"] = index
+        return index.get(version_num)
+
+    @staticmethod
+    def _next_version_number(marker: Dict[str, Any]) -> int:
+        """
+        Get the next version number using the cached "_max_version"
+
+        Versions are append-only and monotonically increasing, so the cache only
+        needs a full max() scan when it is missing or behind the last version.
+
+        Args:
+            marker: Marker dict with a versions list
+
+        Returns:
+            Next version number (1 if the marker has no versions)
+        """
+        versions = marker["versions"]
+        max_version = marker.get("_max_version")
+        if not isinstance(max_version, int) or not versions or max_version < versions[-1]["version"]:
+            max_version = max((v["version"] for v in versions), default=0)
+        return max_version + 1
+
+    @staticmethod
+    def strip_runtime_fields(marker: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return a shallow view of a marker without runtime-only cache keys
+
+        Underscore-prefixed keys ("_max_version", "_version_index") are lookup
+        caches and shouldn't be written to template JSON.
+
+        Args:
+            marker: Marker dict
+
+        Returns:
+            Marker dict with underscore-prefixed keys removed
+        """
+        return {key: value for key, value in marker.items() if not key.startswith("_")}
+
+    @staticmethod
+    def add_new_version(marker: Dict[str, Any], prompt_data: Dict[str, Any],
+                        now_iso: Optional[str] = None) -> int:
         """
         Create a new version for a marker
 
         Args:
             marker: The marker dict to add version to
             prompt_data: The prompt_data to use for this version
+            now_iso: Creation timestamp (ISO format); computed if None.
+                Pass one value for a whole batch to stamp it consistently.
 
         Returns:
             The new version number
@@ -124,11 +263,8 @@ class MarkerVersionManager:
         if "versions" not in marker:
             marker["versions"] = []
 
-        # Get next version number
-        if marker["versions"]:
-            next_version = max(v["version"] for v in marker["versions"]) + 1
-        else:
-            next_version = 1
+        # Get next version number (O(1) via cached max)
+        next_version = MarkerVersionManager._next_version_number(marker)
 
         # Generate new asset filename with version
         type_prefix_map = {
@@ -143,24 +279,26 @@ class MarkerVersionManager:
         asset_file = f"{prefix}_{marker_count:05d}_v{next_version}.mp3"
 
         # Create version object
-        version_obj = {
-            "version": next_version,
-            "asset_file": asset_file,
-            "asset_id": None,  # Will be set when generated via API
-            "created_at": datetime.now().isoformat(),
-            "status": "not yet generated",
-            "prompt_data_snapshot": prompt_data.copy()  # Deep copy of prompt_data
-        }
-
-        # Add to versions list
+        version_obj = _VERSION_PROTO.copy()
+        version_obj["version"] = next_version
+        version_obj["asset_file"] = asset_file
+        version_obj["created_at"] = now_iso if now_iso is not None else datetime.now().isoformat()
+        # Snapshot is the only copy; nested music sections must not alias the live dict
+        version_obj["prompt_data_snapshot"] = _clone_prompt_data(prompt_data)
+
+        # Add to versions list and keep the lookup caches in step
         marker["versions"].append(version_obj)
+        marker["_max_version"] = next_version
+        index = marker.get("_version_index")
+        if isinstance(index, dict):
+            index[next_version] = len(marker["versions"]) - 1
 
         # Update current_version
         marker["current_version"] = next_version
 
         # Update top-level fields for backward compatibility
         marker["asset_file"] = asset_file
-        marker["prompt_data"] = prompt_data.copy()
+        marker["prompt_data"] = prompt_data  # Caller owns the live dict, no second copy
         marker["status"] = "not yet generated"
         marker["asset_id"] = None
 
@@ -182,14 +320,10 @@ class MarkerVersionManager:
             return False
 
         # Find the version object
-        target_version = None
-        for version_obj in marker["versions"]:
-            if version_obj["version"] == version_num:
-                target_version = version_obj
-                break
-
-        if not target_version:
+        position = MarkerVersionManager._find_version_position(marker, version_num)
+        if position is None:
             return False
+        target_version = marker["versions"][position]
 
         # Update current_version
         marker["current_version"] = version_num
@@ -198,12 +332,14 @@ class MarkerVersionManager:
         marker["asset_file"] = target_version["asset_file"]
         marker["asset_id"] = target_version["asset_id"]
         marker["status"] = target_version["status"]
-        marker["prompt_data"] = target_version["prompt_data_snapshot"].copy()
+        # Deep copy so edits to the restored prompt never reach back into the snapshot
+        marker["prompt_data"] = _clone_prompt_data(target_version["prompt_data_snapshot"])
 
         return True
 
     @staticmethod
-    def migrate_marker_to_version_format(marker: Dict[str, Any]) -> Dict[str, Any]:
+    def migrate_marker_to_version_format(marker: Dict[str, Any],
+                                         now_iso: Optional[str] = None) -> Dict[str, Any]:
         """
         Migrate a marker to the new version-based format
 
@@ -211,6 +347,8 @@ class MarkerVersionManager:
 
         Args:
             marker: Marker dict to migrate
+            now_iso: Creation timestamp (ISO format) for the v1 entry; computed if None.
+                Bulk loaders compute it once and pass it for every marker.
 
         Returns:
             Marker dict with version structure
@@ -246,18 +384,19 @@ class MarkerVersionManager:
             extension = asset_file.rsplit(".", 1)[1] if "." in asset_file else "mp3"
             asset_file = f"{base_name}_v1.{extension}"
 
-        version_obj = {
-            "version": 1,
-            "asset_file": asset_file,
-            "asset_id": marker.get("asset_id", None),
-            "created_at": datetime.now().isoformat(),
-            "status": marker.get("status", "not yet generated"),
-            "prompt_data_snapshot": prompt_data.copy()
-        }
+        version_obj = _VERSION_PROTO.copy()
+        version_obj["version"] = 1
+        version_obj["asset_file"] = asset_file
+        version_obj["asset_id"] = marker.get("asset_id", None)
+        version_obj["created_at"] = now_iso if now_iso is not None else datetime.now().isoformat()
+        version_obj["status"] = marker.get("status", "not yet generated")
+        version_obj["prompt_data_snapshot"] = _clone_prompt_data(prompt_data)
 
         # Add version structure to marker
         marker["versions"] = [version_obj]
         marker["current_version"] = 1
+        marker["_max_version"] = 1
+        marker["_version_index"] = {1: 0}
         marker["asset_file"] = asset_file
 
         # Ensure all required fields exist
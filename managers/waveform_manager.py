@@ -4,12 +4,122 @@ Waveform Manager - Audio Waveform Visualization Component
 Handles waveform extraction, display, and interaction
 """
 
+import functools
+import os
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 import numpy as np
 from moviepy.video.io.VideoFileClip import VideoFileClip
 from moviepy.audio.io.AudioFileClip import AudioFileClip
 from typing import Optional, Callable, Tuple
 from config.color_scheme import COLORS
+from managers import _waveform_kernels
+
+# Above this many samples the numba kernel beats numpy (when numba is installed)
+NUMBA_SAMPLE_THRESHOLD = 10_000_000
+
+# Samples per block in the numpy RMS path (bounds temporary allocations)
+_RMS_BLOCK_SAMPLES = 1 << 20
+
+
+def _rms_downsample(audio_array: np.ndarray, target_width: int) -> list[float]:
+    """
+    Downsample audio to a normalized (0-1) RMS envelope
+
+    Stereo input is mixed to mono per block, so no full-length mono copy is
+    ever allocated.
+
+    Args:
+        audio_array: Audio samples, mono (N,) or multi-channel (N, channels)
+        target_width: Number of pixels/samples in waveform
+
+    Returns:
+        List of normalized amplitudes, padded with silence if audio is shorter than target
+    """
+    total_samples = len(audio_array)
+    multichannel = audio_array.ndim > 1
+
+    # Calculate samples per pixel
+    samples_per_pixel = max(1, total_samples // target_width)
+
+    out = np.zeros(target_width, dtype=np.float64)
+
+    # Very long clips: parallel compiled kernel, no x**2 temporaries
+    if _waveform_kernels.NUMBA_AVAILABLE and total_samples > NUMBA_SAMPLE_THRESHOLD:
+        kernel = (_waveform_kernels.rms_downsample_multichannel if multichannel
+                  else _waveform_kernels.rms_downsample)
+        kernel(np.ascontiguousarray(audio_array), out, samples_per_pixel)
+    else:
+        # Every filled pixel is a whole chunk; the leftover tail is dropped
+        # and pixels past the end of short audio stay 0 (silence)
+        num_chunks = min(target_width, total_samples // samples_per_pixel)
+        chunks = audio_array[:num_chunks * samples_per_pixel].reshape(
+            (num_chunks, samples_per_pixel) + audio_array.shape[1:]
+        )
+
+        # Process a bounded number of chunks at a time to cap temporaries
+        step = max(1, _RMS_BLOCK_SAMPLES // samples_per_pixel)
+        for block_start in range(0, num_chunks, step):
+            block = chunks[block_start:block_start + step]
+            if multichannel:
+                block = block.mean(axis=2)
+            out[block_start:block_start + len(block)] = np.einsum("ij,ij->i", block, block)
+        out[:num_chunks] = np.sqrt(out[:num_chunks] / samples_per_pixel)
+
+    # Normalize to 0-1 range
+    max_val = out.max() if target_width else 0
+    if max_val > 0:
+        out /= max_val
+
+    return out.tolist()
+
+
+def _decode_waveform(filepath: str, target_width: int, from_video: bool) -> Tuple[Optional[tuple], int]:
+    """
+    Decode a media file and reduce its audio to an RMS envelope
+
+    Pure function of the file contents, so results can be memoized.
+
+    Args:
+        filepath: Path to video or audio file
+        target_width: Number of pixels/samples in waveform
+        from_video: True to read the audio track of a video file
+
+    Returns:
+        Tuple of (waveform, duration_ms); waveform is None if the file has no audio
+    """
+    clip = VideoFileClip(filepath) if from_video else AudioFileClip(filepath)
+    try:
+        audio = clip.audio if from_video else clip
+        if audio is None:
+            return None, 0
+
+        # Get audio as numpy array (downsample to 22050 Hz for performance)
+        audio_array = audio.to_soundarray(fps=22050)
+
+        # Get duration in milliseconds
+        duration_ms = int(clip.duration * 1000)
+    finally:
+        clip.close()
+
+    # Tuple so cached results can't be mutated by callers
+    return tuple(_rms_downsample(audio_array, target_width)), duration_ms
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_waveform(filepath: str, mtime_ns: int, size: int, target_width: int,
+                     from_video: bool = False) -> Tuple[Optional[tuple], int]:
+    """
+    Memoized _decode_waveform; mtime and size are part of the key so edited
+    files are re-decoded, even when rewritten within the mtime resolution
+    """
+    return _decode_waveform(filepath, target_width, from_video)
+
+
+def _load_waveform(filepath: str, target_width: int, from_video: bool = False) -> Tuple[Optional[tuple], int]:
+    """Load a waveform envelope through the cache, keyed by (path, mtime_ns, size, width)"""
+    stat = os.stat(filepath)
+    return _cached_waveform(filepath, stat.st_mtime_ns, stat.st_size, target_width, from_video)
 
 
 class WaveformManager:
@@ -43,6 +153,23 @@ class WaveformManager:
         self.waveform_data: Optional[list[float]] = None
         self.duration_ms: int = 0
 
+        # Background decoding (single worker so loads are serialized)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="waveform")
+        self._pending_future: Optional[Future] = None
+
+        # Canvas width, kept current by <Configure> so hot paths skip winfo_width()
+        self._canvas_width: int = 1200
+
+        # Resize debouncing: pending after() id and the width last drawn at
+        self._resize_after_id = None
+        self._drawn_width: Optional[int] = None
+
+        # Canvas item id of the playhead line, created lazily and moved with coords()
+        self._pos_line_id: Optional[int] = None
+
+        # Whether placeholder text is currently on the canvas
+        self._placeholder_shown = False
+
         # Callbacks
         self.on_seek = on_seek
         self.on_deselect_marker = on_deselect_marker
@@ -58,7 +185,8 @@ class WaveformManager:
         """Show placeholder text on canvas"""
         if color is None:
             color = COLORS.placeholder_text
-        self.canvas.delete("waveform_placeholder")
+        if self._placeholder_shown:
+            self.canvas.delete("waveform_placeholder")
         self.canvas.create_text(
             600, 40,
             text=text,
@@ -66,54 +194,74 @@ class WaveformManager:
             font=("Arial", 10),
             tags="waveform_placeholder"
         )
+        self._placeholder_shown = True
 
     def extract_and_display(self, video_filepath: str) -> bool:
         """
         Extract audio from video and display waveform
 
+        Decoding runs on a worker thread so the Tk mainloop stays responsive;
+        the waveform is drawn on the UI thread once it is ready. Starting a new
+        load supersedes any load still in flight.
+
         Args:
             video_filepath: Path to video file
 
         Returns:
-            True if successful, False otherwise
+            True if extraction was started, False otherwise
         """
         try:
             print("⏳ Extracting audio for waveform...")
 
-            # Load video with moviepy
-            video = VideoFileClip(video_filepath)
-
-            if video.audio is None:
-                print("⚠ No audio track found in video")
-                self._show_placeholder("No audio track in video", COLORS.disabled_text)
-                video.close()
-                return False
-
-            # Get audio as numpy array
-            audio_array = video.audio.to_soundarray(fps=22050)  # Downsample for performance
+            # Cancel a load that hasn't started yet; a running one is ignored when it finishes
+            if self._pending_future is not None:
+                self._pending_future.cancel()
 
-            # Get duration in milliseconds
-            self.duration_ms = int(video.duration * 1000)
+            future = self._executor.submit(_load_waveform, video_filepath, 1200, True)
+            self._pending_future = future
 
-            video.close()
-
-            # If stereo, convert to mono by averaging channels
-            if len(audio_array.shape) > 1:
-                audio_array = np.mean(audio_array, axis=1)
+            # Hop back onto the Tk thread to touch the canvas
+            future.add_done_callback(
+                lambda f: self.canvas.after(0, self._finish_extraction, f)
+            )
+            return True
 
-            # Calculate waveform data (downsample for display)
-            self._calculate_waveform_data(audio_array)
+        except Exception as e:
+            print(f"⚠ Could not extract waveform: {e}")
+            self._show_placeholder("Could not extract audio waveform", COLORS.disabled_text)
+            return False
 
-            # Draw waveform
-            self.draw()
+    def _finish_extraction(self, future: Future):
+        """
+        Apply a finished background extraction (runs on the Tk thread)
 
-            print("✓ Waveform extracted and displayed")
-            return True
+        Args:
+            future: Completed future from extract_and_display
+        """
+        # Superseded by a newer load or cleared in the meantime
+        if future is not self._pending_future or future.cancelled():
+            return
+        self._pending_future = None
 
+        try:
+            waveform, duration_ms = future.result()
         except Exception as e:
             print(f"⚠ Could not extract waveform: {e}")
             self._show_placeholder("Could not extract audio waveform", COLORS.disabled_text)
-            return False
+            return
+
+        if waveform is None:
+            print("⚠ No audio track found in video")
+            self._show_placeholder("No audio track in video", COLORS.disabled_text)
+            return
+
+        self.duration_ms = duration_ms
+        self.waveform_data = list(waveform)
+
+        # Draw waveform
+        self.draw()
+
+        print("✓ Waveform extracted and displayed")
 
     @staticmethod
     def extract_waveform_from_audio(audio_filepath: str, target_width: int = 150) -> Tuple[Optional[list[float]], int]:
@@ -132,46 +280,11 @@ class WaveformManager:
             - duration_ms: Duration in milliseconds, or 0 if extraction failed
         """
         try:
-            # Load audio file with moviepy
-            audio_clip = AudioFileClip(audio_filepath)
-
-            # Get audio as numpy array (downsample to 22050 Hz for performance)
-            audio_array = audio_clip.to_soundarray(fps=22050)
-
-            # Get duration in milliseconds
-            duration_ms = int(audio_clip.duration * 1000)
+            waveform, duration_ms = _load_waveform(audio_filepath, target_width)
+            if waveform is None:
+                return None, 0
 
-            audio_clip.close()
-
-            # If stereo, convert to mono by averaging channels
-            if len(audio_array.shape) > 1:
-                audio_array = np.mean(audio_array, axis=1)
-
-            # Calculate waveform data (same logic as _calculate_waveform_data)
-            total_samples = len(audio_array)
-            samples_per_pixel = max(1, total_samples // target_width)
-
-            waveform = []
-            for i in range(target_width):
-                start_idx = i * samples_per_pixel
-                end_idx = min(start_idx + samples_per_pixel, total_samples)
-
-                if start_idx < total_samples:
-                    chunk = audio_array[start_idx:end_idx]
-                    if len(chunk) > 0:
-                        rms = np.sqrt(np.mean(chunk**2))
-                        waveform.append(rms)
-                    else:
-                        waveform.append(0)
-                else:
-                    waveform.append(0)
-
-            # Normalize to 0-1 range
-            max_val = max(waveform) if waveform else 1
-            if max_val > 0:
-                waveform = [w / max_val for w in waveform]
-
-            return waveform, duration_ms
+            return list(waveform), duration_ms
 
         except Exception as e:
             print(f"⚠ Could not extract waveform from audio: {e}")
@@ -182,72 +295,45 @@ class WaveformManager:
         Calculate downsampled waveform data for display using RMS
 
         Args:
-            audio_array: Raw audio samples
+            audio_array: Raw audio samples, mono or (N, channels)
             target_width: Number of pixels/samples in waveform (default: 1200)
         """
-        total_samples = len(audio_array)
-
-        # Calculate samples per pixel
-        samples_per_pixel = max(1, total_samples // target_width)
-
-        # Calculate RMS (root mean square) for each pixel
-        waveform = []
-        for i in range(target_width):
-            start_idx = i * samples_per_pixel
-            end_idx = min(start_idx + samples_per_pixel, total_samples)
-
-            if start_idx < total_samples:
-                chunk = audio_array[start_idx:end_idx]
-                if len(chunk) > 0:
-                    rms = np.sqrt(np.mean(chunk**2))
-                    waveform.append(rms)
-                else:
-                    waveform.append(0)
-            else:
-                # Pad with silence if audio is shorter than target
-                waveform.append(0)
-
-        # Normalize to 0-1 range
-        max_val = max(waveform) if waveform else 1
-        if max_val > 0:
-            waveform = [w / max_val for w in waveform]
-
-        self.waveform_data = waveform
+        self.waveform_data = _rms_downsample(audio_array, target_width)
 
     def draw(self):
         """Draw waveform on canvas"""
         if not self.waveform_data:
             return
 
-        # Clear canvas
+        # Clear canvas (this also removes the playhead line)
         self.canvas.delete("all")
+        self._pos_line_id = None
+        self._placeholder_shown = False
 
-        # Get canvas dimensions
-        canvas_width = self.canvas.winfo_width()
-        if canvas_width <= 1:
-            canvas_width = 1200  # Default width
+        # Get canvas dimensions (cached from <Configure>, 1200 until first layout)
+        canvas_width = self._canvas_width
 
+        self._drawn_width = canvas_width
         mid_y = self.canvas_height // 2
 
         # Draw waveform - ensure it fills the full canvas width
         num_samples = len(self.waveform_data)
 
-        # Draw each sample, stretching to fill full canvas width
-        for i, amplitude in enumerate(self.waveform_data):
-            # Calculate x positions to fill entire canvas width
-            x_start = int((i / num_samples) * canvas_width)
-            x_end = int(((i + 1) / num_samples) * canvas_width)
-
-            # Use the midpoint or draw a rectangle for better coverage
-            x = (x_start + x_end) // 2
+        # Compute all pixel positions at once: each sample's x is the midpoint
+        # of its slice of the canvas width, so the waveform fills the full width
+        edges = (np.arange(num_samples + 1) * canvas_width) // num_samples
+        xs = (edges[:-1] + edges[1:]) // 2
 
-            # Scale amplitude to fit canvas height
-            height = int(amplitude * (self.canvas_height / 2) * 0.9)
+        # Scale amplitudes to fit canvas height
+        heights = (np.asarray(self.waveform_data) * (self.canvas_height / 2) * 0.9).astype(np.int64)
+        tops = mid_y - heights
+        bottoms = mid_y + heights
 
-            # Draw vertical line for this sample (use width=2 for better visibility)
+        # Draw vertical line for each sample (use width=2 for better visibility)
+        for x, top, bottom in zip(xs.tolist(), tops.tolist(), bottoms.tolist()):
             self.canvas.create_line(
-                x, mid_y - height,
-                x, mid_y + height,
+                x, top,
+                x, bottom,
                 fill=COLORS.waveform_color,
                 width=2,
                 tags="waveform"
@@ -272,24 +358,22 @@ class WaveformManager:
         if not self.waveform_data or self.duration_ms == 0:
             return
 
-        # Remove old position indicator
-        self.canvas.delete("position")
-
         # Calculate position
-        canvas_width = self.canvas.winfo_width()
-        if canvas_width <= 1:
-            canvas_width = 1200
+        canvas_width = self._canvas_width
 
         x_pos = int((current_time_ms / self.duration_ms) * canvas_width)
 
-        # Draw position indicator
-        self.canvas.create_line(
-            x_pos, 0,
-            x_pos, self.canvas_height,
-            fill=COLORS.position_indicator,
-            width=2,
-            tags="position"
-        )
+        # Create the position indicator once, then just move it
+        if self._pos_line_id is None:
+            self._pos_line_id = self.canvas.create_line(
+                x_pos, 0,
+                x_pos, self.canvas_height,
+                fill=COLORS.position_indicator,
+                width=2,
+                tags="position"
+            )
+        else:
+            self.canvas.coords(self._pos_line_id, x_pos, 0, x_pos, self.canvas_height)
 
     def _handle_click(self, event):
         """Handle click on waveform for scrubbing"""
@@ -311,9 +395,7 @@ class WaveformManager:
                 self.on_deselect_marker()
 
             # Get canvas width
-            canvas_width = self.canvas.winfo_width()
-            if canvas_width <= 1:
-                return
+            canvas_width = self._canvas_width
 
             # Calculate time from click position
             x_pos = event.x
@@ -323,15 +405,40 @@ class WaveformManager:
             self.on_seek(time_ms)
 
     def _handle_resize(self, event):
-        """Handle waveform canvas resize - redraw waveform"""
-        if self.waveform_data:
-            self.draw()
+        """Handle waveform canvas resize - redraw once resizing settles (50ms debounce)"""
+        if event.width > 1:
+            self._canvas_width = event.width
+
+        if self._resize_after_id is not None:
+            self.canvas.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.canvas.after(50, self._do_resize_draw)
+
+    def _do_resize_draw(self):
+        """Redraw after a debounced resize, skipping it if the width didn't change"""
+        self._resize_after_id = None
+        if not self.waveform_data:
+            return
+        if self._canvas_width == self._drawn_width:
+            return
+        self.draw()
 
     def clear(self):
         """Clear waveform data and canvas"""
+        # Drop any in-flight extraction so it can't repaint after clearing
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+            self._pending_future = None
+
+        if self._resize_after_id is not None:
+            self.canvas.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+
         self.waveform_data = None
         self.duration_ms = 0
+        self._drawn_width = None
+        self._pos_line_id = None
         self.canvas.delete("all")
+        self._placeholder_shown = False
         self._show_placeholder("Audio waveform will appear here")
 
     def has_data(self) -> bool:
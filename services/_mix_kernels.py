@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Mix Kernels - Numba-compiled helpers for track mixing
+Fused per-sample add/saturate loops that avoid numpy temporaries.
+
+Numba is optional: if it isn't installed, NUMBA_AVAILABLE is False and
+callers fall back to their numpy implementation.
+
+The kernels are deliberately serial (no parallel=True): assembly already
+renders tracks on a thread pool, and numba's default workqueue threading
+layer must not be entered from several threads at once.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def mix_into(dst: np.ndarray, src: np.ndarray, offset: int):
+        """
+        Add int16 clip frames into an accumulator at a frame offset
+
+        Both arrays must be C-contiguous with the same channel count; they
+        are walked as flat sample runs so the add loop vectorizes. Frames
+        past the end of dst are dropped.
+
+        Args:
+            dst: float32 (or int32) accumulator shaped (frames, channels)
+            src: int16 clip shaped (frames, channels)
+            offset: First dst frame to write to
+        """
+        channels = dst.shape[1]
+        frames = min(src.shape[0], dst.shape[0] - offset)
+        out = dst.reshape(-1)[offset * channels:(offset + frames) * channels]
+        clip = src.reshape(-1)
+        for i in range(frames * channels):
+            out[i] += clip[i]
+
+    @njit(cache=True, nogil=True)
+    def mix_mono_into(dst: np.ndarray, src: np.ndarray, offset: int):
+        """
+        Add a mono int16 clip into every channel of an accumulator
+
+        Args:
+            dst: float32 (or int32) accumulator shaped (frames, channels)
+            src: 1-D int16 clip
+            offset: First dst frame to write to
+        """
+        frames = min(src.shape[0], dst.shape[0] - offset)
+        for c in range(dst.shape[1]):
+            out = dst[offset:offset + frames, c]
+            for i in range(frames):
+                out[i] += src[i]
+
+    @njit(cache=True, nogil=True)
+    def saturate_to_int16(src: np.ndarray) -> np.ndarray:
+        """
+        Clamp a mix to the int16 range and convert in one pass
+
+        Args:
+            src: C-contiguous float32 (or int32) samples at 16-bit scale
+                shaped (frames, channels)
+
+        Returns:
+            int16 samples with the same shape
+        """
+        samples = src.reshape(-1)
+        out = np.empty(samples.shape, dtype=np.int16)
+        for i in range(samples.shape[0]):
+            out[i] = min(max(samples[i], -32768), 32767)
+        return out.reshape(src.shape)
+else:
+    mix_into = None
+    mix_mono_into = None
+    saturate_to_int16 = None
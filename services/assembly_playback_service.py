@@ -4,10 +4,17 @@ Triggers individual marker audio clips as playhead crosses marker positions
 """
 
 import pygame
-import os
+import numpy as np
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List, Set
+from services.asset_index import build_asset_index, resolve_asset_path
+
+
+# Mixer channel pool: starts small and doubles when overlapping markers use it up
+INITIAL_MIXER_CHANNELS = 16
+MAX_MIXER_CHANNELS = 256
 
 
 class AssemblyPlaybackService:
@@ -41,6 +48,22 @@ class AssemblyPlaybackService:
         self.last_playhead_position_ms = 0  # Last known playhead position
         self.triggered_markers: Set[int] = set()  # Marker indices that have been triggered
 
+        # Marker times sorted ascending, plus the marker index for each (built in set_markers)
+        self._sorted_times = np.empty(0, dtype=np.int64)
+        self._sort_idx = np.empty(0, dtype=np.intp)
+
+        # Position in _sorted_times of the next marker ahead of the playhead
+        self._cursor = 0
+
+        # Audio path per marker index, resolved once in set_markers
+        self._resolved_paths: dict = {}
+
+        # Marker names by index, so the tick path never touches marker dicts/objects
+        self._names: List[str] = []
+
+        # generated_audio/ listing: (type, file) and top-level file -> path
+        self._asset_index: dict = {}
+
         # Audio cache: marker_index -> pygame.Sound
         self.marker_sounds: dict = {}
 
@@ -51,7 +74,7 @@ class AssemblyPlaybackService:
         if not pygame.mixer.get_init():
             # Use more channels for simultaneous marker playback
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-            pygame.mixer.set_num_channels(16)  # Support up to 16 simultaneous sounds
+            pygame.mixer.set_num_channels(INITIAL_MIXER_CHANNELS)  # Grown on demand in _trigger_marker
 
     def set_markers(self, markers: List):
         """
@@ -64,27 +87,63 @@ class AssemblyPlaybackService:
         self.marker_sounds.clear()  # Clear cached sounds
         self.triggered_markers.clear()  # Clear trigger history
 
+        # Normalize dict/object markers once into parallel per-index fields;
+        # audio paths are resolved up front so playback ticks never stat the disk
+        times = []
+        self._names = []
+        self._resolved_paths = {}
+        self._asset_index = build_asset_index()
+        for i, marker in enumerate(markers):
+            if isinstance(marker, dict):
+                times.append(marker.get('time_ms', 0))
+                self._names.append(marker.get('name', f'Marker {i}'))
+            else:
+                times.append(marker.time_ms)
+                self._names.append(marker.name)
+
+            audio_path = self._get_marker_audio_path(marker)
+            if audio_path:
+                self._resolved_paths[i] = audio_path
+
+        # Sorted marker times so update_playhead can binary-search crossings
+        marker_times = np.array(times, dtype=np.int64)
+        self._sort_idx = np.argsort(marker_times, kind="stable")
+        self._sorted_times = marker_times[self._sort_idx]
+        self._cursor = 0
+
         if self.debug_logging:
             print(f"🎵 [TRIGGER] Loaded {len(markers)} markers for triggering")
 
     def preload_marker_sounds(self):
         """
         Preload all marker audio files into memory for instant playback
+
+        Files are decoded in parallel; markers sharing a file share one Sound.
         """
-        loaded_count = 0
-        for i, marker in enumerate(self.markers):
-            # Get marker audio file path
-            audio_path = self._get_marker_audio_path(marker)
-            if not audio_path or not os.path.exists(audio_path):
-                continue
+        # Group marker indices by file so each file is decoded once
+        indices_by_path = {}
+        for i, audio_path in self._resolved_paths.items():
+            indices_by_path.setdefault(audio_path, []).append(i)
 
-            try:
+        loaded_count = 0
+        if indices_by_path:
+            with ThreadPoolExecutor(max_workers=min(8, len(indices_by_path))) as executor:
                 # Load as pygame.Sound (not music - allows simultaneous playback)
-                sound = pygame.mixer.Sound(audio_path)
-                self.marker_sounds[i] = sound
-                loaded_count += 1
-            except Exception as e:
-                print(f"⚠️  Could not preload marker {i}: {e}")
+                futures = {
+                    executor.submit(pygame.mixer.Sound, audio_path): audio_path
+                    for audio_path in indices_by_path
+                }
+                for future in as_completed(futures):
+                    indices = indices_by_path[futures[future]]
+                    try:
+                        sound = future.result()
+                    except Exception as e:
+                        for i in indices:
+                            print(f"⚠️  Could not preload marker {i}: {e}")
+                        continue
+                    for i in indices:
+                        self.marker_sounds[i] = sound
+                    loaded_count += len(indices)
 
         if self.debug_logging:
             print(f"✓ Preloaded {loaded_count}/{len(self.markers)} marker sounds")
@@ -117,18 +176,9 @@ class AssemblyPlaybackService:
         if not asset_file:
             return None
 
-        # Try multiple possible paths
-        possible_paths = [
-            os.path.join("generated_audio", marker_type, asset_file),
-            os.path.join("generated_audio", asset_file),
-            asset_file
-        ]
-
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-
-        return None
+        # Look up generated_audio/<type>/<file>, then generated_audio/<file>
+        # (probing the disk if the listing came back empty)
+        return resolve_asset_path(self._asset_index or None, marker_type, asset_file)
 
     def start_playback(self):
         """
@@ -137,6 +187,7 @@ class AssemblyPlaybackService:
         self.is_playing = True
         self.last_playhead_position_ms = self.video_player.current_time_ms
         self.triggered_markers.clear()  # Reset trigger history
+        self._cursor = int(np.searchsorted(self._sorted_times, self.last_playhead_position_ms, side='right'))
 
         if self.debug_logging:
             print(f"▶ [TRIGGER] Playback started at {self.last_playhead_position_ms}ms")
@@ -161,40 +212,38 @@ class AssemblyPlaybackService:
         if not self.is_playing:
             return
 
-        # Detect direction of playback
-        is_forward = current_time_ms >= self.last_playhead_position_ms
-
-        # Check each marker to see if playhead crossed it
-        for i, marker in enumerate(self.markers):
-            marker_time_ms = marker.get('time_ms', 0) if isinstance(marker, dict) else marker.time_ms
-
-            # Check if we crossed this marker
-            if is_forward:
-                # Forward playback: crossed if we went from before to at-or-after
-                crossed = (self.last_playhead_position_ms < marker_time_ms <= current_time_ms)
-            else:
-                # Backward (scrubbing back): crossed if we went from after to before
-                crossed = (current_time_ms < marker_time_ms <= self.last_playhead_position_ms)
-
-            if crossed:
-                self._trigger_marker(i, marker)
+        if current_time_ms >= self.last_playhead_position_ms:
+            # Forward playback: the cursor already points past last position, so
+            # a tick with no crossing costs a single comparison
+            start = self._cursor
+            if start < len(self._sorted_times) and self._sorted_times[start] <= current_time_ms:
+                end = int(np.searchsorted(self._sorted_times, current_time_ms, side='right'))
+                self._cursor = end
+                for i in self._sort_idx[start:end].tolist():
+                    self._trigger_marker(i)
+        else:
+            # Scrubbing back: crossed markers lie in (current, last]
+            start = np.searchsorted(self._sorted_times, current_time_ms, side='right')
+            end = np.searchsorted(self._sorted_times, self.last_playhead_position_ms, side='right')
+            for i in self._sort_idx[start:end].tolist():
+                self._trigger_marker(i)
+            self._cursor = int(start)
 
         # Update last position
         self.last_playhead_position_ms = current_time_ms
 
-    def _trigger_marker(self, marker_index: int, marker):
+    def _trigger_marker(self, marker_index: int):
         """
         Trigger (play) a marker's audio
 
         Args:
             marker_index: Index of marker in markers list
-            marker: Marker object or dict
         """
         # Check if sound is preloaded
         if marker_index not in self.marker_sounds:
             # Try to load on-the-fly
-            audio_path = self._get_marker_audio_path(marker)
-            if audio_path and os.path.exists(audio_path):
+            audio_path = self._resolved_paths.get(marker_index)
+            if audio_path:
                 try:
                     self.marker_sounds[marker_index] = pygame.mixer.Sound(audio_path)
                 except Exception as e:
@@ -207,16 +256,29 @@ class AssemblyPlaybackService:
         # Play the sound
         try:
             sound = self.marker_sounds[marker_index]
+            self._ensure_free_channel()
             sound.play()
 
             if self.debug_logging:
-                marker_name = marker.get('name', f'Marker {marker_index}') if isinstance(marker, dict) else marker.name
-                print(f"🔊 [TRIGGER] Played: {marker_name}")
+                print(f"🔊 [TRIGGER] Played: {self._names[marker_index]}")
 
         except Exception as e:
             if self.debug_logging:
                 print(f"⚠️  Error playing marker {marker_index}: {e}")
 
+    def _ensure_free_channel(self):
+        """Double the mixer channel count when every channel is busy"""
+        if pygame.mixer.find_channel() is not None:
+            return
+
+        num_channels = pygame.mixer.get_num_channels()
+        if num_channels >= MAX_MIXER_CHANNELS:
+            return
+
+        pygame.mixer.set_num_channels(min(num_channels * 2, MAX_MIXER_CHANNELS))
+        if self.debug_logging:
+            print(f"🎚️  [TRIGGER] Mixer channels: {num_channels} → {pygame.mixer.get_num_channels()}")
+
     def set_debug_logging(self, enabled: bool):
         """
         Enable or disable debug logging
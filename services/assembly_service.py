@@ -3,13 +3,392 @@ Assembly Service - Multi-track Audio Assembly
 Handles track assignment, per-channel audio generation, and preview mixing
 """
 
+import json
+import math
+import mmap
 import os
+import re
+import shutil
+import struct
+import threading
 import numpy as np
+import soundfile as sf
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Any, Callable, List, Dict, NamedTuple, Tuple, Optional, Union
 from pydub import AudioSegment
 from scipy.io import wavfile
+from scipy.signal import resample_poly
 from core.models import Marker, MarkerType
+from services import _mix_kernels
+from services.asset_index import build_asset_index, resolve_asset_path
+from services.audio_cache import load_pcm
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Sample rate for tracks with no clips to take a rate from
+DEFAULT_FRAME_RATE = 44100
+
+# Exported asset filenames: MUS_00001_..., SFX_00002_..., VOX_00003_...
+_ASSET_ID_RE = re.compile(r'(MUS|SFX|VOX)_(\d+)_')
+_ASSET_ID_TYPES = {'MUS': 'music', 'SFX': 'sfx', 'VOX': 'voice'}
+
+# Characters stripped from generated track descriptions
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\-_]')
+
+# Track audio accepted by save_multichannel_wav: an AudioSegment or
+# (int16 samples shaped (frames, channels), frame_rate)
+TrackAudio = Union[AudioSegment, Tuple[np.ndarray, int]]
+
+# Clip decodes kept in flight per track while its markers are resolved
+DECODE_WORKERS = 2
+
+
+class _MarkerView(NamedTuple):
+    """Marker fields read while assigning and mixing tracks"""
+    time_ms: int
+    type: str
+    name: str
+    asset_file: str  # Current version's file ('' if none)
+    source: Any  # The original dict or Marker, for writing assignments back
+
+
+def _coerce_markers(markers: list) -> List[_MarkerView]:
+    """
+    Read dict and Marker objects into uniform views, once per call
+
+    Args:
+        markers: Markers as dicts or Marker objects
+
+    Returns:
+        One _MarkerView per marker, in the same order
+    """
+    views = []
+    for marker in markers:
+        if isinstance(marker, dict):
+            # Dict marker - get current version's asset_file
+            versions = marker.get('versions', [])
+            current_version = marker.get('current_version', 1)
+            current_version_data = next((v for v in versions if v.get('version') == current_version), None)
+            views.append(_MarkerView(
+                marker.get('time_ms', 0),
+                marker.get('type', 'unknown'),
+                marker.get('name', '(unnamed)'),
+                current_version_data.get('asset_file', '') if current_version_data else '',
+                marker
+            ))
+        else:
+            views.append(_MarkerView(marker.time_ms, marker.type, marker.name, marker.asset_file, marker))
+    return views
+
+
+def _kernel_copies() -> list:
+    """
+    Kernel-side copy calls available on this platform, preferred first
+
+    Each takes (in_fd, out_fd, count), copies from the current position of
+    in_fd and returns the number of bytes copied.
+    """
+    copies = []
+    if hasattr(os, 'copy_file_range'):
+        copies.append(os.copy_file_range)
+    if hasattr(os, 'sendfile'):
+        copies.append(lambda in_fd, out_fd, count: os.sendfile(out_fd, in_fd, None, count))
+    return copies
+
+
+_KERNEL_COPIES = _kernel_copies()
+
+
+def _fast_copy(src: Union[str, Path], dst: Union[str, Path]):
+    """
+    Copy a file's contents and metadata, like shutil.copy2
+
+    Uses os.copy_file_range, which stays in the kernel and can clone
+    blocks on reflink filesystems (btrfs, XFS). Where that is refused,
+    os.sendfile still copies without a userspace buffer; shutil is the
+    last resort when neither works.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    copied = False
+    if _KERNEL_COPIES:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            remaining = os.fstat(in_fd).st_size
+            for copy_chunk in _KERNEL_COPIES:
+                try:
+                    # Both calls advance in_fd/out_fd, so a fallback resumes
+                    # where the previous one stopped
+                    while remaining > 0:
+                        sent = copy_chunk(in_fd, out_fd, remaining)
+                        if sent == 0:
+                            break
+                        remaining -= sent
+                except OSError:
+                    # e.g. EXDEV across filesystems, EINVAL on some file systems
+                    continue
+                copied = remaining == 0
+                break
+
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _encode_json(obj) -> bytes:
+    """
+    Encode obj as JSON indented by 2
+
+    orjson (optional) encodes in C; the stdlib encoder is used without it,
+    or for values orjson can't encode.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            pass
+
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _dump_json(path: Union[str, Path], obj):
+    """
+    Write obj to a file as JSON indented by 2
+
+    Args:
+        path: Output file path
+        obj: JSON-serializable object
+    """
+    data = _encode_json(obj)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _dump_json_streaming(path: Union[str, Path], obj: dict, list_key: str, items):
+    """
+    Write obj plus a trailing list field to a file as JSON indented by 2
+
+    The list is encoded and written one item at a time instead of being
+    built up front, so a large marker list is never held in memory as a
+    whole. The output matches _dump_json(path, {**obj, list_key: list(items)}).
+
+    Args:
+        path: Output file path
+        obj: JSON-serializable dict of the fields before the list
+        list_key: Name of the list field, written last
+        items: Iterable of JSON-serializable list items
+    """
+    head = _encode_json(obj)
+    with open(path, 'wb') as f:
+        # Reopen the encoded object: drop its closing brace and append the list
+        head = head[:head.rindex(b'}')].rstrip()
+        f.write(head)
+        if len(obj):
+            f.write(b',')
+        f.write(b'\n  ' + _encode_json(list_key) + b': [')
+
+        first = True
+        for item in items:
+            if not first:
+                f.write(b',')
+            # List items sit two levels deep
+            f.write(b'\n    ' + _encode_json(item).replace(b'\n', b'\n    '))
+            first = False
+
+        f.write(b']\n}' if first else b'\n  ]\n}')
+
+
+def _fast_duration_ms(path: Union[str, Path]) -> int:
+    """
+    Get an audio file's duration in milliseconds
+
+    Read from the file header with libsndfile (WAV, FLAC, OGG, MP3), so no
+    ffprobe process is started; other formats fall back to pydub's mediainfo.
+
+    Args:
+        path: Audio file path
+
+    Returns:
+        Duration in whole milliseconds (0 if it can't be determined)
+    """
+    try:
+        info = sf.info(str(path))
+        return int(info.frames * 1000 / info.samplerate)
+    except (RuntimeError, sf.LibsndfileError):
+        pass
+
+    try:
+        from pydub.utils import mediainfo
+        info = mediainfo(str(path))
+        return int(float(info.get('duration', 0)) * 1000)
+    except:
+        return 0
+
+
+def _memoized_decoder(executor: ThreadPoolExecutor) -> Callable[[str], Future]:
+    """
+    Build a thread-safe decode submitter for a pool
+
+    Args:
+        executor: Pool to run load_pcm on
+
+    Returns:
+        decode(path) -> Future of load_pcm(path); each distinct path is
+        submitted once and later calls share its future
+    """
+    futures: Dict[str, Future] = {}
+    lock = threading.Lock()
+
+    def decode(path: str) -> Future:
+        with lock:
+            future = futures.get(path)
+            if future is None:
+                future = futures[path] = executor.submit(load_pcm, path)
+            return future
+
+    return decode
+
+# Mix accumulator type. Clips are summed at 16-bit scale, so float32 adds stay
+# exact (integers up to 2**24) and vectorize better than int32; the result
+# is clamped to int16 once at the end.
+MIX_DTYPE = np.float32
+
+# Frames mixed per block when streaming tracks and the preview to disk
+ASSEMBLY_BLOCK_FRAMES = 1 << 16
+
+# Canonical 44-byte RIFF/WAVE header for 16-bit PCM
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+# Threads copying marker audio and writing its metadata during export
+EXPORT_WORKERS = 8
+
+# Threads writing the streamed track WAVs during assembly (1 writes them in
+# turn, which can be faster on spinning disks)
+TRACK_WRITE_WORKERS = 4
+
+# Waveform resolution computed while assembling (matches the track display)
+WAVEFORM_SAMPLES = 1000
+
+
+def _downmix(samples: np.ndarray) -> np.ndarray:
+    """
+    Average 16-bit PCM channels into a single waveform channel
+
+    Stereo uses an integer half-sum, (L + R) >> 1, so no float temporaries
+    are needed for what is only ever drawn.
+
+    Args:
+        samples: int16 samples shaped (frames, channels)
+
+    Returns:
+        1-D int16 samples
+    """
+    channels = samples.shape[1]
+    if channels == 1:
+        return samples[:, 0]
+    if channels == 2:
+        return ((samples[:, 0].astype(np.int32) + samples[:, 1]) >> 1).astype(np.int16)
+    return (samples.sum(axis=1, dtype=np.int32) // channels).astype(np.int16)
+
+
+def _peak_abs(samples: np.ndarray) -> int:
+    """Largest absolute sample value (int16-safe: no np.abs overflow at -32768)"""
+    if not len(samples):
+        return 0
+    return max(int(samples.max()), -int(samples.min()))
+
+
+def _normalize(samples: np.ndarray, peak: int) -> np.ndarray:
+    """Scale int16 samples to float32 in -1.0..1.0 by their peak"""
+    samples = samples.astype(np.float32)
+    if peak > 0:
+        samples /= np.float32(peak)
+    return samples
+
+
+def _bucket_edges(total: int, num_buckets: int) -> np.ndarray:
+    """
+    Split total samples into num_buckets near-equal buckets
+
+    Returns:
+        num_buckets + 1 int64 boundaries from 0 to total (exact integer
+        arithmetic, so no sample is dropped or double counted)
+    """
+    return np.arange(num_buckets + 1, dtype=np.int64) * total // num_buckets
+
+
+class _PeakEnvelope:
+    """
+    Track waveform built block by block while a track is streamed to disk
+
+    Produces the same output as normalizing the whole channel-averaged track
+    and passing it to AssemblyService._downsample_waveform.
+    """
+
+    def __init__(self, total_frames: int, num_samples: int):
+        self.num_samples = num_samples
+        # Bucket boundaries (see _bucket_edges); None when the track is short enough to keep whole
+        self.edges = _bucket_edges(total_frames, num_samples) if total_frames > num_samples else None
+        self.mins = np.full(num_samples, np.iinfo(np.int16).max, dtype=np.int16)
+        self.maxs = np.full(num_samples, np.iinfo(np.int16).min, dtype=np.int16)
+        self.peak = 0
+        self.position = 0
+        self.short_samples = []  # Whole track, kept only when it has <= num_samples frames
+
+    def add(self, block: np.ndarray):
+        """
+        Fold the next block of the track into the envelope
+
+        Args:
+            block: int16 samples shaped (frames, channels)
+        """
+        mono = _downmix(block)
+
+        start = self.position
+        self.position += len(mono)
+        self.peak = max(self.peak, _peak_abs(mono))
+
+        if self.edges is None:
+            self.short_samples.append(mono)
+            return
+        if not len(mono):
+            return
+
+        # Split the block where buckets begin; its first bucket may continue the previous block's
+        first_inner = np.searchsorted(self.edges, start, side='right')
+        last_inner = np.searchsorted(self.edges, self.position, side='left')
+        splits = np.concatenate(([0], self.edges[first_inner:last_inner] - start))
+        buckets = slice(first_inner - 1, first_inner - 1 + len(splits))
+        np.minimum(self.mins[buckets], np.minimum.reduceat(mono, splits), out=self.mins[buckets])
+        np.maximum(self.maxs[buckets], np.maximum.reduceat(mono, splits), out=self.maxs[buckets])
+
+    def result(self) -> np.ndarray:
+        """Normalized waveform in _downsample_waveform's format"""
+        if self.edges is None:
+            samples = np.concatenate(self.short_samples) if self.short_samples else np.empty(0, np.int16)
+            return _normalize(samples, self.peak)
+
+        envelope = np.empty(2 * self.num_samples, dtype=np.int16)
+        envelope[0::2] = self.mins
+        envelope[1::2] = self.maxs
+        return _normalize(envelope, self.peak)
 
 
 class AssemblyService:
@@ -29,6 +408,14 @@ class AssemblyService:
     TRACK_SFX_2 = "sfx_2"
     TRACK_VOICE = "voice"
 
+    # Output channels (1-based) each track is written to
+    TRACK_CHANNELS = {
+        TRACK_MUSIC_LR: (1, 2),
+        TRACK_SFX_1: (3,),
+        TRACK_SFX_2: (4,),
+        TRACK_VOICE: (5,),
+    }
+
     def __init__(self, temp_dir: str = "temp"):
         """
         Initialize assembly service
@@ -42,6 +429,16 @@ class AssemblyService:
         # Track assignment results
         self.track_assignments: Dict[str, List[Marker]] = {}
 
+        # Key of the markers behind track_assignments: (id, type, time_ms) per marker
+        self._assignment_key: Optional[tuple] = None
+
+        # Debug
+        self.debug_logging = False
+
+        # Waveforms computed during the last assembly or by get_track_waveforms:
+        # (file_path, mtime_ns, num_samples) -> waveform data
+        self._waveform_cache: Dict[Tuple[str, int, int], Dict[str, np.ndarray]] = {}
+
     def assign_markers_to_tracks(self, markers: List[Marker]) -> Dict[str, List[Marker]]:
         """
         Assign markers to tracks based on type
@@ -57,65 +454,66 @@ class AssemblyService:
         Returns:
             Dict mapping track_id to list of markers
         """
-        # Helper to get marker type (works with both dict and Marker objects)
-        def get_type(m):
-            return m.get('type') if isinstance(m, dict) else m.type
-
-        def get_time_ms(m):
-            return m.get('time_ms', 0) if isinstance(m, dict) else m.time_ms
-
-        # Collect markers by type
-        music_markers = [m for m in markers if get_type(m) == MarkerType.MUSIC.value]
-        sfx_markers = [m for m in markers if get_type(m) == MarkerType.SFX.value]
-        voice_markers = [m for m in markers if get_type(m) == MarkerType.VOICE.value]
-
-        # Sort SFX by time for even distribution
-        sfx_markers_sorted = sorted(sfx_markers, key=get_time_ms)
+        # Assignment depends only on each marker's type and time; the same marker
+        # objects in the same state (e.g. export_tracks then export_with_metadata)
+        # get the previous result back instead of being sorted and tagged again
+        views = _coerce_markers(markers)
+        assignment_key = tuple((id(view.source), view.type, view.time_ms) for view in views)
+        if assignment_key == self._assignment_key:
+            return self.track_assignments
+
+        # Collect markers by type in a single pass (works with both dict and Marker objects).
+        # Music and voice markers get their track on the way in; SFX tracks depend
+        # on time order, so they are assigned after sorting.
+        music_markers, sfx_markers, voice_markers = [], [], []
+        sfx_times = []
+        buckets = {
+            MarkerType.MUSIC.value: (music_markers, self.TRACK_MUSIC_LR),
+            MarkerType.SFX.value: (sfx_markers, None),
+            MarkerType.VOICE.value: (voice_markers, self.TRACK_VOICE),
+        }
+        for view in views:
+            bucket, track_id = buckets.get(view.type, (None, None))
+            if bucket is None:
+                continue
+            bucket.append(view.source)
+            if track_id is None:
+                sfx_times.append(view.time_ms)
+            else:
+                self._set_assigned_track(view.source, track_id)
+
+        # Sort SFX by time for even distribution (stable, like sorting the markers directly),
+        # then alternate: even indices (0, 2, 4, ...) -> SFX 1, odd -> SFX 2
+        order = sorted(range(len(sfx_markers)), key=sfx_times.__getitem__)
+        sfx_tracks = ([], [])
+        sfx_track_ids = (self.TRACK_SFX_1, self.TRACK_SFX_2)
+        for position, i in enumerate(order):
+            marker = sfx_markers[i]
+            sfx_tracks[position & 1].append(marker)
+            self._set_assigned_track(marker, sfx_track_ids[position & 1])
 
         # Assign to tracks
         track_assignments = {
             self.TRACK_MUSIC_LR: music_markers,
-            self.TRACK_SFX_1: sfx_markers_sorted[::2],   # Even indices (0, 2, 4, ...)
-            self.TRACK_SFX_2: sfx_markers_sorted[1::2],  # Odd indices (1, 3, 5, ...)
+            self.TRACK_SFX_1: sfx_tracks[0],
+            self.TRACK_SFX_2: sfx_tracks[1],
             self.TRACK_VOICE: voice_markers
         }
 
-        # Update marker track assignments (works with both dict and Marker objects)
-        for marker in music_markers:
-            if isinstance(marker, dict):
-                marker['assigned_track'] = self.TRACK_MUSIC_LR
-                marker['assigned_channels'] = [1, 2]
-            else:
-                marker.assigned_track = self.TRACK_MUSIC_LR
-                marker.assigned_channels = [1, 2]
-
-        for marker in track_assignments[self.TRACK_SFX_1]:
-            if isinstance(marker, dict):
-                marker['assigned_track'] = self.TRACK_SFX_1
-                marker['assigned_channels'] = [3]
-            else:
-                marker.assigned_track = self.TRACK_SFX_1
-                marker.assigned_channels = [3]
-
-        for marker in track_assignments[self.TRACK_SFX_2]:
-            if isinstance(marker, dict):
-                marker['assigned_track'] = self.TRACK_SFX_2
-                marker['assigned_channels'] = [4]
-            else:
-                marker.assigned_track = self.TRACK_SFX_2
-                marker.assigned_channels = [4]
-
-        for marker in voice_markers:
-            if isinstance(marker, dict):
-                marker['assigned_track'] = self.TRACK_VOICE
-                marker['assigned_channels'] = [5]
-            else:
-                marker.assigned_track = self.TRACK_VOICE
-                marker.assigned_channels = [5]
-
         self.track_assignments = track_assignments
+        self._assignment_key = assignment_key
         return track_assignments
 
+    def _set_assigned_track(self, marker, track_id: str):
+        """Record a marker's track and channels (works with both dict and Marker objects)"""
+        channels = list(self.TRACK_CHANNELS[track_id])
+        if isinstance(marker, dict):
+            marker['assigned_track'] = track_id
+            marker['assigned_channels'] = channels
+        else:
+            marker.assigned_track = track_id
+            marker.assigned_channels = channels
+
     def generate_track_audio(
         self,
         track_id: str,
@@ -124,7 +522,10 @@ class AssemblyService:
         is_stereo: bool = False
     ) -> Optional[AudioSegment]:
         """
-        Generate audio for a single track by overlaying marker audio
+        Generate audio for a single track from its marker clips
+
+        Clips are decoded once and summed into a single numpy mix buffer
+        (see _render_track_pcm); pydub is only used to wrap the result.
 
         Args:
             track_id: Track identifier
@@ -133,80 +534,300 @@ class AssemblyService:
             is_stereo: True for stereo track, False for mono
 
         Returns:
-            AudioSegment for this track, or None if no markers
+            AudioSegment for this track (silent if no markers)
         """
-        if not markers:
-            # Return silent track if no markers
-            channels = 2 if is_stereo else 1
-            return AudioSegment.silent(duration=duration_ms).set_channels(channels)
+        samples, frame_rate = self._render_track_pcm(track_id, markers, duration_ms, is_stereo)
+        return AudioSegment(
+            samples.tobytes(),
+            sample_width=2,
+            frame_rate=frame_rate,
+            channels=samples.shape[1]
+        )
 
-        # Create silent base track
-        channels = 2 if is_stereo else 1
-        track_audio = AudioSegment.silent(duration=duration_ms).set_channels(channels)
+    def _render_track_pcm(
+        self,
+        track_id: str,
+        markers: List[Marker],
+        duration_ms: int,
+        is_stereo: bool = False,
+        decode: Optional[Callable[[str], Future]] = None,
+        asset_index: Optional[dict] = None
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Mix a track's marker clips into a 16-bit PCM buffer
 
-        # Overlay each marker's audio at its timestamp
-        for marker in markers:
-            # Get current version data (handles both dict and Marker objects)
-            if isinstance(marker, dict):
-                # Dict marker - get current version's asset_file
-                versions = marker.get('versions', [])
-                current_version = marker.get('current_version', 1)
-                current_version_data = next((v for v in versions if v.get('version') == current_version), None)
+        Args:
+            track_id: Track identifier
+            markers: Markers assigned to this track
+            duration_ms: Total duration in milliseconds
+            is_stereo: True for stereo track, False for mono
+            decode: Shared decode submitter (see _plan_track)
+            asset_index: Shared generated_audio listing (see _plan_track)
 
-                if not current_version_data:
-                    continue
+        Returns:
+            Tuple of (samples, frame_rate); samples is int16 shaped (frames, channels)
+        """
+        clips, frame_rate, channels = self._plan_track(markers, is_stereo, decode, asset_index)
+        total_frames = int(duration_ms * frame_rate / 1000)
+        return self._render_clips(clips, total_frames, channels), frame_rate
 
-                asset_file = current_version_data.get('asset_file', '')
-                marker_name = marker.get('name', '(unnamed)')
-                marker_type = marker.get('type', 'unknown')
-                time_ms = marker.get('time_ms', 0)
-            else:
-                # Marker object
-                asset_file = marker.asset_file
-                marker_name = marker.name
-                marker_type = marker.type
-                time_ms = marker.time_ms
+    def _render_tracks_pcm(
+        self,
+        track_assignments: Dict[str, List[Marker]],
+        duration_ms: int
+    ) -> Dict[str, Tuple[np.ndarray, int]]:
+        """
+        Render all four tracks concurrently with _render_track_pcm
 
-            # Check if audio file exists - try multiple paths
-            if not asset_file:
-                continue
+        The tracks share one decode pool and generated_audio listing, so a
+        file used on several tracks is decoded once.
 
-            possible_paths = [
-                os.path.join("generated_audio", marker_type, asset_file),
-                os.path.join("generated_audio", asset_file),
-                asset_file
-            ]
+        Args:
+            track_assignments: Result of assign_markers_to_tracks
+            duration_ms: Total duration in milliseconds
+
+        Returns:
+            Dict mapping track_id to (samples, frame_rate)
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or DECODE_WORKERS) as decode_pool:
+            decode = _memoized_decoder(decode_pool)
+            asset_index = build_asset_index()
+            with ThreadPoolExecutor(max_workers=len(self.TRACK_CHANNELS)) as executor:
+                futures = {
+                    track_id: executor.submit(
+                        self._render_track_pcm, track_id, track_assignments[track_id], duration_ms,
+                        track_id == self.TRACK_MUSIC_LR, decode, asset_index
+                    )
+                    for track_id in self.TRACK_CHANNELS
+                }
+            return {track_id: future.result() for track_id, future in futures.items()}
+
+    def _plan_track(
+        self,
+        markers: List[Marker],
+        is_stereo: bool = False,
+        decode: Optional[Callable[[str], Future]] = None,
+        asset_index: Optional[dict] = None
+    ) -> Tuple[list, int, int]:
+        """
+        Resolve, decode and prepare a track's clips without mixing them
+
+        Args:
+            markers: Markers assigned to this track
+            is_stereo: True for stereo track, False for mono
+            decode: Shared decode submitter from _memoized_decoder (a private
+                pool is used if not given)
+            asset_index: Listing from build_asset_index (built if not given)
 
-            audio_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    audio_path = path
-                    break
+        Returns:
+            Tuple of (clips, frame_rate, channels); clips is a list of
+            (start_frame, int16 samples) sorted by start frame
+        """
+        channels = 2 if is_stereo else 1
+
+        if not markers:
+            # Silent track if no markers
+            return [], DEFAULT_FRAME_RATE, channels
+
+        if asset_index is None:
+            asset_index = build_asset_index()
+
+        if decode is None:
+            with ThreadPoolExecutor(max_workers=DECODE_WORKERS) as executor:
+                return self._plan_track(markers, is_stereo, _memoized_decoder(executor), asset_index)
+
+        # Resolve each marker's clip; distinct files are handed to decode workers
+        # as soon as they're found, so decoding overlaps with resolving the rest
+        pending: Dict[str, Tuple[Future, str]] = {}  # audio_path -> (decode future, marker name)
+        placements = []  # (time_ms, audio_path)
+        missing = set()  # (type, file) already reported as not found
+        for time_ms, marker_type, marker_name, asset_file, _ in _coerce_markers(markers):
+            # Skip markers without generated audio
+            if not asset_file or (marker_type, asset_file) in missing:
+                continue
+
+            audio_path = resolve_asset_path(asset_index, marker_type, asset_file)
 
             if not audio_path:
+                # Reported once per file, not for every marker that uses it
                 print(f"Warning: Audio file not found for marker {marker_name}: {asset_file}")
+                missing.add((marker_type, asset_file))
                 continue
 
-            try:
-                # Load audio clip
-                audio_clip = AudioSegment.from_file(audio_path)
+            if audio_path not in pending:
+                # Load audio clip (int16 PCM, cached across calls)
+                pending[audio_path] = (decode(audio_path), marker_name)
 
-                # Convert to appropriate channel count
-                if is_stereo and audio_clip.channels == 1:
-                    # Convert mono to stereo for music track
-                    audio_clip = audio_clip.set_channels(2)
-                elif not is_stereo and audio_clip.channels == 2:
-                    # Convert stereo to mono for SFX/Voice tracks
-                    audio_clip = audio_clip.set_channels(1)
-
-                # Overlay at marker position
-                track_audio = track_audio.overlay(audio_clip, position=time_ms)
+            placements.append((time_ms, audio_path))
 
+        decoded: Dict[str, Tuple[np.ndarray, int]] = {}
+        for audio_path, (future, marker_name) in pending.items():
+            try:
+                decoded[audio_path] = future.result()
             except Exception as e:
                 print(f"Error loading audio for marker {marker_name}: {e}")
+
+        placements = [(time_ms, audio_path) for time_ms, audio_path in placements if audio_path in decoded]
+        if not placements:
+            return [], DEFAULT_FRAME_RATE, channels
+
+        # Mix at the highest clip sample rate (as pydub's overlay would)
+        frame_rate = max(rate for _, rate in decoded.values())
+        samples = {
+            path: self._prepare_clip(clip, rate, frame_rate, channels)
+            for path, (clip, rate) in decoded.items()
+        }
+
+        # Sorted by start frame so blocks can sweep the clips in order
+        clips = sorted(
+            ((int(time_ms * frame_rate / 1000), samples[audio_path]) for time_ms, audio_path in placements),
+            key=lambda placement: placement[0]
+        )
+        return clips, frame_rate, channels
+
+    def _stream_track(self, clips: list, total_frames: int, channels: int):
+        """
+        Yield a track's mix as consecutive int16 blocks of ASSEMBLY_BLOCK_FRAMES
+
+        Only clips overlapping the current block are touched, so memory use
+        is bounded by the block size rather than the track duration.
+
+        Args:
+            clips: (start_frame, samples) list sorted by start frame
+            total_frames: Track length in frames
+            channels: Track channel count
+        """
+        mix = np.empty((min(ASSEMBLY_BLOCK_FRAMES, total_frames), channels), dtype=MIX_DTYPE)
+        active = []
+        next_clip = 0
+
+        for start in range(0, total_frames, ASSEMBLY_BLOCK_FRAMES):
+            end = min(start + ASSEMBLY_BLOCK_FRAMES, total_frames)
+
+            # Clips that have started by the end of this block and not yet finished
+            while next_clip < len(clips) and clips[next_clip][0] < end:
+                active.append(clips[next_clip])
+                next_clip += 1
+            active = [clip for clip in active if clip[0] + len(clip[1]) > start]
+
+            block = mix[:end - start]
+            block.fill(0)
+            self._mix_block(active, start, block)
+            yield self._saturate(block)
+
+    def _render_clips(self, clips: list, total_frames: int, channels: int) -> np.ndarray:
+        """
+        Mix a whole track into one int16 array, block by block
+
+        Only the int16 result is full length; the float32 accumulator is a
+        single ASSEMBLY_BLOCK_FRAMES block reused by _stream_track.
+
+        Args:
+            clips: (start_frame, samples) list sorted by start frame
+            total_frames: Track length in frames
+            channels: Track channel count
+
+        Returns:
+            int16 samples shaped (total_frames, channels)
+        """
+        samples = np.empty((total_frames, channels), dtype=np.int16)
+        blocks = self._stream_track(clips, total_frames, channels)
+        for start, block in zip(range(0, total_frames, ASSEMBLY_BLOCK_FRAMES), blocks):
+            samples[start:start + len(block)] = block
+        return samples
+
+    @staticmethod
+    def _mix_block(clips: list, start: int, mix: np.ndarray):
+        """
+        Add the parts of clips that overlap a block into a float32 buffer
+
+        Args:
+            clips: (start_frame, int16 samples) pairs
+            start: Track frame that mix[0] corresponds to
+            mix: float32 accumulator shaped (frames, channels)
+        """
+        end = start + len(mix)
+        kernels = _mix_kernels.NUMBA_AVAILABLE and mix.flags.c_contiguous
+        for clip_start, clip in clips:
+            lo = max(clip_start, start)
+            if lo >= end or clip_start + len(clip) <= lo:
                 continue
+            part = clip[lo - clip_start:]
+            offset = lo - start
+            if kernels and part.strides[1] == 0:
+                # Mono clip broadcast onto a stereo track: add the one real channel
+                _mix_kernels.mix_mono_into(mix, part[:, 0], offset)
+            elif kernels and part.flags.c_contiguous:
+                # Fused add loop, no int16 -> float32 cast buffers
+                _mix_kernels.mix_into(mix, part, offset)
+            else:
+                frames = min(len(part), len(mix) - offset)
+                mix[offset:offset + frames] += part[:frames]
 
-        return track_audio
+    @staticmethod
+    def _saturate(mix: np.ndarray) -> np.ndarray:
+        """Clamp a float32 mix to int16 (mix is clobbered)"""
+        if _mix_kernels.NUMBA_AVAILABLE and mix.flags.c_contiguous:
+            return _mix_kernels.saturate_to_int16(mix)
+
+        np.clip(mix, -32768, 32767, out=mix)
+        return mix.astype(np.int16)
+
+    @staticmethod
+    def _prepare_clip(samples: np.ndarray, sample_rate: int, frame_rate: int, channels: int) -> np.ndarray:
+        """
+        Adapt decoded 16-bit PCM to the track's channel count and rate
+
+        Clips that already match are returned as-is (no copy). Mono clips on
+        a stereo track come back as a read-only broadcast view, so the
+        duplicated channel costs nothing and any resampling is done once.
+
+        Args:
+            samples: int16 samples shaped (frames, clip_channels)
+            sample_rate: Sample rate of the clip
+            frame_rate: Track sample rate (clip is resampled if different)
+            channels: Track channel count (mono -> stereo duplicates,
+                stereo -> mono averages L/R)
+
+        Returns:
+            int16 array of shape (frames, channels)
+        """
+        if samples.shape[1] > 1 and samples.shape[1] != channels:
+            # Downmix before resampling so only one channel is interpolated
+            samples = samples.mean(axis=1, keepdims=True, dtype=np.float32)
+
+        if sample_rate != frame_rate:
+            samples = AssemblyService._resample(samples, sample_rate, frame_rate)
+
+        if samples.dtype != np.int16:
+            samples = np.clip(np.round(samples), -32768, 32767).astype(np.int16)
+
+        if samples.shape[1] != channels:
+            samples = np.broadcast_to(samples, (len(samples), channels))
+        return samples
+
+    @staticmethod
+    def _resample(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+        """
+        Resample (frames, channels) audio by linear interpolation
+
+        Args:
+            samples: Audio samples shaped (frames, channels)
+            src_rate: Current sample rate
+            dst_rate: Target sample rate
+
+        Returns:
+            float32 samples at dst_rate
+        """
+        num_frames = int(round(len(samples) * dst_rate / src_rate))
+        if len(samples) == 0:
+            return np.zeros((num_frames, samples.shape[1]), dtype=np.float32)
+        positions = np.arange(num_frames) * (src_rate / dst_rate)
+        source_positions = np.arange(len(samples))
+        return np.stack(
+            [np.interp(positions, source_positions, samples[:, c]) for c in range(samples.shape[1])],
+            axis=1
+        ).astype(np.float32)
 
     def assemble_audio(
         self,
@@ -235,81 +856,168 @@ class AssemblyService:
         print("Assigning markers to tracks...")
         track_assignments = self.assign_markers_to_tracks(markers)
 
-        # Step 2: Generate per-track audio
+        # Step 2: Decode and place each track's clips (tracks are independent -
+        # prepare concurrently; decoding and numpy work release the GIL)
         print("Generating per-track audio...")
-        track_files = {}
-        track_audio_segments = {}
-
-        # Music track (stereo)
-        music_audio = self.generate_track_audio(
-            self.TRACK_MUSIC_LR,
-            track_assignments[self.TRACK_MUSIC_LR],
-            duration_ms,
-            is_stereo=True
-        )
-        if music_audio:
-            music_file = str(self.temp_dir / "channel_1_2_music_stereo.wav")
-            music_audio.export(music_file, format="wav")
-            track_files[self.TRACK_MUSIC_LR] = music_file
-            track_audio_segments[self.TRACK_MUSIC_LR] = music_audio
-
-        # SFX Track 1 (mono)
-        sfx1_audio = self.generate_track_audio(
-            self.TRACK_SFX_1,
-            track_assignments[self.TRACK_SFX_1],
-            duration_ms,
-            is_stereo=False
-        )
-        if sfx1_audio:
-            sfx1_file = str(self.temp_dir / "channel_3_sfx_1.wav")
-            sfx1_audio.export(sfx1_file, format="wav")
-            track_files[self.TRACK_SFX_1] = sfx1_file
-            track_audio_segments[self.TRACK_SFX_1] = sfx1_audio
-
-        # SFX Track 2 (mono)
-        sfx2_audio = self.generate_track_audio(
-            self.TRACK_SFX_2,
-            track_assignments[self.TRACK_SFX_2],
-            duration_ms,
-            is_stereo=False
-        )
-        if sfx2_audio:
-            sfx2_file = str(self.temp_dir / "channel_4_sfx_2.wav")
-            sfx2_audio.export(sfx2_file, format="wav")
-            track_files[self.TRACK_SFX_2] = sfx2_file
-            track_audio_segments[self.TRACK_SFX_2] = sfx2_audio
-
-        # Voice track (mono)
-        voice_audio = self.generate_track_audio(
-            self.TRACK_VOICE,
-            track_assignments[self.TRACK_VOICE],
-            duration_ms,
-            is_stereo=False
-        )
-        if voice_audio:
-            voice_file = str(self.temp_dir / "channel_5_voice.wav")
-            voice_audio.export(voice_file, format="wav")
-            track_files[self.TRACK_VOICE] = voice_file
-            track_audio_segments[self.TRACK_VOICE] = voice_audio
+        track_specs = [
+            (self.TRACK_MUSIC_LR, True, "channel_1_2_music_stereo.wav"),
+            (self.TRACK_SFX_1, False, "channel_3_sfx_1.wav"),
+            (self.TRACK_SFX_2, False, "channel_4_sfx_2.wav"),
+            (self.TRACK_VOICE, False, "channel_5_voice.wav"),
+        ]
 
-        # Step 3: Create stereo preview mix
-        print("Creating stereo preview mix...")
-        preview_audio = AudioSegment.silent(duration=duration_ms).set_channels(2)
+        # One decode pool for all tracks, so a file used on several tracks is decoded once
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or DECODE_WORKERS) as decode_pool:
+            decode = _memoized_decoder(decode_pool)
+            asset_index = build_asset_index()
+            with ThreadPoolExecutor(max_workers=len(track_specs)) as executor:
+                futures = [
+                    executor.submit(
+                        self._plan_track, track_assignments[track_id], is_stereo, decode, asset_index
+                    )
+                    for track_id, is_stereo, _ in track_specs
+                ]
+            plans = [future.result() for future in futures]
+
+        track_files = {
+            track_id: str(self.temp_dir / filename)
+            for track_id, _, filename in track_specs
+        }
+
+        # The preview runs at the highest track rate; those tracks stream block by
+        # block into their WAVs and the preview together
+        preview_rate = max(frame_rate for _, frame_rate, _ in plans)
+        total_frames = int(duration_ms * preview_rate / 1000)
+
+        # Track waveforms are taken from the mix buffers as they are written,
+        # so get_track_waveforms doesn't need to decode the files again
+        envelopes = {}
+
+        streamed = []  # (track_file, clips, channels, envelope)
+        resampled = []  # Full-length int16 tracks already at preview_rate
+        for (track_id, _, _), (clips, frame_rate, channels) in zip(track_specs, plans):
+            track_frames = int(duration_ms * frame_rate / 1000)
+            envelopes[track_id] = _PeakEnvelope(track_frames, WAVEFORM_SAMPLES)
+
+            if frame_rate == preview_rate:
+                streamed.append((track_files[track_id], clips, channels, envelopes[track_id]))
+                continue
 
-        # Mix all tracks into stereo preview
-        for track_id, audio_segment in track_audio_segments.items():
-            # Ensure stereo for mixing
-            if audio_segment.channels == 1:
-                audio_segment = audio_segment.set_channels(2)
-            preview_audio = preview_audio.overlay(audio_segment)
+            # Lower-rate tracks are rendered whole and resampled for the preview
+            samples = self._render_clips(clips, track_frames, channels)
+            sf.write(track_files[track_id], samples, frame_rate, subtype='PCM_16')
+            envelopes[track_id].add(samples)
+            resampled.append(np.round(
+                self._resample(samples.astype(np.float32), frame_rate, preview_rate)
+            ).astype(np.int16))
 
-        # Export preview
+        # Step 3: Create stereo preview mix alongside the streamed tracks
+        print("Creating stereo preview mix...")
         preview_file = str(self.temp_dir / "assembled_preview_stereo.wav")
-        preview_audio.export(preview_file, format="wav")
+
+        with ExitStack() as stack:
+            # Track WAVs: libsndfile patches the header lengths on close
+            outputs = [
+                stack.enter_context(sf.SoundFile(
+                    track_file, 'w', samplerate=preview_rate, channels=channels, subtype='PCM_16'
+                ))
+                for track_file, _, channels, _ in streamed
+            ]
+            streams = [
+                self._stream_track(clips, total_frames, channels)
+                for _, clips, channels, _ in streamed
+            ]
+            pcm = stack.enter_context(self._mapped_wav(preview_file, total_frames, 2, preview_rate))
+            preview = np.empty((min(ASSEMBLY_BLOCK_FRAMES, total_frames), 2), dtype=MIX_DTYPE)
+
+            # Each track mixes and writes its next block on its own worker (the
+            # numba kernels and libsndfile writes release the GIL)
+            writers = stack.enter_context(ThreadPoolExecutor(max_workers=TRACK_WRITE_WORKERS))
+            track_envelopes = [envelope for _, _, _, envelope in streamed]
+
+            for start in range(0, total_frames, ASSEMBLY_BLOCK_FRAMES):
+                blocks = list(writers.map(self._write_next_block, streams, outputs, track_envelopes))
+                end = start + len(blocks[0])
+                acc = preview[:end - start]
+                acc.fill(0)
+
+                # Mono tracks, shape (frames, 1), broadcast across both preview channels
+                for block in blocks:
+                    acc += block
+                for samples in resampled:
+                    chunk = samples[start:end]
+                    acc[:len(chunk)] += chunk
+
+                np.clip(acc, -32768, 32767, out=pcm[start:end], casting='unsafe')
+
+            # Release the mapped preview so _mapped_wav can close the map
+            del pcm
+
+        self._waveform_cache = {}
+        for (track_id, is_stereo, _), envelope in zip(track_specs, envelopes.values()):
+            track_file = track_files[track_id]
+            key = "stereo" if is_stereo and track_id == self.TRACK_MUSIC_LR else "mono"
+            cache_key = (track_file, os.stat(track_file).st_mtime_ns, WAVEFORM_SAMPLES)
+            self._waveform_cache[cache_key] = {key: envelope.result()}
 
         print(f"✓ Assembly complete! Generated {len(track_files)} track files + preview")
         return track_files, preview_file
 
+    @staticmethod
+    def _write_next_block(stream, output: sf.SoundFile, envelope: _PeakEnvelope) -> np.ndarray:
+        """Take a track's next block from _stream_track, write it and add it to its waveform"""
+        block = next(stream)
+        output.write(block)
+        envelope.add(block)
+        return block
+
+    @staticmethod
+    def _wav_header(total_frames: int, channels: int, sample_rate: int) -> bytes:
+        """Build the 44-byte header of a 16-bit PCM WAV of known length"""
+        data_size = total_frames * channels * 2
+        return _WAV_HEADER.pack(
+            b'RIFF', _WAV_HEADER.size - 8 + data_size, b'WAVE',
+            b'fmt ', 16, 1, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16,
+            b'data', data_size
+        )
+
+    @staticmethod
+    @contextmanager
+    def _mapped_wav(path: str, total_frames: int, channels: int, sample_rate: int):
+        """
+        Create a pre-sized 16-bit PCM WAV and map its sample data
+
+        Args:
+            path: Output WAV path
+            total_frames: Length of the file in frames
+            channels: Channel count
+            sample_rate: Sample rate
+
+        Yields:
+            Writable int16 array shaped (total_frames, channels) backed by the
+            file; the caller must drop it (and any views of it) before the
+            with-block ends so the map can be closed
+        """
+        data_size = total_frames * channels * 2
+        with open(path, 'wb+') as f:
+            f.write(AssemblyService._wav_header(total_frames, channels, sample_rate))
+            f.truncate(_WAV_HEADER.size + data_size)
+            if data_size == 0:
+                yield np.empty((0, channels), dtype=np.int16)
+                return
+
+            mm = mmap.mmap(f.fileno(), 0)
+            try:
+                yield np.frombuffer(mm, dtype='<i2', offset=_WAV_HEADER.size).reshape(total_frames, channels)
+            finally:
+                mm.flush()
+                try:
+                    mm.close()
+                except BufferError:
+                    # Only if the caller raised while still holding its array;
+                    # the map then closes once that is released
+                    pass
+
     def get_track_assignment_summary(self) -> str:
         """
         Get human-readable summary of track assignments
@@ -343,7 +1051,7 @@ class AssemblyService:
         self,
         audio_segment: AudioSegment,
         num_samples: int = 1000
-    ) -> List[float]:
+    ) -> np.ndarray:
         """
         Generate waveform data from audio segment for visualization
 
@@ -352,100 +1060,107 @@ class AssemblyService:
             num_samples: Number of data points to generate (resolution)
 
         Returns:
-            List of amplitude values normalized to -1.0 to 1.0
+            float32 array of amplitude values normalized to -1.0 to 1.0, as
+            interleaved (min, max) pairs per bucket (see _downsample_waveform)
         """
         if not audio_segment:
-            return []
-
-        # Get raw audio data as numpy array
-        samples = np.array(audio_segment.get_array_of_samples())
-
-        # If stereo, convert to mono by averaging channels
-        if audio_segment.channels == 2:
-            samples = samples.reshape((-1, 2))
-            samples = samples.mean(axis=1)
-
-        # Normalize to -1.0 to 1.0 range
-        max_val = np.abs(samples).max()
-        if max_val > 0:
-            samples = samples / max_val
-
-        # Downsample to num_samples points
-        if len(samples) > num_samples:
-            # Calculate step size
-            step = len(samples) / num_samples
-            indices = np.arange(num_samples) * step
-            indices = indices.astype(int)
-            waveform_data = samples[indices]
-        else:
-            waveform_data = samples
+            return np.empty(0, dtype=np.float32)
+
+        # Get raw audio data as a (frames, channels) int16 view
+        samples, _ = self._as_pcm(audio_segment)
 
-        return waveform_data.tolist()
+        # Average channels into one, then normalize to -1.0 to 1.0 range
+        samples = _downmix(samples)
+        samples = _normalize(samples, _peak_abs(samples))
+
+        # Downsample to num_samples (min, max) buckets
+        return self._downsample_waveform(samples, num_samples)
 
     def get_track_waveforms(
         self,
         track_files: Dict[str, str],
         num_samples: int = 1000
-    ) -> Dict[str, Dict[str, List[float]]]:
+    ) -> Dict[str, Dict[str, np.ndarray]]:
         """
         Generate waveform data for all tracks
 
+        Waveforms already computed for these files (by assemble_audio or an
+        earlier call) are reused until a file's mtime changes; other files
+        are decoded.
+
         Args:
             track_files: Dict mapping track_id to file path
             num_samples: Number of samples per waveform
 
         Returns:
-            Dict mapping track_id to waveform data
+            Dict mapping track_id to waveform data (float32 arrays)
             For stereo tracks: {"stereo": [...]}  (averaged L+R)
             For mono tracks: {"mono": [...]}
         """
         waveforms = {}
 
         for track_id, file_path in track_files.items():
-            if not os.path.exists(file_path):
+            try:
+                mtime_ns = os.stat(file_path).st_mtime_ns
+            except OSError:
+                continue
+
+            cached = self._waveform_cache.get((file_path, mtime_ns, num_samples))
+            if cached is not None:
+                waveforms[track_id] = cached
                 continue
 
             try:
-                # Load audio
-                audio = AudioSegment.from_file(file_path)
-
-                # Generate waveform based on channel count
-                if audio.channels == 2 and track_id == self.TRACK_MUSIC_LR:
-                    # Stereo: average L and R channels into single waveform
-                    samples = np.array(audio.get_array_of_samples())
-                    samples = samples.reshape((-1, 2))
-
-                    # Average L and R channels
-                    left_samples = samples[:, 0]
-                    right_samples = samples[:, 1]
-                    stereo_avg = (left_samples + right_samples) / 2
-
-                    # Normalize
-                    max_val = np.abs(stereo_avg).max()
-                    if max_val > 0:
-                        stereo_avg = stereo_avg / max_val
-
-                    waveforms[track_id] = {
-                        "stereo": self._downsample_waveform(stereo_avg, num_samples)
-                    }
-                else:
-                    # Mono
-                    waveform_data = self.generate_waveform_data(audio, num_samples)
-                    waveforms[track_id] = {"mono": waveform_data}
+                # Load audio (int16 PCM, shape (frames, channels))
+                samples, _ = load_pcm(file_path)
+
+                is_stereo = samples.shape[1] == 2
+
+                # Average channels into a single waveform, then normalize
+                samples = _downmix(samples)
+                samples = _normalize(samples, _peak_abs(samples))
+
+                # Stereo music track is reported as "stereo" (averaged L+R)
+                key = "stereo" if is_stereo and track_id == self.TRACK_MUSIC_LR else "mono"
+                waveforms[track_id] = {key: self._downsample_waveform(samples, num_samples)}
+
+                # Remember it until the file changes (older versions are dropped)
+                for stale in [k for k in self._waveform_cache if k[0] == file_path and k[1] != mtime_ns]:
+                    del self._waveform_cache[stale]
+                self._waveform_cache[(file_path, mtime_ns, num_samples)] = waveforms[track_id]
 
             except Exception as e:
                 print(f"Error generating waveform for {track_id}: {e}")
 
         return waveforms
 
-    def _downsample_waveform(self, samples: np.ndarray, num_samples: int) -> List[float]:
-        """Helper to downsample waveform data"""
-        if len(samples) > num_samples:
-            step = len(samples) / num_samples
-            indices = np.arange(num_samples) * step
-            indices = indices.astype(int)
-            return samples[indices].tolist()
-        return samples.tolist()
+    def _downsample_waveform(self, samples: np.ndarray, num_samples: int) -> np.ndarray:
+        """
+        Downsample waveform data to a peak envelope
+
+        Each of num_samples buckets contributes its minimum and maximum, so
+        short transients survive downsampling (picking one sample per bucket
+        aliases them away). Drawn as a polyline, the pairs fill the envelope.
+        Buckets differ in size by at most one sample and cover the whole input.
+
+        Args:
+            samples: 1-D audio samples
+            num_samples: Number of buckets
+
+        Returns:
+            Interleaved [min0, max0, min1, max1, ...] (2 * num_samples values),
+            or the samples unchanged if there are no more than num_samples
+        """
+        if len(samples) <= num_samples:
+            return samples
+
+        # One reduceat pass per extreme over buckets that cover every sample
+        starts = _bucket_edges(len(samples), num_samples)[:-1]
+
+        envelope = np.empty(2 * num_samples, dtype=samples.dtype)
+        envelope[0::2] = np.minimum.reduceat(samples, starts)
+        envelope[1::2] = np.maximum.reduceat(samples, starts)
+        return envelope
 
     def cleanup_temp_files(self):
         """Remove temporary assembly files"""
@@ -466,29 +1181,22 @@ class AssemblyService:
         Returns:
             Dict with next available IDs for each type: {'music': 1, 'sfx': 1, 'voice': 1}
         """
-        import re
-        import glob
-
         # Check existing files in output directory
-        existing_files = glob.glob(os.path.join(output_dir, "*.wav"))
+        try:
+            with os.scandir(output_dir) as entries:
+                existing_files = [entry.name for entry in entries if entry.name.endswith(".wav")]
+        except OSError:
+            existing_files = []
 
         # Track highest ID for each type
         max_ids = {'music': 0, 'sfx': 0, 'voice': 0}
 
-        for filepath in existing_files:
-            filename = os.path.basename(filepath)
-
+        for filename in existing_files:
             # Match MUS_00001, SFX_00002, VOX_00003 patterns
-            mus_match = re.match(r'MUS_(\d+)_', filename)
-            sfx_match = re.match(r'SFX_(\d+)_', filename)
-            vox_match = re.match(r'VOX_(\d+)_', filename)
-
-            if mus_match:
-                max_ids['music'] = max(max_ids['music'], int(mus_match.group(1)))
-            elif sfx_match:
-                max_ids['sfx'] = max(max_ids['sfx'], int(sfx_match.group(1)))
-            elif vox_match:
-                max_ids['voice'] = max(max_ids['voice'], int(vox_match.group(1)))
+            match = _ASSET_ID_RE.match(filename)
+            if match:
+                asset_type = _ASSET_ID_TYPES[match.group(1)]
+                max_ids[asset_type] = max(max_ids[asset_type], int(match.group(2)))
 
         # Return next available IDs
         return {
@@ -508,8 +1216,6 @@ class AssemblyService:
         Returns:
             Sanitized filename suffix (max 50 chars)
         """
-        import re
-
         if not markers:
             return default
 
@@ -530,7 +1236,7 @@ class AssemblyService:
             # Use marker name, sanitize for filename
             desc = marker_name
             desc = desc.replace(' ', '_')
-            desc = re.sub(r'[^\w\-_]', '', desc)  # Remove special chars
+            desc = _UNSAFE_FILENAME_CHARS_RE.sub('', desc)  # Remove special chars
             return desc[:50]  # Limit length
 
         # Fallback: try to extract from prompt_data
@@ -555,13 +1261,39 @@ class AssemblyService:
         # Ultimate fallback
         return default
 
+    @staticmethod
+    def _as_pcm(track: Optional[TrackAudio]) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Get a track's 16-bit samples without copying them
+
+        Args:
+            track: AudioSegment, (samples, frame_rate) tuple, or None
+
+        Returns:
+            (int16 samples shaped (frames, channels), frame_rate), or None
+        """
+        if track is None:
+            return None
+        if isinstance(track, AudioSegment):
+            if track.sample_width != 2:
+                track = track.set_sample_width(2)
+            samples = np.frombuffer(track.raw_data, dtype=np.int16).reshape(-1, track.channels)
+            return samples, track.frame_rate
+        return track
+
+    @staticmethod
+    def _pcm_duration_ms(samples: np.ndarray, frame_rate: int) -> int:
+        """Duration in whole milliseconds, rounded like len(AudioSegment)"""
+        return round(1000 * (len(samples) / frame_rate))
+
     def save_multichannel_wav(
         self,
         filename: str,
-        music_track: Optional[AudioSegment],
-        sfx1_track: Optional[AudioSegment],
-        sfx2_track: Optional[AudioSegment],
-        voice_track: Optional[AudioSegment]
+        music_track: Optional[TrackAudio],
+        sfx1_track: Optional[TrackAudio],
+        sfx2_track: Optional[TrackAudio],
+        voice_track: Optional[TrackAudio],
+        subtype: str = 'PCM_16'
     ):
         """
         Save multiple audio tracks into a single multi-channel WAV file
@@ -572,128 +1304,118 @@ class AssemblyService:
         - Channel 4: SFX 2 (Mono)
         - Channel 5: Voice (Mono)
 
+        Tracks can be AudioSegments or (samples, frame_rate) tuples as returned
+        by _render_track_pcm; the latter are used without any conversion.
+
         Args:
             filename: Output file path
-            music_track: Stereo music AudioSegment (or None)
-            sfx1_track: Mono SFX 1 AudioSegment (or None)
-            sfx2_track: Mono SFX 2 AudioSegment (or None)
-            voice_track: Mono voice AudioSegment (or None)
+            music_track: Stereo music track (or None)
+            sfx1_track: Mono SFX 1 track (or None)
+            sfx2_track: Mono SFX 2 track (or None)
+            voice_track: Mono voice track (or None)
+            subtype: Sample format, 'PCM_16' or 'PCM_24' (16-bit samples are
+                widened exactly into the 24-bit container)
         """
+        if subtype not in ('PCM_16', 'PCM_24'):
+            raise ValueError(f"Unsupported WAV subtype: {subtype}")
+
+        tracks = [self._as_pcm(track) for track in [music_track, sfx1_track, sfx2_track, voice_track]]
+
         # Get target sample rate (use highest sample rate among tracks)
         target_sample_rate = 48000  # Default to 48kHz
         max_duration_ms = 0
 
-        for track in [music_track, sfx1_track, sfx2_track, voice_track]:
-            if track:
-                target_sample_rate = max(target_sample_rate, track.frame_rate)
-                max_duration_ms = max(max_duration_ms, len(track))
+        for track in tracks:
+            if track and self._pcm_duration_ms(*track):
+                target_sample_rate = max(target_sample_rate, track[1])
+                max_duration_ms = max(max_duration_ms, self._pcm_duration_ms(*track))
 
         if max_duration_ms == 0:
             raise ValueError("At least one track must be provided")
 
         # Normalize all tracks to the same sample rate and duration
-        def normalize_track(track: Optional[AudioSegment], target_duration_ms: int, target_sample_rate: int, channels: int) -> AudioSegment:
-            """Ensure track has correct sample rate, duration, and channel count"""
+        def normalize_track(track: Optional[Tuple[np.ndarray, int]], target_duration_ms: int, target_sample_rate: int) -> Optional[Tuple[np.ndarray, int]]:
+            """Ensure track has correct sample rate and is no longer than the target duration"""
             if track is None:
-                # Create silent track with correct properties
-                return AudioSegment.silent(
-                    duration=target_duration_ms,
-                    frame_rate=target_sample_rate
-                ).set_channels(channels)
-
-            # Resample to target sample rate if needed
-            if track.frame_rate != target_sample_rate:
-                track = track.set_frame_rate(target_sample_rate)
-
-            # Adjust duration
-            current_duration = len(track)
-            if current_duration < target_duration_ms:
-                # Pad with silence
-                silence_needed = target_duration_ms - current_duration
-                silence = AudioSegment.silent(
-                    duration=silence_needed,
-                    frame_rate=target_sample_rate
-                ).set_channels(track.channels)
-                track = track + silence
-            elif current_duration > target_duration_ms:
-                # Trim to target duration
-                track = track[:target_duration_ms]
-
-            return track
+                # Missing tracks stay silent in the output buffer
+                return None
 
-        # Normalize all tracks to max duration and target sample rate
-        music_track = normalize_track(music_track, max_duration_ms, target_sample_rate, 2)  # Stereo
-        sfx1_track = normalize_track(sfx1_track, max_duration_ms, target_sample_rate, 1)    # Mono
-        sfx2_track = normalize_track(sfx2_track, max_duration_ms, target_sample_rate, 1)    # Mono
-        voice_track = normalize_track(voice_track, max_duration_ms, target_sample_rate, 1)  # Mono
-
-        # Debug: Check track durations
-        print(f"  Track durations after normalization:")
-        print(f"    Music: {len(music_track)}ms, {music_track.frame_rate}Hz, {music_track.channels}ch")
-        print(f"    SFX1:  {len(sfx1_track)}ms, {sfx1_track.frame_rate}Hz, {sfx1_track.channels}ch")
-        print(f"    SFX2:  {len(sfx2_track)}ms, {sfx2_track.frame_rate}Hz, {sfx2_track.channels}ch")
-        print(f"    Voice: {len(voice_track)}ms, {voice_track.frame_rate}Hz, {voice_track.channels}ch")
-
-        # Convert each AudioSegment to numpy array
-        arrays = []
-
-        # Music track (stereo - 2 channels)
-        data = np.array(music_track.get_array_of_samples())
-        if music_track.channels == 2:
-            data = data.reshape((-1, 2))
-        else:
-            # Convert mono to stereo
-            data = data.reshape((-1, 1))
-            data = np.hstack([data, data])
-        arrays.append(data)
-
-        # SFX 1 track (mono - 1 channel)
-        data = np.array(sfx1_track.get_array_of_samples())
-        arrays.append(data.reshape((-1, 1)))
-
-        # SFX 2 track (mono - 1 channel)
-        data = np.array(sfx2_track.get_array_of_samples())
-        arrays.append(data.reshape((-1, 1)))
-
-        # Voice track (mono - 1 channel)
-        data = np.array(voice_track.get_array_of_samples())
-        arrays.append(data.reshape((-1, 1)))
-
-        # Debug: Check array sizes
-        print(f"  Array sizes after conversion:")
-        print(f"    Music: {arrays[0].shape}")
-        print(f"    SFX1:  {arrays[1].shape}")
-        print(f"    SFX2:  {arrays[2].shape}")
-        print(f"    Voice: {arrays[3].shape}")
-
-        # Ensure all arrays have exactly the same length (fix rounding errors)
-        max_samples = max(arr.shape[0] for arr in arrays)
-        print(f"  Max samples: {max_samples}, will normalize all arrays to this length")
-
-        normalized_arrays = []
-        for arr in arrays:
-            current_samples = arr.shape[0]
-            if current_samples < max_samples:
-                # Pad with zeros
-                padding = max_samples - current_samples
-                if arr.ndim == 2:
-                    # For 2D arrays (stereo), pad along first axis
-                    arr = np.vstack([arr, np.zeros((padding, arr.shape[1]), dtype=arr.dtype)])
-                else:
-                    # For 1D arrays (mono), pad along first axis
-                    arr = np.concatenate([arr, np.zeros(padding, dtype=arr.dtype)])
-            elif current_samples > max_samples:
-                # Trim to max length
-                arr = arr[:max_samples]
+            samples, frame_rate = track
 
-            normalized_arrays.append(arr)
+            # Resample to target sample rate if needed (polyphase, all channels at once)
+            if frame_rate != target_sample_rate:
+                g = math.gcd(frame_rate, target_sample_rate)
+                resampled = resample_poly(samples, target_sample_rate // g, frame_rate // g, axis=0)
+                samples = np.clip(np.round(resampled), -32768, 32767).astype(np.int16)
+                frame_rate = target_sample_rate
 
-        # Concatenate along channel axis: (samples, 5)
-        # Result: [Music_L, Music_R, SFX1, SFX2, Voice]
-        multichannel = np.hstack(normalized_arrays)
+            # Trim to target duration (shorter tracks are padded by the output buffer)
+            if self._pcm_duration_ms(samples, frame_rate) > target_duration_ms:
+                samples = samples[:int(target_duration_ms * (frame_rate / 1000.0))]
 
-        # Write to WAV file
-        wavfile.write(filename, target_sample_rate, multichannel.astype(np.int16))
+            return samples, frame_rate
+
+        # Normalize all tracks to max duration and target sample rate
+        tracks = [normalize_track(track, max_duration_ms, target_sample_rate) for track in tracks]
+
+        if self.debug_logging:
+            def describe(track: Optional[Tuple[np.ndarray, int]]) -> str:
+                if track is None:
+                    return "silent"
+                samples, frame_rate = track
+                return f"{self._pcm_duration_ms(samples, frame_rate)}ms, {frame_rate}Hz, {samples.shape[1]}ch"
+
+            print(f"  Track durations after normalization:")
+            print(f"    Music: {describe(tracks[0])}")
+            print(f"    SFX1:  {describe(tracks[1])}")
+            print(f"    SFX2:  {describe(tracks[2])}")
+            print(f"    Voice: {describe(tracks[3])}")
+
+        # (samples, channels) arrays, each keeping its native channel count
+        arrays = [track[0] if track is not None else None for track in tracks]
+
+        # All channels share one length (fix rounding errors by padding to the longest)
+        max_samples = max(
+            [int(max_duration_ms * target_sample_rate / 1000)]
+            + [arr.shape[0] for arr in arrays if arr is not None]
+        )
+        if self.debug_logging:
+            print(f"  Max samples: {max_samples}, will normalize all arrays to this length")
+
+        # Interleave block by block into [Music_L, Music_R, SFX1, SFX2, Voice], so
+        # only one block of the 5-channel output is ever held in memory.
+        # Mono music, shape (samples, 1), broadcasts across both music channels;
+        # stereo sources on mono channels are averaged; short tracks pad with silence.
+        layout = [(0, 2), (2, 3), (3, 4), (4, 5)]
+        block = np.empty((min(ASSEMBLY_BLOCK_FRAMES, max_samples), 5), dtype=np.int16)
+
+        if subtype == 'PCM_16':
+            # 16-bit output is raw int16 frames after a precomputed header
+            sink = open(filename, 'wb')
+            sink.write(self._wav_header(max_samples, 5, target_sample_rate))
+
+            def write_block(out: np.ndarray):
+                sink.write(out.astype('<i2', copy=False).tobytes())
+        else:
+            # libsndfile keeps the top 24 bits of int32 input, so shifting
+            # int16 up by 16 stores each sample exactly
+            sink = sf.SoundFile(filename, 'w', target_sample_rate, 5, subtype=subtype, format='WAV')
+
+            def write_block(out: np.ndarray):
+                sink.write(out.astype(np.int32) << 16)
+
+        with sink:
+            for start in range(0, max_samples, ASSEMBLY_BLOCK_FRAMES):
+                out = block[:min(ASSEMBLY_BLOCK_FRAMES, max_samples - start)]
+                out.fill(0)
+                for arr, (first, last) in zip(arrays, layout):
+                    if arr is None or start >= len(arr):
+                        continue
+                    chunk = arr[start:start + len(out)]
+                    if chunk.shape[1] > last - first:
+                        chunk = chunk.mean(axis=1, keepdims=True).astype(np.int16)
+                    out[:len(chunk), first:last] = chunk
+                write_block(out)
 
     def export_with_metadata(
         self,
@@ -725,10 +1447,11 @@ class AssemblyService:
         Returns:
             Dict with export summary
         """
-        import json
-        import shutil
         from datetime import datetime
-        from pydub.utils import mediainfo
+
+        # One timestamp for the whole export: every marker's metadata and the
+        # assembled summary record the same moment
+        export_ts = datetime.now().isoformat()
 
         # Create output directory structure
         output_path = Path(output_dir) / f"{template_id}_{template_name.replace(' ', '_')}"
@@ -749,7 +1472,22 @@ class AssemblyService:
         exported_files = []
         markers_included = []
 
+        # Resolve each marker here (in order, so the log reads as before); copying,
+        # probing durations and writing metadata happen on a pool afterwards.
+        # dest_file -> (source_path, metadata_file, metadata); a later marker using
+        # the same file wins, as it did when each marker overwrote the last
+        pending: Dict[str, Tuple[Path, str, dict]] = {}
+
+        # Destination folder per marker type, as (path, name relative to output_path);
+        # plain strings so the loop joins paths without building Path objects
+        dest_dirs = {
+            'music': (os.fspath(music_dir), music_dir.name),
+            'sfx': (os.fspath(sfx_dir), sfx_dir.name),
+            'voice': (os.fspath(voice_dir), voice_dir.name),
+        }
+
         # Process each marker and export individual files + metadata
+        asset_index = build_asset_index()
         for marker in markers:
             # Get marker data (works with both dict and Marker objects)
             if isinstance(marker, dict):
@@ -772,8 +1510,11 @@ class AssemblyService:
                         versions[-1] if versions else {}
                     )
                     asset_file = current_version_data.get('asset_file', '')
+                    known_duration_ms = current_version_data.get('duration_ms')
                 else:
                     asset_file = marker.get('asset_file', '')
+                    known_duration_ms = None
+                known_duration_ms = known_duration_ms or marker.get('duration_ms')
             else:
                 marker_type = marker.type
                 time_ms = marker.time_ms
@@ -793,7 +1534,9 @@ class AssemblyService:
                     )
                     asset_file = current_version_data.asset_file if current_version_data else marker.asset_file
                 else:
+                    current_version_data = None
                     asset_file = marker.asset_file
+                known_duration_ms = getattr(current_version_data, 'duration_ms', None) or marker.duration_ms
 
             # Skip markers without generated audio
             if not asset_file:
@@ -802,106 +1545,60 @@ class AssemblyService:
 
             # Find source audio file
             print(f"  Looking for audio file: {asset_file} (type: {marker_type})")
-            source_path = self._find_audio_file(asset_file, marker_type)
+            source_path = self._find_audio_file(asset_file, marker_type, asset_index)
             if not source_path:
                 print(f"  ⚠ Warning: Audio file not found for {asset_file}")
                 continue
             print(f"    Found at: {source_path}")
 
-            # Get audio duration
-            try:
-                info = mediainfo(source_path)
-                audio_duration_ms = int(float(info.get('duration', 0)) * 1000)
-            except:
-                audio_duration_ms = 0
-
             # Determine destination directory
-            if marker_type == 'music':
-                dest_dir = music_dir
-            elif marker_type == 'sfx':
-                dest_dir = sfx_dir
-            elif marker_type == 'voice':
-                dest_dir = voice_dir
-            else:
+            if marker_type not in dest_dirs:
                 continue
+            dest_dir, dest_dir_name = dest_dirs[marker_type]
 
-            # Copy audio file
-            dest_file = dest_dir / asset_file
-            shutil.copy2(source_path, dest_file)
-            print(f"  ✓ {marker_type.upper()}/{asset_file}")
-
-            # Generate individual metadata JSON
+            # Generate individual metadata JSON (duration is filled in once copied,
+            # unless the version or marker already records it)
+            dest_file = os.path.join(dest_dir, asset_file)
             metadata = {
                 "file": asset_file,
                 "type": marker_type,
                 "timestamp_ms": time_ms,
-                "duration_ms": audio_duration_ms,
+                "duration_ms": known_duration_ms or 0,
                 "title": title,
                 "categories": categories,
                 "notes": notes,
                 "usedInTemplates": used_in_templates,
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": export_ts,
                 "prompt_used": prompt_data
             }
 
-            # Write metadata file
-            metadata_file = dest_dir / f"{Path(asset_file).stem}_metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            stem = os.path.splitext(os.path.basename(asset_file))[0]
+            metadata_file = os.path.join(dest_dir, f"{stem}_metadata.json")
+            pending[dest_file] = (source_path, metadata_file, metadata)
 
-            exported_files.append(str(dest_file.relative_to(output_path)))
+            exported_files.append(os.path.join(dest_dir_name, asset_file))
             markers_included.append(asset_file)
 
+        # Copy audio files and write their metadata (one task per destination file)
+        with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+            futures = [
+                executor.submit(self._export_marker_file, source_path, dest_file, metadata_file, metadata)
+                for dest_file, (source_path, metadata_file, metadata) in pending.items()
+            ]
+            for future, (_, _, metadata) in zip(futures, pending.values()):
+                future.result()
+                print(f"  ✓ {metadata['type'].upper()}/{metadata['file']}")
+
         # Assemble multi-channel WAV file
         print("\nAssembling multi-channel WAV...")
         track_assignments = self.assign_markers_to_tracks(markers)
 
-        # Generate tracks
-        music_track = self.generate_track_audio(
-            self.TRACK_MUSIC_LR,
-            track_assignments[self.TRACK_MUSIC_LR],
-            duration_ms,
-            is_stereo=True
-        )
-
-        sfx1_track = self.generate_track_audio(
-            self.TRACK_SFX_1,
-            track_assignments[self.TRACK_SFX_1],
-            duration_ms,
-            is_stereo=False
-        )
-
-        sfx2_track = self.generate_track_audio(
-            self.TRACK_SFX_2,
-            track_assignments[self.TRACK_SFX_2],
-            duration_ms,
-            is_stereo=False
-        )
-
-        voice_track = self.generate_track_audio(
-            self.TRACK_VOICE,
-            track_assignments[self.TRACK_VOICE],
-            duration_ms,
-            is_stereo=False
-        )
-
-        # Save multi-channel assembled file in main output directory
-        assembled_filename = f"{template_id}_assembled.wav"
-        assembled_filepath = output_path / assembled_filename
-        self.save_multichannel_wav(
-            str(assembled_filepath),
-            music_track,
-            sfx1_track,
-            sfx2_track,
-            voice_track
-        )
-        print(f"  ✓ {assembled_filename}")
-
-        # Generate assembled audio metadata
+        # Generate assembled audio metadata (counted from the track assignment,
+        # which already sorted every marker by type)
         marker_counts = {
-            'music': len([m for m in markers if (m.get('type') if isinstance(m, dict) else m.type) == 'music']),
-            'sfx': len([m for m in markers if (m.get('type') if isinstance(m, dict) else m.type) == 'sfx']),
-            'voice': len([m for m in markers if (m.get('type') if isinstance(m, dict) else m.type) == 'voice']),
+            'music': len(track_assignments[self.TRACK_MUSIC_LR]),
+            'sfx': len(track_assignments[self.TRACK_SFX_1]) + len(track_assignments[self.TRACK_SFX_2]),
+            'voice': len(track_assignments[self.TRACK_VOICE]),
         }
         marker_counts['total'] = sum(marker_counts.values())
 
@@ -931,28 +1628,56 @@ class AssemblyService:
                 "sample_rate": 48000,
                 "bit_depth": 24
             },
-            "exported_at": datetime.now().isoformat(),
+            "exported_at": export_ts,
             "exported_by": "Audio Mapper v1.0",
             "version": "1.0"
         }
 
-        # Write assembled metadata
+        # The summary and template JSON don't depend on the audio: write them on a
+        # background thread while the tracks are rendered, report them afterwards
         assembled_metadata_file = output_path / f"{template_id}_export_metadata.json"
-        with open(assembled_metadata_file, 'w') as f:
-            json.dump(assembled_metadata, f, indent=2)
-        print(f"  ✓ {template_id}_export_metadata.json")
-
-        # Export template JSON
         template_data = {
             "template_id": template_id,
             "template_name": template_name,
-            "duration_ms": duration_ms,
-            "markers": [self._serialize_marker_for_export(m) for m in markers]
+            "duration_ms": duration_ms
         }
         template_file = output_path / f"{template_id}_template.json"
-        with open(template_file, 'w') as f:
-            json.dump(template_data, f, indent=2)
-        print(f"  ✓ {template_id}_template.json")
+        with ThreadPoolExecutor(max_workers=1) as json_writer:
+            # Write assembled metadata
+            assembled_metadata_written = json_writer.submit(
+                _dump_json, assembled_metadata_file, assembled_metadata
+            )
+            # Export template JSON, serializing markers as they are written
+            template_written = json_writer.submit(
+                _dump_json_streaming, template_file, template_data, "markers",
+                (self._serialize_marker_for_export(m) for m in markers)
+            )
+
+            # Generate tracks as (samples, frame_rate) - handed to the writer without conversion
+            tracks = self._render_tracks_pcm(track_assignments, duration_ms)
+            music_track = tracks[self.TRACK_MUSIC_LR]
+            sfx1_track = tracks[self.TRACK_SFX_1]
+            sfx2_track = tracks[self.TRACK_SFX_2]
+            voice_track = tracks[self.TRACK_VOICE]
+
+            # Save multi-channel assembled file in main output directory,
+            # 24-bit as declared in its export_format
+            assembled_filename = f"{template_id}_assembled.wav"
+            assembled_filepath = output_path / assembled_filename
+            self.save_multichannel_wav(
+                str(assembled_filepath),
+                music_track,
+                sfx1_track,
+                sfx2_track,
+                voice_track,
+                subtype='PCM_24'
+            )
+            print(f"  ✓ {assembled_filename}")
+
+            assembled_metadata_written.result()
+            print(f"  ✓ {template_id}_export_metadata.json")
+            template_written.result()
+            print(f"  ✓ {template_id}_template.json")
 
         print(f"\n✅ Export complete!")
         print(f"  - {len(exported_files)} audio files exported")
@@ -969,18 +1694,36 @@ class AssemblyService:
             "template_file": f"{template_id}_template.json"
         }
 
-    def _find_audio_file(self, asset_file: str, marker_type: str) -> Optional[Path]:
-        """Find audio file in various possible locations"""
-        possible_paths = [
-            Path("generated_audio") / marker_type / asset_file,
-            Path("generated_audio") / asset_file,
-            Path(asset_file)
-        ]
+    @staticmethod
+    def _export_marker_file(source_path: Path, dest_file: str, metadata_file: str, metadata: dict):
+        """
+        Copy one marker's audio into the export and write its metadata JSON
+
+        Args:
+            source_path: Generated audio file
+            dest_file: Destination in the MUSIC/, SFX/ or VOICE/ folder
+            metadata_file: Destination of the metadata JSON
+            metadata: Metadata for the file; its duration_ms is filled in here
+                if not already known
+        """
+        _fast_copy(source_path, dest_file)
 
-        for path in possible_paths:
-            if path.exists():
-                return path
-        return None
+        # Get audio duration (only read from the file when not already known)
+        if not metadata["duration_ms"]:
+            metadata["duration_ms"] = _fast_duration_ms(source_path)
+
+        # Write metadata file
+        _dump_json(metadata_file, metadata)
+
+    def _find_audio_file(
+        self,
+        asset_file: str,
+        marker_type: str,
+        asset_index: Optional[dict] = None
+    ) -> Optional[Path]:
+        """Find audio file in various possible locations (via asset_index if given)"""
+        path = resolve_asset_path(asset_index, marker_type, asset_file)
+        return Path(path) if path else None
 
     def export_tracks(
         self,
@@ -1014,7 +1757,6 @@ class AssemblyService:
                 'metadata_file': str
             }
         """
-        import json
         from datetime import datetime
 
         # 1. Group markers by track assignment
@@ -1031,89 +1773,78 @@ class AssemblyService:
         # 4. Generate individual track files with asset naming
         print("Generating track files...")
         track_files = {}
-        track_audio_segments = {}
-
-        # Music: Stereo (Channels 1-2)
-        music_markers = track_assignments[self.TRACK_MUSIC_LR]
-        music_track = self.generate_track_audio(
-            self.TRACK_MUSIC_LR,
-            music_markers,
-            duration_ms,
-            is_stereo=True
-        )
-        if music_track:
-            music_desc = self.generate_track_description(music_markers, "Music_Track")
-            music_filename = f"MUS_{next_ids['music']:05d}_{music_desc}.wav"
-            music_file = str(output_path / music_filename)
-            music_track.export(music_file, format="wav")
-            track_files["channels_1_2"] = music_filename
-            track_audio_segments["music"] = music_track
-            print(f"  ✓ {music_filename}")
-
-        # SFX Channel 3: Mono
-        sfx1_markers = track_assignments[self.TRACK_SFX_1]
-        sfx1_track = self.generate_track_audio(
-            self.TRACK_SFX_1,
-            sfx1_markers,
-            duration_ms,
-            is_stereo=False
-        )
-        if sfx1_track:
-            sfx1_desc = self.generate_track_description(sfx1_markers, "SFX_Ch3")
-            sfx1_filename = f"SFX_{next_ids['sfx']:05d}_{sfx1_desc}.wav"
-            sfx1_file = str(output_path / sfx1_filename)
-            sfx1_track.export(sfx1_file, format="wav")
-            track_files["channel_3"] = sfx1_filename
-            track_audio_segments["sfx1"] = sfx1_track
-            next_ids['sfx'] += 1  # Increment for next SFX track
-            print(f"  ✓ {sfx1_filename}")
-
-        # SFX Channel 4: Mono
-        sfx2_markers = track_assignments[self.TRACK_SFX_2]
-        sfx2_track = self.generate_track_audio(
-            self.TRACK_SFX_2,
-            sfx2_markers,
-            duration_ms,
-            is_stereo=False
-        )
-        if sfx2_track:
-            sfx2_desc = self.generate_track_description(sfx2_markers, "SFX_Ch4")
-            sfx2_filename = f"SFX_{next_ids['sfx']:05d}_{sfx2_desc}.wav"
-            sfx2_file = str(output_path / sfx2_filename)
-            sfx2_track.export(sfx2_file, format="wav")
-            track_files["channel_4"] = sfx2_filename
-            track_audio_segments["sfx2"] = sfx2_track
-            print(f"  ✓ {sfx2_filename}")
-
-        # Voice Channel 5: Mono
-        voice_markers = track_assignments[self.TRACK_VOICE]
-        voice_track = self.generate_track_audio(
-            self.TRACK_VOICE,
-            voice_markers,
-            duration_ms,
-            is_stereo=False
-        )
-        if voice_track:
-            voice_desc = self.generate_track_description(voice_markers, "Voice_Track")
-            voice_filename = f"VOX_{next_ids['voice']:05d}_{voice_desc}.wav"
-            voice_file = str(output_path / voice_filename)
-            voice_track.export(voice_file, format="wav")
-            track_files["channel_5"] = voice_filename
-            track_audio_segments["voice"] = voice_track
-            print(f"  ✓ {voice_filename}")
-
-        # 5. Create 5-channel consolidated WAV
-        print("Creating 5-channel consolidated WAV...")
-        multichannel_filename = f"{template_id}_5ch.wav"
-        multichannel_file = str(output_path / multichannel_filename)
-        self.save_multichannel_wav(
-            multichannel_file,
-            track_audio_segments.get("music"),
-            track_audio_segments.get("sfx1"),
-            track_audio_segments.get("sfx2"),
-            track_audio_segments.get("voice")
-        )
-        print(f"  ✓ {multichannel_filename}")
+        track_audio_arrays = {}
+        tracks = self._render_tracks_pcm(track_assignments, duration_ms)
+
+        # Track WAVs are written in the background, alongside the 5-channel file;
+        # the with-block waits for them even if building the export fails
+        with ThreadPoolExecutor(max_workers=len(tracks)) as writers:
+            writes = []
+
+            # Music: Stereo (Channels 1-2)
+            music_markers = track_assignments[self.TRACK_MUSIC_LR]
+            music_track = tracks[self.TRACK_MUSIC_LR]
+            if len(music_track[0]):
+                music_desc = self.generate_track_description(music_markers, "Music_Track")
+                music_filename = f"MUS_{next_ids['music']:05d}_{music_desc}.wav"
+                music_file = str(output_path / music_filename)
+                writes.append(writers.submit(wavfile.write, music_file, music_track[1], music_track[0]))
+                track_files["channels_1_2"] = music_filename
+                track_audio_arrays["music"] = music_track
+                print(f"  ✓ {music_filename}")
+
+            # SFX Channel 3: Mono
+            sfx1_markers = track_assignments[self.TRACK_SFX_1]
+            sfx1_track = tracks[self.TRACK_SFX_1]
+            if len(sfx1_track[0]):
+                sfx1_desc = self.generate_track_description(sfx1_markers, "SFX_Ch3")
+                sfx1_filename = f"SFX_{next_ids['sfx']:05d}_{sfx1_desc}.wav"
+                sfx1_file = str(output_path / sfx1_filename)
+                writes.append(writers.submit(wavfile.write, sfx1_file, sfx1_track[1], sfx1_track[0]))
+                track_files["channel_3"] = sfx1_filename
+                track_audio_arrays["sfx1"] = sfx1_track
+                next_ids['sfx'] += 1  # Increment for next SFX track
+                print(f"  ✓ {sfx1_filename}")
+
+            # SFX Channel 4: Mono
+            sfx2_markers = track_assignments[self.TRACK_SFX_2]
+            sfx2_track = tracks[self.TRACK_SFX_2]
+            if len(sfx2_track[0]):
+                sfx2_desc = self.generate_track_description(sfx2_markers, "SFX_Ch4")
+                sfx2_filename = f"SFX_{next_ids['sfx']:05d}_{sfx2_desc}.wav"
+                sfx2_file = str(output_path / sfx2_filename)
+                writes.append(writers.submit(wavfile.write, sfx2_file, sfx2_track[1], sfx2_track[0]))
+                track_files["channel_4"] = sfx2_filename
+                track_audio_arrays["sfx2"] = sfx2_track
+                print(f"  ✓ {sfx2_filename}")
+
+            # Voice Channel 5: Mono
+            voice_markers = track_assignments[self.TRACK_VOICE]
+            voice_track = tracks[self.TRACK_VOICE]
+            if len(voice_track[0]):
+                voice_desc = self.generate_track_description(voice_markers, "Voice_Track")
+                voice_filename = f"VOX_{next_ids['voice']:05d}_{voice_desc}.wav"
+                voice_file = str(output_path / voice_filename)
+                writes.append(writers.submit(wavfile.write, voice_file, voice_track[1], voice_track[0]))
+                track_files["channel_5"] = voice_filename
+                track_audio_arrays["voice"] = voice_track
+                print(f"  ✓ {voice_filename}")
+
+            # 5. Create 5-channel consolidated WAV
+            print("Creating 5-channel consolidated WAV...")
+            multichannel_filename = f"{template_id}_5ch.wav"
+            multichannel_file = str(output_path / multichannel_filename)
+            self.save_multichannel_wav(
+                multichannel_file,
+                track_audio_arrays.get("music"),
+                track_audio_arrays.get("sfx1"),
+                track_audio_arrays.get("sfx2"),
+                track_audio_arrays.get("voice")
+            )
+            print(f"  ✓ {multichannel_filename}")
+
+            for write in writes:
+                write.result()  # Re-raise any track write error
 
         # 6. Write metadata JSON
         print("Writing metadata...")
@@ -1124,14 +1855,13 @@ class AssemblyService:
             "export_date": datetime.now().isoformat(),
             "individual_tracks": track_files,
             "multichannel_file": multichannel_filename,
-            "channel_layout": "5.0 (Music L/R, SFX1, SFX2, Voice)",
-            "markers": [
-                self._serialize_marker_for_export(m) for m in markers
-            ]
+            "channel_layout": "5.0 (Music L/R, SFX1, SFX2, Voice)"
         }
         metadata_file = str(output_path / "metadata.json")
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
+        _dump_json_streaming(
+            metadata_file, metadata, "markers",
+            (self._serialize_marker_for_export(m) for m in markers)
+        )
         print(f"  ✓ metadata.json")
 
         print(f"\n✅ Export complete! Output: {output_path}")
@@ -1157,7 +1887,8 @@ class AssemblyService:
             Dict representation of marker
         """
         if isinstance(marker, dict):
-            return marker
+            # Drop runtime-only cache keys ("_max_version", "_version_index")
+            return {key: value for key, value in marker.items() if not key.startswith("_")}
         else:
             # Convert Marker object to dict
             return {
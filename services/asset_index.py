@@ -0,0 +1,78 @@
+"""
+Asset Index - Locating generated audio for markers
+One listing of generated_audio/ shared by assembly, export and playback, so
+marker paths resolve with dict lookups instead of a stat per candidate.
+
+A marker's audio is looked for at generated_audio/<type>/<file>, then
+generated_audio/<file>, then at the path as given.
+"""
+
+import os
+from typing import Optional
+
+
+# Directory generated audio is saved under (one subfolder per marker type)
+GENERATED_AUDIO_DIR = "generated_audio"
+
+
+def build_asset_index(root: str = GENERATED_AUDIO_DIR) -> dict:
+    """
+    List generated audio once so marker paths resolve without stat calls
+
+    Args:
+        root: Generated audio directory
+
+    Returns:
+        Dict mapping (type, file) for files in type subfolders, and file
+        for files directly in root, to their path
+    """
+    index = {}
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    with os.scandir(entry.path) as sub_entries:
+                        for sub in sub_entries:
+                            if sub.is_file():
+                                index[(entry.name, sub.name)] = sub.path
+                elif entry.is_file():
+                    index[entry.name] = entry.path
+    except OSError:
+        pass
+    return index
+
+
+def resolve_asset_path(asset_index: Optional[dict], marker_type: str, asset_file: str) -> Optional[str]:
+    """
+    Find a marker's audio file
+
+    Args:
+        asset_index: Listing from build_asset_index, or None to check the
+            candidate paths on disk
+        marker_type: Marker type (generated_audio subfolder)
+        asset_file: Asset file name or path
+
+    Returns:
+        Path to the file, or None if it doesn't exist
+    """
+    if asset_index is not None and os.path.basename(asset_file) == asset_file:
+        path = asset_index.get((marker_type, asset_file)) or asset_index.get(asset_file)
+        if path:
+            return path
+        candidates = (asset_file,)
+    else:
+        # No listing, or a relative path below generated_audio that the
+        # listing doesn't cover - probe each location
+        candidates = (
+            os.path.join(GENERATED_AUDIO_DIR, marker_type, asset_file),
+            os.path.join(GENERATED_AUDIO_DIR, asset_file),
+            asset_file
+        )
+
+    for path in candidates:
+        try:
+            os.stat(path)
+        except (OSError, ValueError):
+            continue
+        return path
+    return None
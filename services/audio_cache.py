@@ -0,0 +1,131 @@
+"""
+Audio Cache - Process-wide cache of decoded PCM audio
+Keeps decoded clips in memory so assembly and waveform generation don't
+re-decode (and fork ffmpeg for) the same asset files over and over.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
+import soundfile as sf
+from pydub import AudioSegment
+from scipy.io import wavfile
+
+
+# Default memory budget for cached PCM (int16 samples)
+DEFAULT_BUDGET_BYTES = 512 * 1024 * 1024
+
+# (absolute path, mtime_ns, size) -> (samples, sample_rate); most recently used last
+_cache: "OrderedDict[Tuple[str, int, int], Tuple[np.ndarray, int]]" = OrderedDict()
+_cache_bytes = 0
+_budget_bytes = DEFAULT_BUDGET_BYTES
+_lock = threading.Lock()
+
+
+def load_pcm(path: str) -> Tuple[np.ndarray, int]:
+    """
+    Load an audio file as 16-bit PCM, using the in-memory cache
+
+    Entries are keyed by (path, mtime, size) so a regenerated file is decoded
+    again, even when it is rewritten within the filesystem's mtime resolution.
+    Returned arrays are shared between callers and marked read-only.
+
+    Args:
+        path: Path to audio file (WAV, MP3, ...)
+
+    Returns:
+        Tuple of (samples, sample_rate); samples has shape (frames, channels)
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    key = (abs_path, stat.st_mtime_ns, stat.st_size)
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+            return entry
+
+    samples, sample_rate = _decode(abs_path)
+    samples.flags.writeable = False
+
+    _store(key, samples, sample_rate)
+    return samples, sample_rate
+
+
+def _decode(path: str) -> Tuple[np.ndarray, int]:
+    """
+    Decode a file to int16 PCM of shape (frames, channels)
+
+    16-bit PCM WAVs (assembly tracks, imported SFX) are read straight into
+    an array with scipy. libsndfile handles other WAVs and FLAC/OGG/MP3
+    without a subprocess; anything it can't read falls back to pydub (ffmpeg).
+    """
+    if path.lower().endswith('.wav'):
+        try:
+            sample_rate, samples = wavfile.read(path)
+        except (ValueError, OSError):
+            pass
+        else:
+            if samples.dtype == np.int16:
+                if samples.ndim == 1:
+                    # Mono comes back 1-D
+                    samples = samples[:, np.newaxis]
+                return samples, sample_rate
+
+    try:
+        samples, sample_rate = sf.read(path, dtype='int16', always_2d=True)
+        return samples, sample_rate
+    except (RuntimeError, sf.LibsndfileError):
+        pass
+
+    segment = AudioSegment.from_file(path).set_sample_width(2)
+    samples = np.frombuffer(segment.raw_data, dtype=np.int16)
+    return samples.reshape(-1, segment.channels), segment.frame_rate
+
+
+def _store(key: Tuple[str, int, int], samples: np.ndarray, sample_rate: int):
+    """Insert an entry and evict least recently used entries over budget"""
+    global _cache_bytes
+
+    # Too big to ever fit - don't let it flush everything else
+    if samples.nbytes > _budget_bytes:
+        return
+
+    with _lock:
+        if key in _cache:
+            return
+        _cache[key] = (samples, sample_rate)
+        _cache_bytes += samples.nbytes
+
+        while _cache_bytes > _budget_bytes and _cache:
+            _, (evicted, _) = _cache.popitem(last=False)
+            _cache_bytes -= evicted.nbytes
+
+
+def set_budget(budget_bytes: int):
+    """
+    Set the cache memory budget, evicting entries if needed
+
+    Args:
+        budget_bytes: Maximum total size of cached samples in bytes
+    """
+    global _budget_bytes, _cache_bytes
+
+    with _lock:
+        _budget_bytes = budget_bytes
+        while _cache_bytes > _budget_bytes and _cache:
+            _, (evicted, _) = _cache.popitem(last=False)
+            _cache_bytes -= evicted.nbytes
+
+
+def clear():
+    """Drop all cached audio"""
+    global _cache_bytes
+
+    with _lock:
+        _cache.clear()
+        _cache_bytes = 0
@@ -6,9 +6,18 @@ Uses pygame.mixer for reliable cross-platform playback of generated audio files.
 
 import pygame
 import os
+from collections import OrderedDict
 from pathlib import Path
 
 
+# Files larger than this are streamed with pygame.mixer.music instead of
+# being decoded into a Sound up front
+STREAM_THRESHOLD_BYTES = 1_000_000
+
+# Number of decoded Sound objects kept for replaying short clips
+SOUND_CACHE_SIZE = 32
+
+
 class AudioPlayer:
     """
     Simple audio player for playing generated marker audio files
@@ -25,8 +34,40 @@ class AudioPlayer:
         self.current_marker_index = None
         self.is_playing = False
 
+        # True while a large file is playing through pygame.mixer.music
+        self.is_streaming = False
+
+        # (absolute path, mtime_ns) -> Sound; most recently used last
+        self._sound_cache = OrderedDict()
+
         print("✓ AudioPlayer initialized")
 
+    def _get_sound(self, file_path):
+        """
+        Get a decoded Sound for a file, reusing a cached one when possible
+
+        Entries are keyed by (path, mtime) so a regenerated file is decoded again.
+
+        Args:
+            file_path: Path to audio file
+
+        Returns:
+            pygame.mixer.Sound for the file
+        """
+        abs_path = os.path.abspath(file_path)
+        key = (abs_path, os.stat(abs_path).st_mtime_ns)
+
+        sound = self._sound_cache.get(key)
+        if sound is not None:
+            self._sound_cache.move_to_end(key)
+            return sound
+
+        sound = pygame.mixer.Sound(abs_path)
+        self._sound_cache[key] = sound
+        if len(self._sound_cache) > SOUND_CACHE_SIZE:
+            self._sound_cache.popitem(last=False)
+        return sound
+
     def play_audio_file(self, file_path, marker_index=None):
         """
         Play an audio file
@@ -47,9 +88,15 @@ class AudioPlayer:
             return False
 
         try:
-            # Load and play the audio file
-            self.current_sound = pygame.mixer.Sound(file_path)
-            self.current_sound.play()
+            if os.path.getsize(file_path) > STREAM_THRESHOLD_BYTES:
+                # Large files stream from disk through a fixed mixer buffer
+                pygame.mixer.music.load(file_path)
+                pygame.mixer.music.play()
+                self.is_streaming = True
+            else:
+                # Short clips are decoded once and replayed from the cache
+                self.current_sound = self._get_sound(file_path)
+                self.current_sound.play()
             self.current_marker_index = marker_index
             self.is_playing = True
 
@@ -59,16 +106,23 @@ class AudioPlayer:
         except Exception as e:
             print(f"✗ Error playing audio: {e}")
             self.current_sound = None
+            self.is_streaming = False
             self.is_playing = False
             return False
 
     def stop_audio(self):
         """Stop currently playing audio"""
+        was_playing = self.current_sound is not None or self.is_streaming
         if self.current_sound is not None:
             self.current_sound.stop()
-            print(f"⏸ Stopped audio")
+        elif self.is_streaming:
+            pygame.mixer.music.stop()
+
+        if was_playing:
+            print("⏸ Stopped audio")
 
         self.current_sound = None
+        self.is_streaming = False
         self.current_marker_index = None
         self.is_playing = False
 
@@ -99,5 +153,11 @@ class AudioPlayer:
                 self.is_playing = False
                 self.current_marker_index = None
                 self.current_sound = None
+        elif self.is_streaming:
+            # Streamed files play on the music channel, not a Sound channel
+            if not pygame.mixer.music.get_busy():
+                self.is_playing = False
+                self.is_streaming = False
+                self.current_marker_index = None
 
         return (self.is_playing, self.current_marker_index)
@@ -8,13 +8,23 @@ Handles audio generation for markers using ElevenLabs API:
 - Progress tracking and error handling
 """
 
+import copy
 import os
 import threading
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from tkinter import messagebox
 import tkinter as tk
 from config.color_scheme import COLORS, create_colored_button
 from tkinter import ttk
+from services.rate_controller import (
+    RateController, RpmLimiter, RETRY_ATTEMPTS, get_plan_profile, is_retriable, retry_delay
+)
+from services.asset_index import build_asset_index, resolve_asset_path
+from services.audio_cache import load_pcm
+from services.assembly_service import AssemblyService
 
 # Import ElevenLabs API functions
 try:
@@ -25,11 +35,62 @@ except ImportError:
     generate_voice = None
     generate_music = None
 
+# Generate function for each marker type and the prompt_data fields it takes,
+# as (argument name, prompt_data key, default) tuples
+_DISPATCH = {
+    'sfx': (generate_sfx, (
+        ('description', 'description', ''),
+    )),
+    'voice': (generate_voice, (
+        ('voice_profile', 'voice_profile', ''),
+        ('text', 'text', ''),
+    )),
+    'music': (generate_music, (
+        ('positive_styles', 'positiveGlobalStyles', []),
+        ('negative_styles', 'negativeGlobalStyles', []),
+        ('sections', 'sections', []),
+    )),
+}
+
+# prompt_data field each marker type cannot be generated without
+_REQUIRED_PROMPT_FIELDS = {
+    'sfx': ('description', "SFX description is required"),
+    'voice': ('text', "Voice text is required"),
+    'music': ('positiveGlobalStyles', "Music requires at least one positive style"),
+}
+
+
+# Request limits of the ElevenLabs plan in use (ELEVENLABS_PLAN, default
+# "free"; ELEVENLABS_RPM overrides its requests-per-minute budget)
+PLAN_PROFILE = get_plan_profile(os.getenv('ELEVENLABS_PLAN'), os.getenv('ELEVENLABS_RPM'))
+
+# Number of ElevenLabs requests a batch starts with in flight at once; the
+# RateController adjusts it between 1 and BATCH_MAX_CONCURRENCY (the plan's
+# concurrent request cap) as responses come back. Starting at half the cap
+# leaves room for clean successes to raise it.
+BATCH_MAX_CONCURRENCY = PLAN_PROFILE["concurrency"]
+BATCH_CONCURRENCY = max(1, BATCH_MAX_CONCURRENCY // 2)
+
+# Workers for single-marker generation (separate from batch workers)
+SINGLE_GENERATION_WORKERS = 2
+
+# Sample rate of pydub's AudioSegment.silent(), the base of an assembly
+SILENT_FRAME_RATE = 11025
+
+# Batch UI refreshes are coalesced: at most one per REFRESH_INTERVAL_MS,
+# except that progress is shown at once every PROGRESS_FLUSH_EVERY markers
+REFRESH_INTERVAL_MS = 100
+PROGRESS_FLUSH_EVERY = 10
+
+# Auto-assembly waits this long after the last trigger, so a burst of
+# generations (or a batch finishing) is assembled once
+AUTO_ASSEMBLE_DEBOUNCE_MS = 1000
+
 
 class BatchProgressWindow:
     """Modal window showing progress for batch audio generation"""
 
-    def __init__(self, parent, operation_name, total_markers):
+    def __init__(self, parent, operation_name, total_markers, on_cancel=None):
         self.parent = parent
         self.operation_name = operation_name
         self.total_markers = total_markers
@@ -38,6 +99,14 @@ class BatchProgressWindow:
         self.failed_count = 0
         self.cancelled = False
 
+        # Called on cancel to stop workers waiting on rate limits or retries
+        self._on_cancel = on_cancel
+
+        # Latest progress waiting to be drawn (see _schedule_flush)
+        self._pending_marker = None
+        self._flush_after_id = None
+        self._flushed_completed = 0
+
         # Create modal window
         self.window = tk.Toplevel(parent.root)
         self.window.title(f"Batch Generation - {operation_name}")
@@ -60,9 +129,10 @@ class BatchProgressWindow:
         ).pack(pady=20)
 
         # Current marker label
+        self.marker_var = tk.StringVar(value="Starting...")
         self.marker_label = tk.Label(
             self.window,
-            text="Starting...",
+            textvariable=self.marker_var,
             font=("Arial", 10)
         )
         self.marker_label.pack(pady=10)
@@ -79,9 +149,10 @@ class BatchProgressWindow:
         self.progress_bar.pack(pady=10)
 
         # Status label
+        self.status_var = tk.StringVar(value=f"0 / {total_markers} completed")
         self.status_label = tk.Label(
             self.window,
-            text=f"0 / {total_markers} completed",
+            textvariable=self.status_var,
             font=("Arial", 9)
         )
         self.status_label.pack(pady=5)
@@ -103,18 +174,48 @@ class BatchProgressWindow:
         self.window.protocol("WM_DELETE_WINDOW", self.cancel)
 
     def update_progress(self, current_idx, marker_name, marker_type):
-        """Update progress display for current marker"""
+        """Update progress display for current marker (drawn by _flush)"""
         self.current_index = current_idx
-        self.progress_var.set(current_idx)
+        self._pending_marker = (marker_name, marker_type, 0)
+        self._schedule_flush()
 
-        self.marker_label.config(
-            text=f"Generating {marker_type.upper()}: {marker_name}"
-        )
+    def mark_retry(self, marker_name, marker_type, attempt):
+        """Show that a marker's request is being retried (drawn by _flush)"""
+        self._pending_marker = (marker_name, marker_type, attempt)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Coalesce progress redraws to one per REFRESH_INTERVAL_MS"""
+        completed = self.success_count + self.failed_count
+        if completed - self._flushed_completed >= PROGRESS_FLUSH_EVERY:
+            # Enough markers finished that the display should catch up now
+            if self._flush_after_id is not None:
+                self.window.after_cancel(self._flush_after_id)
+            self._flush()
+        elif self._flush_after_id is None:
+            self._flush_after_id = self.window.after(REFRESH_INTERVAL_MS, self._flush)
+
+    def _flush(self):
+        """Draw the latest progress state"""
+        self._flush_after_id = None
+        if self.cancelled:
+            return
 
         completed = self.success_count + self.failed_count
-        self.status_label.config(
-            text=f"{completed} / {self.total_markers} completed "
-                 f"({self.success_count} success, {self.failed_count} failed)"
+        self._flushed_completed = completed
+        self.progress_var.set(self.current_index)
+
+        if self._pending_marker is not None:
+            marker_name, marker_type, attempt = self._pending_marker
+            if attempt:
+                text = f"Retrying {marker_type.upper()}: {marker_name} ({attempt}/{RETRY_ATTEMPTS})…"
+            else:
+                text = f"Generating {marker_type.upper()}: {marker_name}"
+            self.marker_var.set(text)
+
+        self.status_var.set(
+            f"{completed} / {self.total_markers} completed "
+            f"({self.success_count} success, {self.failed_count} failed)"
         )
 
     def mark_success(self):
@@ -128,11 +229,16 @@ class BatchProgressWindow:
     def cancel(self):
         """Cancel batch operation"""
         self.cancelled = True
+        if self._on_cancel:
+            self._on_cancel()
         self.close()
 
     def close(self):
         """Close the progress window"""
         try:
+            if self._flush_after_id is not None:
+                self.window.after_cancel(self._flush_after_id)
+                self._flush_after_id = None
             self.window.destroy()
         except:
             pass
@@ -174,6 +280,28 @@ class AudioGenerationService:
     - Progress tracking and error handling
     """
 
+    # Long-lived workers for batch generation requests, so repeated batches
+    # reuse threads and the thread count stays bounded
+    _executor = ThreadPoolExecutor(
+        max_workers=max(4, BATCH_MAX_CONCURRENCY),
+        thread_name_prefix="audio-gen"
+    )
+
+    # Single-marker requests get their own workers, so a click isn't queued
+    # behind batch markers waiting on rate limits or retry backoff
+    _single_executor = ThreadPoolExecutor(
+        max_workers=SINGLE_GENERATION_WORKERS,
+        thread_name_prefix="audio-gen-single"
+    )
+
+    # Set by shutdown() so requests waiting on rate limits or retry backoff
+    # stop instead of keeping the app alive
+    _shutdown_event = threading.Event()
+
+    # Cancel callbacks of running batches (see _run_batch_generation)
+    _batch_cancels = set()
+    _batch_cancels_lock = threading.Lock()
+
     def __init__(self, gui_ref):
         """
         Initialize audio generation service
@@ -183,10 +311,142 @@ class AudioGenerationService:
         """
         self.gui = gui_ref
 
+        # One requests-per-minute window per API (quotas may differ by service)
+        self._rpm_limiters = {
+            marker_type: RpmLimiter(PLAN_PROFILE["rpm"])
+            for marker_type in ('sfx', 'voice', 'music')
+        }
+
+        # Batch marker list refreshes (see _refresh_marker_list)
+        self._last_marker_list_refresh = 0.0
+        self._marker_list_refresh_pending = False
+
+        # Pending debounced auto-assembly (see auto_assemble_audio)
+        self._assemble_debounce_id = None
+
+    @classmethod
+    def shutdown(cls):
+        """Stop accepting generation work and drop queued requests (app exit)"""
+        cls._shutdown_event.set()
+        with cls._batch_cancels_lock:
+            batch_cancels = list(cls._batch_cancels)
+        for cancel_batch in batch_cancels:
+            cancel_batch()
+        cls._executor.shutdown(wait=False, cancel_futures=True)
+        cls._single_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _post(self, callback, *args):
+        """
+        Schedule a callback on the main thread from a worker thread
+
+        Once shutdown() has started the Tk root may already be destroyed,
+        so callbacks are dropped instead of raising TclError.
+
+        Args:
+            callback: Function to run on the main thread
+            *args: Arguments for callback
+        """
+        if self._shutdown_event.is_set():
+            return
+        try:
+            self.gui.root.after(0, callback, *args)
+        except (tk.TclError, RuntimeError):
+            if not self._shutdown_event.is_set():
+                raise
+
     def is_api_available(self):
         """Check if ElevenLabs API is available"""
         return generate_sfx is not None and generate_voice is not None and generate_music is not None
 
+    def _refresh_marker_list(self):
+        """
+        Refresh the marker list, at most once per REFRESH_INTERVAL_MS
+
+        The first call redraws at once; calls within the interval after it
+        schedule a single trailing redraw, so the final state is always shown.
+        Must be called on the main thread.
+        """
+        if self._marker_list_refresh_pending:
+            return
+
+        wait_ms = int((self._last_marker_list_refresh - time.monotonic()) * 1000) + REFRESH_INTERVAL_MS
+        if wait_ms <= 0:
+            self._refresh_marker_list_now()
+        else:
+            self._marker_list_refresh_pending = True
+            self.gui.root.after(wait_ms, self._refresh_marker_list_now)
+
+    def _refresh_marker_list_now(self):
+        """Redraw the marker list (runs a throttled refresh)"""
+        self._marker_list_refresh_pending = False
+        self._last_marker_list_refresh = time.monotonic()
+        self.gui.update_marker_list()
+
+    def _call_api(self, marker_type, api_function, *args, cancel_event=None, **kwargs):
+        """
+        Call an ElevenLabs generate function within the plan's request rate
+
+        Waits for room in the marker type's requests-per-minute window first,
+        and holds back further requests when the API answers with Retry-After.
+
+        Args:
+            marker_type: Type of marker (sfx/voice/music)
+            api_function: generate_sfx, generate_voice or generate_music
+            *args, **kwargs: Arguments for api_function
+            cancel_event: Optional threading.Event that abandons the wait
+
+        Returns:
+            Result dict from api_function, or a failure with 'cancelled' set
+            if cancel_event was set before the request was sent
+        """
+        limiter = self._rpm_limiters[marker_type]
+        if not limiter.wait_if_throttled(cancel_event):
+            return {'success': False, 'error': 'Cancelled', 'cancelled': True}
+
+        result = api_function(*args, **kwargs)
+
+        if result and result.get('retry_after'):
+            limiter.pause(result['retry_after'])
+        return result
+
+    @staticmethod
+    def _validate_prompt(marker):
+        """
+        Check a marker has the prompt fields its type needs
+
+        Args:
+            marker: Marker dict
+
+        Returns:
+            Error message, or None if the marker can be generated
+        """
+        required = _REQUIRED_PROMPT_FIELDS.get(marker.get('type'))
+        if required and not (marker.get('prompt_data') or {}).get(required[0]):
+            return required[1]
+        return None
+
+    def _request_audio(self, marker_type, prompt_data, output_path, cancel_event=None):
+        """
+        Generate audio for one marker with the API function for its type
+
+        Args:
+            marker_type: Type of marker (sfx/voice/music)
+            prompt_data: Marker's prompt data
+            output_path: Where to save the generated audio
+            cancel_event: Optional threading.Event that abandons rate-limit waits
+
+        Returns:
+            Result dict from the generate function, or None for an unknown type
+        """
+        if marker_type not in _DISPATCH:
+            return None
+
+        api_function, prompt_args = _DISPATCH[marker_type]
+        kwargs = {arg: prompt_data.get(key, default) for arg, key, default in prompt_args}
+        return self._call_api(
+            marker_type, api_function, output_path=output_path, cancel_event=cancel_event, **kwargs
+        )
+
     # ========================================================================
     # SINGLE MARKER GENERATION
     # ========================================================================
@@ -214,8 +474,18 @@ class AudioGenerationService:
         marker_type = marker['type']
         prompt_data = marker.get('prompt_data', {})
 
-        # Store old state for undo
-        old_marker_state = marker.copy()
+        # Check the prompt before creating a version or calling the API
+        error_msg = self._validate_prompt(marker)
+        if error_msg:
+            messagebox.showerror(
+                "Generation Failed",
+                f"Failed to generate audio for marker:\n{marker.get('name', '(unnamed)')}\n\n"
+                f"Error: {error_msg}"
+            )
+            return
+
+        # Store old state for undo (deep: generation changes the versions in place)
+        old_marker_state = copy.deepcopy(marker)
 
         # Set status to generating
         current_version_data = self.gui.get_current_version_data(marker)
@@ -228,13 +498,11 @@ class AudioGenerationService:
         # Show progress bar at 0%
         self.gui.show_marker_progress(marker_index)
 
-        # Start generation in background thread
-        thread = threading.Thread(
-            target=self._generate_audio_background,
-            args=(marker_index, marker_type, prompt_data, old_marker_state),
-            daemon=True
+        # Start generation on the single-marker worker pool
+        self._single_executor.submit(
+            self._generate_audio_background,
+            marker_index, marker_type, prompt_data, old_marker_state
         )
-        thread.start()
 
     def _generate_audio_background(self, marker_index, marker_type, prompt_data, old_marker_state):
         """
@@ -248,7 +516,7 @@ class AudioGenerationService:
         """
         try:
             # Update progress: 10% - Starting
-            self.gui.root.after(0, lambda: self.gui.update_marker_progress(marker_index, 10))
+            self._post(lambda: self.gui.update_marker_progress(marker_index, 10))
 
             marker = self.gui.markers[marker_index]
 
@@ -265,44 +533,24 @@ class AudioGenerationService:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
             # Update progress: 30% - Prepared, about to call API
-            self.gui.root.after(0, lambda: self.gui.update_marker_progress(marker_index, 30))
-
-            # Call appropriate API function
-            result = None
-            if marker_type == 'sfx':
-                description = prompt_data.get('description', '')
-                if not description:
-                    raise ValueError("SFX description is required")
-                # Update progress: 50% - Calling API
-                self.gui.root.after(0, lambda: self.gui.update_marker_progress(marker_index, 50))
-                result = generate_sfx(description=description, output_path=output_path)
-
-            elif marker_type == 'voice':
-                voice_profile = prompt_data.get('voice_profile', '')
-                text = prompt_data.get('text', '')
-                if not text:
-                    raise ValueError("Voice text is required")
-                # Update progress: 50% - Calling API
-                self.gui.root.after(0, lambda: self.gui.update_marker_progress(marker_index, 50))
-                result = generate_voice(voice_profile=voice_profile, text=text, output_path=output_path)
-
-            elif marker_type == 'music':
-                positive_styles = prompt_data.get('positiveGlobalStyles', [])
-                negative_styles = prompt_data.get('negativeGlobalStyles', [])
-                sections = prompt_data.get('sections', [])
-                if not positive_styles:
-                    raise ValueError("Music requires at least one positive style")
-                # Update progress: 50% - Calling API
-                self.gui.root.after(0, lambda: self.gui.update_marker_progress(marker_index, 50))
-                result = generate_music(
-                    positive_styles=positive_styles,
-                    negative_styles=negative_styles,
-                    sections=sections,
-                    output_path=output_path
-                )
+            self._post(lambda: self.gui.update_marker_progress(marker_index, 30))
+
+            # Update progress: 50% - Calling API
+            self._post(lambda: self.gui.update_marker_progress(marker_index, 50))
+            result = self._request_audio(marker_type, prompt_data, output_path, self._shutdown_event)
+
+            # Throttled and transient failures are retried with backoff (the
+            # wait ends early if the app is closing)
+            for attempt in range(RETRY_ATTEMPTS):
+                if not is_retriable(result):
+                    break
+                print(f"  ↻ Retrying {marker_type} '{marker_name}' ({attempt + 1}/{RETRY_ATTEMPTS})")
+                if self._shutdown_event.wait(retry_delay(attempt, result.get('retry_after'))):
+                    return
+                result = self._request_audio(marker_type, prompt_data, output_path, self._shutdown_event)
 
             # Update progress: 90% - API call complete
-            self.gui.root.after(0, lambda: self.gui.update_marker_progress(marker_index, 90))
+            self._post(lambda: self.gui.update_marker_progress(marker_index, 90))
 
             # Check if generation succeeded
             if result and result.get('success'):
@@ -314,16 +562,16 @@ class AudioGenerationService:
                     current_version_data['asset_id'] = result.get('asset_id', f'{marker_type}_{next_version}')
 
                 # Schedule UI update on main thread
-                self.gui.root.after(0, lambda: self._on_generation_success(marker_index, old_marker_state))
+                self._post(lambda: self._on_generation_success(marker_index, old_marker_state))
             else:
                 # Generation failed
                 error_msg = result.get('error', 'Unknown error') if result else 'No response from API'
-                self.gui.root.after(0, lambda: self._on_generation_failed(marker_index, error_msg))
+                self._post(lambda: self._on_generation_failed(marker_index, error_msg))
 
         except Exception as e:
             # Handle any errors
             error_msg = str(e)
-            self.gui.root.after(0, lambda: self._on_generation_failed(marker_index, error_msg))
+            self._post(lambda: self._on_generation_failed(marker_index, error_msg))
 
     def _on_generation_success(self, marker_index, old_marker_state):
         """
@@ -339,8 +587,8 @@ class AudioGenerationService:
         self.gui.update_marker_progress(marker_index, 100)
 
         # Create undo command
+        # (execute() snapshots the generated marker as the redo state)
         command = GenerateAudioCommand(self.gui.marker_repository, marker_index, old_marker_state)
-        command.new_marker_state = self.gui.markers[marker_index].copy()
         self.gui.history.execute_command(command)
 
         # Update UI
@@ -559,159 +807,268 @@ class AudioGenerationService:
             f"Generate All {marker_type.upper()}"
         )
 
-    def _run_batch_generation(self, markers_list, operation_name):
+    def _run_batch_generation(self, markers_list, operation_name, concurrency=BATCH_CONCURRENCY):
         """
         Run batch generation for a list of markers
 
+        Markers are generated on the shared worker pool. A RateController starts at
+        `concurrency` simultaneous API requests, raises the limit while calls
+        succeed and cuts it when the API throttles. Results are applied on
+        the main thread as each request completes.
+
         Args:
             markers_list: List of (index, marker) tuples to generate
             operation_name: Display name for the operation
+            concurrency: Initial number of simultaneous API requests
         """
+        # Leave out markers whose prompt is incomplete and report them together
+        invalid = []
+        valid = []
+        for marker_index, marker in markers_list:
+            error_msg = self._validate_prompt(marker)
+            if error_msg:
+                invalid.append((marker.get('name', '(unnamed)'), error_msg))
+            else:
+                valid.append((marker_index, marker))
+
+        if invalid:
+            shown = "\n".join(f"• {name}: {error_msg}" for name, error_msg in invalid[:10])
+            if len(invalid) > 10:
+                shown += f"\n... and {len(invalid) - 10} more"
+            messagebox.showwarning(
+                "Incomplete Markers Skipped",
+                f"{len(invalid)} marker(s) can't be generated and will be skipped:\n\n{shown}"
+            )
+            if not valid:
+                return
+            markers_list = valid
+
+        rate_controller = RateController(initial=concurrency, c_max=BATCH_MAX_CONCURRENCY)
+
+        # Set when the batch is cancelled or the app shuts down; wakes workers
+        # waiting for a slot, the RPM window or a retry
+        cancel_event = threading.Event()
+
+        def cancel_batch():
+            # Any thread
+            cancel_event.set()
+            rate_controller.cancel()
+
+        with self._batch_cancels_lock:
+            self._batch_cancels.add(cancel_batch)
+
         # Create progress window
-        progress = BatchProgressWindow(self.gui, operation_name, len(markers_list))
+        progress = BatchProgressWindow(self.gui, operation_name, len(markers_list), on_cancel=cancel_batch)
+
+        # Status each started marker had before it showed as generating
+        previous_status = {}
+
+        def on_marker_started(marker_index, marker_name, marker_type):
+            # Main thread: show the marker as generating (⏳)
+            previous_status[marker_index] = self._on_batch_generation_started(marker_index)
+            if not progress.cancelled:
+                completed = progress.success_count + progress.failed_count
+                progress.update_progress(completed, marker_name, marker_type)
+
+        def on_marker_retry(marker_name, marker_type, attempt):
+            # Main thread: a failed request will be tried again
+            print(f"  ↻ Retrying {marker_type} '{marker_name}' ({attempt}/{RETRY_ATTEMPTS})")
+            if not progress.cancelled:
+                progress.mark_retry(marker_name, marker_type, attempt)
+
+        def on_marker_cancelled(marker_index):
+            # Main thread: cancelled before its request was sent
+            self._on_batch_generation_cancelled(marker_index, previous_status.get(marker_index))
+
+        def on_marker_complete(marker_index, marker_name, marker_type, result):
+            # Main thread: apply one finished request
+            if result['success']:
+                self._on_batch_generation_success(
+                    marker_index, result['asset_file'], result['asset_id'], result['size_bytes']
+                )
+                progress.mark_success()
+            else:
+                self._on_batch_generation_failed(marker_index, result['error'])
+                progress.mark_failed()
+
+            if not progress.cancelled:
+                completed = progress.success_count + progress.failed_count
+                progress.update_progress(completed, marker_name, marker_type)
+
+        def on_batch_complete():
+            # Main thread: every request has finished (or was cancelled)
+            with self._batch_cancels_lock:
+                self._batch_cancels.discard(cancel_batch)
 
-        # Process markers one at a time (queue-based)
-        def process_next_marker(current_idx=0):
-            # Check if cancelled
             if progress.cancelled:
                 progress.show_summary()
                 return
 
-            # Check if done
-            if current_idx >= len(markers_list):
-                progress.close()
-                progress.show_summary()
+            progress.close()
+            progress.show_summary()
 
-                # Trigger auto-assembly if enabled
-                self.auto_assemble_audio()
+            # Trigger auto-assembly if enabled
+            self.auto_assemble_audio()
+
+        def generate(marker_index, marker_name, marker_type):
+            # Worker thread: wait for a request slot, then skip markers still
+            # waiting when the batch is cancelled (requests already sent finish).
+            # Throttled and transient failures are retried with backoff; the
+            # slot is given back while waiting. cancel_event ends every wait
+            # early and is checked again before each request.
+            result = None
+            for attempt in range(RETRY_ATTEMPTS + 1):
+                with rate_controller.slot() as acquired:
+                    if not acquired or cancel_event.is_set():
+                        break
+                    if attempt == 0:
+                        self._post(on_marker_started, marker_index, marker_name, marker_type)
+                    started = time.monotonic()
+                    attempt_result = self._generate_marker_for_batch(marker_index, cancel_event)
+                    if attempt_result.get('cancelled'):
+                        # Cancelled while waiting for the RPM window; nothing was sent
+                        if result is None:
+                            self._post(on_marker_cancelled, marker_index)
+                        break
+                    result = attempt_result
+                    rate_controller.record(result, time.monotonic() - started)
+
+                if result['success'] or attempt == RETRY_ATTEMPTS or not is_retriable(result):
+                    break
+                self._post(on_marker_retry, marker_name, marker_type, attempt + 1)
+                cancel_event.wait(retry_delay(attempt, result.get('retry_after')))
+
+            if result is None:
                 return
 
-            # Get next marker
-            marker_index, marker = markers_list[current_idx]
-            marker_name = marker.get('name', '(unnamed)')
-            marker_type = marker['type']
+            # Hand the result to the main thread
+            self._post(on_marker_complete, marker_index, marker_name, marker_type, result)
 
-            # Update progress display
-            progress.update_progress(current_idx, marker_name, marker_type)
+        # Markers not yet settled; the last one to finish reports the batch done
+        remaining = [len(markers_list)]
+        remaining_lock = threading.Lock()
 
-            # Generate audio (synchronously in this context)
-            def on_generation_complete(success):
-                if success:
-                    progress.mark_success()
-                else:
-                    progress.mark_failed()
+        def on_marker_done(future):
+            # Worker thread, after generate() returned or raised
+            with remaining_lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished:
+                self._post(on_batch_complete)
 
-                # Process next marker after a short delay
-                self.gui.root.after(500, lambda: process_next_marker(current_idx + 1))
+        if not markers_list:
+            self.gui.root.after(0, on_batch_complete)
+            return
 
-            # Start generation for this marker
-            self._generate_marker_for_batch(marker_index, on_generation_complete)
+        # Create each output directory once instead of per request
+        for marker_type in {marker['type'] for _, marker in markers_list}:
+            os.makedirs(os.path.join("generated_audio", marker_type), exist_ok=True)
 
-        # Start processing first marker
-        process_next_marker(0)
+        for marker_index, marker in markers_list:
+            marker_name = marker.get('name', '(unnamed)')
+            marker_type = marker['type']
+            future = self._executor.submit(generate, marker_index, marker_name, marker_type)
+            future.add_done_callback(on_marker_done)
 
-    def _generate_marker_for_batch(self, marker_index, completion_callback):
+    def _generate_marker_for_batch(self, marker_index, cancel_event=None):
         """
-        Generate audio for a single marker in batch mode
+        Generate audio for a single marker in batch mode (runs on a worker thread)
 
         Args:
             marker_index: Index of marker to generate
-            completion_callback: Function to call with success/failure (bool)
+            cancel_event: Optional threading.Event that abandons rate-limit waits
+
+        Returns:
+            Dict with 'success' plus 'asset_file', 'asset_id' and 'size_bytes'
+            on success, or 'error' on failure ('cancelled' is set if the
+            request was never sent)
         """
         if not (0 <= marker_index < len(self.gui.markers)):
-            completion_callback(False)
-            return
+            return {'success': False, 'error': 'Marker no longer exists'}
 
         # Check if API functions are available
         if not self.is_api_available():
-            completion_callback(False)
-            return
+            return {'success': False, 'error': 'ElevenLabs API not available'}
 
         marker = self.gui.markers[marker_index]
         marker_type = marker['type']
         prompt_data = marker.get('prompt_data', {})
-        old_marker_state = marker.copy()
 
-        # Set status to generating
-        current_version_data = self.gui.get_current_version_data(marker)
-        if current_version_data:
-            current_version_data['status'] = 'generating'
-
-        # Update UI to show generating status (⏳)
-        self.gui.update_marker_list()
-
-        # Start generation in background thread
-        def on_success(marker_idx, asset_file, asset_id, size_bytes):
-            self._on_batch_generation_success(marker_idx, asset_file, asset_id, size_bytes)
-            completion_callback(True)
-
-        def on_failed(marker_idx, error_msg):
-            # Update status but don't show messagebox (batch mode)
-            marker = self.gui.markers[marker_idx]
-            current_version_data = self.gui.get_current_version_data(marker)
-            if current_version_data:
-                current_version_data['status'] = 'failed'
-            self.gui.update_marker_list()
-            completion_callback(False)
-
-        thread = threading.Thread(
-            target=self._generate_audio_background_for_batch,
-            args=(marker_index, marker_type, prompt_data, old_marker_state, on_success, on_failed),
-            daemon=True
-        )
-        thread.start()
-
-    def _generate_audio_background_for_batch(self, marker_index, marker_type, prompt_data, old_marker_state, success_callback, failure_callback):
-        """
-        Background thread function for batch generation
-        (Modified version that uses callbacks instead of root.after)
-        """
         try:
-            # Prepare output directory
+            # Output directory (created once per batch by _run_batch_generation)
             output_dir = os.path.join("generated_audio", marker_type)
-            os.makedirs(output_dir, exist_ok=True)
 
             # Generate unique filename
-            marker = self.gui.markers[marker_index]
             current_version = marker.get('current_version', 1)
-            marker_name = marker.get('name', '(unnamed)')
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             base_filename = f"{marker_type.upper()}_{marker_index:05d}_v{current_version}_{timestamp}.mp3"
             output_path = os.path.join(output_dir, base_filename)
 
             # Call appropriate API based on type
-            result = None
-            if marker_type == 'sfx':
-                description = prompt_data.get('description', '')
-                result = generate_sfx(description, output_path)
-
-            elif marker_type == 'voice':
-                voice_profile = prompt_data.get('voice_profile', '')
-                text = prompt_data.get('text', '')
-                result = generate_voice(voice_profile, text, output_path)
-
-            elif marker_type == 'music':
-                positive_styles = prompt_data.get('positiveGlobalStyles', [])
-                negative_styles = prompt_data.get('negativeGlobalStyles', [])
-                sections = prompt_data.get('sections', [])
-                result = generate_music(positive_styles, negative_styles, sections, output_path)
+            result = self._request_audio(marker_type, prompt_data, output_path, cancel_event)
 
             # Check result
             if result and result.get('success'):
-                asset_file = base_filename
-                asset_id = result.get('asset_id')
-                size_bytes = result.get('size_bytes', 0)
+                return {
+                    'success': True,
+                    'asset_file': base_filename,
+                    'asset_id': result.get('asset_id'),
+                    'size_bytes': result.get('size_bytes', 0)
+                }
+
+            if not result:
+                return {'success': False, 'error': 'No result returned'}
+
+            # Keep the HTTP details the rate controller and retries look at
+            failure = {'success': False, 'error': result.get('error', 'Unknown error')}
+            for key in ('status_code', 'retry_after', 'cancelled'):
+                if key in result:
+                    failure[key] = result[key]
+            return failure
 
-                # Call success callback
-                success_callback(marker_index, asset_file, asset_id, size_bytes)
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
 
-            else:
-                error_msg = result.get('error', 'Unknown error') if result else 'No result returned'
-                failure_callback(marker_index, error_msg)
+    def _on_batch_generation_started(self, marker_idx):
+        """
+        Called when a marker's batch request starts
+        (Sets the generating status shown in the marker list)
 
-        except Exception as e:
-            error_msg = str(e)
-            failure_callback(marker_index, error_msg)
+        Returns:
+            The status the marker had before, or None
+        """
+        marker = self.gui.markers[marker_idx]
+        current_version_data = self.gui.get_current_version_data(marker)
+        previous_status = None
+        if current_version_data:
+            previous_status = current_version_data.get('status')
+            current_version_data['status'] = 'generating'
+
+        # Update UI to show generating status (⏳)
+        self._refresh_marker_list()
+        return previous_status
+
+    def _on_batch_generation_cancelled(self, marker_idx, previous_status):
+        """
+        Called when a started marker's request was cancelled before it was sent
+        (Puts back the status it had before the batch)
+        """
+        marker = self.gui.markers[marker_idx]
+        current_version_data = self.gui.get_current_version_data(marker)
+        if current_version_data and previous_status is not None:
+            current_version_data['status'] = previous_status
+        self._refresh_marker_list()
+
+    def _on_batch_generation_failed(self, marker_idx, error_msg):
+        """
+        Called after failed generation in batch mode
+        (Updates status but doesn't show messagebox)
+        """
+        marker = self.gui.markers[marker_idx]
+        current_version_data = self.gui.get_current_version_data(marker)
+        if current_version_data:
+            current_version_data['status'] = 'failed'
+        self._refresh_marker_list()
 
     def _on_batch_generation_success(self, marker_idx, asset_file, asset_id, size_bytes):
         """
@@ -727,7 +1084,7 @@ class AudioGenerationService:
             current_version_data['asset_id'] = asset_id
 
         # Update UI
-        self.gui.update_marker_list()
+        self._refresh_marker_list()
 
         # Update waveform in multi-track display
         self.gui.update_marker_waveform_in_track(marker_idx)
@@ -740,36 +1097,35 @@ class AudioGenerationService:
         """
         Automatically assemble audio after generation completes
         (called if auto_assemble_enabled is True)
+
+        Debounced: each call restarts an AUTO_ASSEMBLE_DEBOUNCE_MS timer and
+        only the last call in a burst assembles. Must be called on the main thread.
         """
         if not self.gui.auto_assemble_enabled.get():
             return
 
-        # Only assemble if there are markers with generated audio
-        try:
-            has_audio = False
-            for idx, m in enumerate(self.gui.markers):
-                version_data = self.gui.get_current_version_data(m)
-                print(f"DEBUG: Marker {idx} version_data type: {type(version_data)}, value: {version_data}")
-                if version_data:
-                    if not isinstance(version_data, dict):
-                        print(f"ERROR: version_data for marker {idx} is not a dict! Type: {type(version_data)}")
-                        continue
-                    status = version_data.get('status')
-                    if status == 'generated':
-                        has_audio = True
-                        break
-        except Exception as e:
-            print(f"ERROR in auto_assemble_audio has_audio check: {e}")
-            import traceback
-            traceback.print_exc()
+        if self._assemble_debounce_id is not None:
+            self.gui.root.after_cancel(self._assemble_debounce_id)
+        self._assemble_debounce_id = self.gui.root.after(
+            AUTO_ASSEMBLE_DEBOUNCE_MS, self._do_auto_assemble
+        )
+
+    def _do_auto_assemble(self):
+        """Run a debounced auto-assembly (scheduled by auto_assemble_audio)"""
+        self._assemble_debounce_id = None
+
+        # The setting may have been turned off while waiting
+        if not self.gui.auto_assemble_enabled.get():
             return
 
-        if not has_audio:
+        # Only assemble if there are markers with generated audio
+        markers_with_audio = self._collect_markers_with_audio()
+        if not markers_with_audio:
             print("DEBUG: No generated audio found, skipping assembly")
             return
 
-        # Perform assembly
-        self._assemble_audio_internal(auto=True)
+        # Perform assembly (reusing the scan above)
+        self._assemble_audio_internal(auto=True, markers_with_audio=markers_with_audio)
 
     def manual_assemble_audio(self):
         """
@@ -778,12 +1134,58 @@ class AudioGenerationService:
         # Perform assembly
         self._assemble_audio_internal(auto=False)
 
-    def _assemble_audio_internal(self, auto=False):
+    @staticmethod
+    def _try_load_pcm(path):
+        """
+        Decode a file for assembly without raising
+
+        Args:
+            path: Audio file path
+
+        Returns:
+            (samples, sample_rate) from load_pcm, or (None, error) if it failed
+        """
+        try:
+            return load_pcm(path)
+        except Exception as e:
+            return None, e
+
+    def _collect_markers_with_audio(self):
+        """
+        Find the markers whose current version has generated audio
+
+        Returns:
+            List of (marker, asset_file) tuples in marker order
+        """
+        markers_with_audio = []
+        for idx, marker in enumerate(self.gui.markers):
+            try:
+                # Debug: check marker type
+                if not isinstance(marker, dict):
+                    print(f"WARNING: Marker at index {idx} is not a dict: {type(marker)} = {marker}")
+                    continue
+
+                current_version_data = self.gui.get_current_version_data(marker)
+                if current_version_data:
+                    status = current_version_data.get('status')
+                    asset_file = current_version_data.get('asset_file')
+                    if status == 'generated' and asset_file:
+                        markers_with_audio.append((marker, asset_file))
+            except Exception as e:
+                print(f"Error processing marker at index {idx}: {e}")
+                print(f"Marker type: {type(marker)}, value: {marker}")
+                import traceback
+                traceback.print_exc()
+        return markers_with_audio
+
+    def _assemble_audio_internal(self, auto=False, markers_with_audio=None):
         """
         Internal method to assemble all marker audio files into a single output
 
         Args:
             auto: True if auto-triggered, False if manual
+            markers_with_audio: (marker, asset_file) list from
+                _collect_markers_with_audio (scanned here if None)
         """
         try:
             # Check if we have any markers
@@ -816,25 +1218,8 @@ class AudioGenerationService:
                 return
 
             # Collect markers with generated audio
-            markers_with_audio = []
-            for idx, marker in enumerate(self.gui.markers):
-                try:
-                    # Debug: check marker type
-                    if not isinstance(marker, dict):
-                        print(f"WARNING: Marker at index {idx} is not a dict: {type(marker)} = {marker}")
-                        continue
-
-                    current_version_data = self.gui.get_current_version_data(marker)
-                    if current_version_data:
-                        status = current_version_data.get('status')
-                        asset_file = current_version_data.get('asset_file')
-                        if status == 'generated' and asset_file:
-                            markers_with_audio.append((marker, asset_file))
-                except Exception as e:
-                    print(f"Error processing marker at index {idx}: {e}")
-                    print(f"Marker type: {type(marker)}, value: {marker}")
-                    import traceback
-                    traceback.print_exc()
+            if markers_with_audio is None:
+                markers_with_audio = self._collect_markers_with_audio()
 
             if not markers_with_audio:
                 messagebox.showinfo(
@@ -844,41 +1229,63 @@ class AudioGenerationService:
                 )
                 return
 
-            # Create silent base track
+            # Find each marker's audio file
+            asset_index = build_asset_index()
+            placements = []
+            for marker, asset_file in markers_with_audio:
+                marker_type = marker['type']
+                marker_name = marker.get('name', '(unnamed)')
+
+                audio_path = resolve_asset_path(asset_index, marker_type, asset_file)
+                if not audio_path:
+                    print(f"WARNING: Audio file not found for marker '{marker_name}': {asset_file}")
+                    continue
+                placements.append((marker, audio_path))
+
+            # Decode every file once, in parallel (decoding releases the GIL;
+            # load_pcm also reuses clips decoded by earlier assemblies)
+            unique_paths = list(dict.fromkeys(path for _, path in placements))
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                decoded_by_path = dict(zip(unique_paths, executor.map(self._try_load_pcm, unique_paths)))
+
+            # Mix into one buffer at the highest rate and channel count present
+            # (what AudioSegment.silent + overlay would have converted everything to)
+            decoded = [clip for clip in decoded_by_path.values() if clip[0] is not None]
+            frame_rate = max([SILENT_FRAME_RATE] + [rate for _, rate in decoded])
+            channels = max([1] + [samples.shape[1] for samples, _ in decoded])
+            total_frames = int(duration * frame_rate / 1000)
+
             print(f"Creating silent base track ({duration}ms)...")
-            assembled = AudioSegment.silent(duration=duration)
+            mix = np.zeros((total_frames, channels), dtype=np.int32)
 
-            # Overlay each marker's audio
+            # Add each marker's audio at its position
             print(f"Assembling {len(markers_with_audio)} audio file(s)...")
-            for marker, asset_file in markers_with_audio:
+            for marker, audio_path in placements:
                 marker_type = marker['type']
                 time_ms = marker['time_ms']
                 marker_name = marker.get('name', '(unnamed)')
 
-                # Find audio file
-                possible_paths = [
-                    os.path.join("generated_audio", marker_type, asset_file),
-                    os.path.join("generated_audio", asset_file),
-                    asset_file
-                ]
-
-                audio_path = None
-                for path in possible_paths:
-                    if os.path.exists(path):
-                        audio_path = path
-                        break
-
-                if not audio_path:
-                    print(f"WARNING: Audio file not found for marker '{marker_name}': {asset_file}")
+                samples, sample_rate = decoded_by_path[audio_path]
+                if samples is None:
+                    print(f"  ✗ Error loading {audio_path}: {sample_rate}")
                     continue
 
-                # Load and overlay audio
-                try:
-                    audio_segment = AudioSegment.from_file(audio_path)
-                    assembled = assembled.overlay(audio_segment, position=time_ms)
-                    print(f"  ✓ Overlayed {marker_type} at {time_ms}ms: {marker_name}")
-                except Exception as e:
-                    print(f"  ✗ Error loading {audio_path}: {e}")
+                clip = AssemblyService._prepare_clip(samples, sample_rate, frame_rate, channels)
+                start = int(time_ms * frame_rate / 1000)
+                if start < 0:
+                    # Starts before the timeline - keep the part that falls inside it
+                    clip = clip[-start:]
+                    start = 0
+                end = min(total_frames, start + len(clip))
+                if end > start:
+                    mix[start:end] += clip[:end - start]
+                print(f"  ✓ Overlayed {marker_type} at {time_ms}ms: {marker_name}")
+
+            # Saturate once at the end, then wrap for export
+            mix = np.clip(mix, -32768, 32767).astype(np.int16)
+            assembled = AudioSegment(
+                mix.tobytes(), frame_rate=frame_rate, sample_width=2, channels=channels
+            )
 
             # Ensure output directory exists
             output_dir = "output"
@@ -5,6 +5,7 @@ Handles audio generation for SFX, Voice, and Music markers
 """
 
 import os
+import httpx
 from dotenv import load_dotenv
 from elevenlabs import ElevenLabs, VoiceSettings
 from pathlib import Path
@@ -18,7 +19,85 @@ API_KEY = os.getenv('ELEVENLABS_API_KEY')
 if not API_KEY:
     raise ValueError("ELEVENLABS_API_KEY not found in .env.local")
 
-client = ElevenLabs(api_key=API_KEY)
+# All requests share one pooled HTTP client. Idle connections are kept for
+# HTTP_KEEPALIVE_S (httpx's default is 5s) so a batch worker's next request
+# reuses its TLS connection instead of handshaking again after every
+# generation.
+HTTP_TIMEOUT_S = 240.0
+HTTP_KEEPALIVE_S = 60.0
+HTTP_MAX_CONNECTIONS = 16
+
+client = ElevenLabs(
+    api_key=API_KEY,
+    timeout=HTTP_TIMEOUT_S,
+    httpx_client=httpx.Client(
+        timeout=HTTP_TIMEOUT_S,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_S
+        )
+    )
+)
+
+# Generation calls make a single attempt: 429/5xx responses come straight
+# back to the caller, whose RateController and retry loop are the only
+# backoff policy (SDK retries would multiply requests and hide throttling)
+GENERATE_REQUEST_OPTIONS = {"max_retries": 0}
+
+
+def _error_details(error: Exception) -> dict:
+    """
+    Pull HTTP details that callers use for rate limiting out of an API error
+
+    Args:
+        error: Exception raised by the ElevenLabs client
+
+    Returns:
+        dict with "status_code" and "retry_after" (seconds) when the error
+        carries them (ApiError responses); empty otherwise
+    """
+    details = {}
+    status_code = getattr(error, 'status_code', None)
+    if status_code is not None:
+        details["status_code"] = status_code
+
+    headers = getattr(error, 'headers', None) or {}
+    retry_after = next((value for key, value in headers.items() if key.lower() == 'retry-after'), None)
+    if retry_after is not None:
+        try:
+            details["retry_after"] = float(retry_after)
+        except ValueError:
+            pass  # HTTP-date form - callers fall back to their own backoff
+    return details
+
+
+def _save_audio(output_path: str, audio_bytes: bytes):
+    """
+    Write generated audio so that output_path only ever holds a complete file
+
+    The bytes go to output_path + ".part" first, are flushed to disk and then
+    renamed over output_path; a failed write removes the partial file.
+
+    Args:
+        output_path: Final path of the audio file
+        audio_bytes: Encoded audio from the API
+    """
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    part_path = output_path + ".part"
+    try:
+        with open(part_path, 'wb') as f:
+            f.write(audio_bytes)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(part_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(part_path)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def generate_sfx(description: str, output_path: str = None) -> dict:
@@ -34,7 +113,8 @@ def generate_sfx(description: str, output_path: str = None) -> dict:
             "success": bool,
             "audio_file": str (path to saved file),
             "asset_id": str (ElevenLabs generation ID),
-            "error": str (if failed)
+            "error": str (if failed),
+            "status_code": int, "retry_after": float (if the API returned them)
         }
     """
     try:
@@ -56,7 +136,8 @@ def generate_sfx(description: str, output_path: str = None) -> dict:
         audio_generator = client.text_to_sound_effects.convert(
             text=description,
             duration_seconds=None,  # Auto-determine duration
-            prompt_influence=0.3    # Balance between prompt and quality
+            prompt_influence=0.3,   # Balance between prompt and quality
+            request_options=GENERATE_REQUEST_OPTIONS
         )
 
         # Collect audio bytes
@@ -73,9 +154,7 @@ def generate_sfx(description: str, output_path: str = None) -> dict:
 
         # Save to file
         if output_path:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'wb') as f:
-                f.write(audio_bytes)
+            _save_audio(output_path, audio_bytes)
             print(f"✓ SFX saved: {output_path}")
 
         return {
@@ -90,7 +169,8 @@ def generate_sfx(description: str, output_path: str = None) -> dict:
         print(f"✗ SFX generation failed: {e}")
         return {
             "success": False,
-            "error": str(e)
+            "error": str(e),
+            **_error_details(e)
         }
 
 
@@ -111,7 +191,8 @@ def generate_voice(voice_profile: str, text: str, output_path: str = None) -> di
             "audio_bytes": bytes,
             "asset_id": str (voice ID used),
             "voice_description": str (description used),
-            "error": str (if failed)
+            "error": str (if failed),
+            "status_code": int, "retry_after": float (if the API returned them)
         }
     """
     try:
@@ -139,7 +220,8 @@ def generate_voice(voice_profile: str, text: str, output_path: str = None) -> di
             voices = client.text_to_voice.design(
                 model_id="eleven_multilingual_ttv_v2",
                 voice_description=voice_profile,
-                text=text
+                text=text,
+                request_options=GENERATE_REQUEST_OPTIONS
             )
 
             if not voices.previews or len(voices.previews) == 0:
@@ -191,7 +273,8 @@ def generate_voice(voice_profile: str, text: str, output_path: str = None) -> di
                 similarity_boost=0.75,
                 style=0.0,
                 use_speaker_boost=True
-            )
+            ),
+            request_options=GENERATE_REQUEST_OPTIONS
         )
 
         # Collect audio bytes
@@ -208,9 +291,7 @@ def generate_voice(voice_profile: str, text: str, output_path: str = None) -> di
 
         # Save to file
         if output_path:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'wb') as f:
-                f.write(audio_bytes)
+            _save_audio(output_path, audio_bytes)
             print(f"✓ Voice saved: {output_path}")
 
         print(f"\n✓ Voice generation successful!")
@@ -230,7 +311,8 @@ def generate_voice(voice_profile: str, text: str, output_path: str = None) -> di
         print(f"✗ Voice generation failed: {e}")
         return {
             "success": False,
-            "error": str(e)
+            "error": str(e),
+            **_error_details(e)
         }
 
 
@@ -251,7 +333,8 @@ def generate_music(positive_styles: list, negative_styles: list, sections: list,
             "audio_bytes": bytes,
             "asset_id": str (generation ID),
             "composition_plan": dict (the plan used),
-            "error": str (if failed)
+            "error": str (if failed),
+            "status_code": int, "retry_after": float (if the API returned them)
         }
     """
     try:
@@ -308,7 +391,8 @@ def generate_music(positive_styles: list, negative_styles: list, sections: list,
 
         # Generate music using the dedicated Music API
         audio_generator = client.music.compose(
-            composition_plan=composition_plan
+            composition_plan=composition_plan,
+            request_options=GENERATE_REQUEST_OPTIONS
         )
 
         # Collect audio bytes
@@ -325,9 +409,7 @@ def generate_music(positive_styles: list, negative_styles: list, sections: list,
 
         # Save to file
         if output_path:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'wb') as f:
-                f.write(audio_bytes)
+            _save_audio(output_path, audio_bytes)
             print(f"✓ Music saved: {output_path}")
 
         print(f"\n✓ Music generation successful!")
@@ -362,7 +444,8 @@ def generate_music(positive_styles: list, negative_styles: list, sections: list,
 
         return {
             "success": False,
-            "error": error_msg
+            "error": error_msg,
+            **_error_details(e)
         }
 
 
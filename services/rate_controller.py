@@ -0,0 +1,316 @@
+"""
+Rate Controller - Adaptive concurrency for ElevenLabs requests
+Grows the number of simultaneous API calls while requests succeed and
+backs off when the API pushes back, instead of failing marker after marker.
+
+Concurrency follows AIMD (additive increase, multiplicative decrease):
+each clean success adds `alpha` to the limit, and each throttled, server-error
+or very slow response multiplies it by `beta`. Repeated 429s trip a circuit
+breaker that holds back all new requests for an exponentially growing pause.
+
+RpmLimiter separately caps requests per minute with a sliding window, seeded
+from the account's plan (see PLAN_PROFILES). is_retriable() and retry_delay()
+decide whether and when a failed batch request is tried again.
+"""
+
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+# Error text that means "slow down", for errors without a status_code: the
+# SDK's "status_code: 429" / "status_code: 5xx" messages and timeouts. Only
+# the SDK's own format is matched, so prompts or messages that merely mention
+# 429 or concurrency aren't mistaken for throttling.
+_THROTTLE_ERROR_RE = re.compile(r'status_code:\s*(?:429|5\d\d)\b|timed? ?out', re.IGNORECASE)
+_RATE_LIMIT_ERROR_RE = re.compile(r'status_code:\s*429\b', re.IGNORECASE)
+
+# Dropped or refused connections are also worth retrying
+_NETWORK_ERROR_RE = re.compile(
+    r'connect|connection (?:reset|aborted)|broken pipe|temporar|name resolution',
+    re.IGNORECASE
+)
+
+# Circuit breaker: this many consecutive 429s within the window trip it
+BREAKER_THRESHOLD = 3
+BREAKER_WINDOW_S = 10.0
+
+# Breaker pauses double from BACKOFF_BASE_S up to BACKOFF_MAX_S
+BACKOFF_BASE_S = 1.0
+BACKOFF_MAX_S = 60.0
+
+# Request limits per ElevenLabs plan: "concurrency" is the plan's concurrent
+# request cap, "rpm" a conservative requests-per-minute budget per service
+# (SFX, voice, music). Select with ELEVENLABS_PLAN; ELEVENLABS_RPM overrides rpm.
+PLAN_PROFILES = {
+    "free": {"concurrency": 2, "rpm": 20},
+    "starter": {"concurrency": 3, "rpm": 30},
+    "creator": {"concurrency": 5, "rpm": 60},
+    "pro": {"concurrency": 10, "rpm": 120},
+    "scale": {"concurrency": 15, "rpm": 180},
+    "business": {"concurrency": 15, "rpm": 180},
+}
+DEFAULT_PLAN = "free"
+
+RPM_WINDOW_S = 60.0
+
+# Failed generations are retried up to RETRY_ATTEMPTS more times, waiting
+# RETRY_BASE_DELAY_S * 2**attempt (plus jitter, at most BACKOFF_MAX_S)
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY_S = 1.0
+
+
+def get_plan_profile(plan=None, rpm=None):
+    """
+    Look up request limits for a plan
+
+    Args:
+        plan: Plan name from PLAN_PROFILES (unknown names use DEFAULT_PLAN)
+        rpm: Optional requests-per-minute override
+
+    Returns:
+        Dict with "concurrency" and "rpm"
+    """
+    profile = dict(PLAN_PROFILES.get((plan or DEFAULT_PLAN).lower(), PLAN_PROFILES[DEFAULT_PLAN]))
+    if rpm:
+        profile["rpm"] = int(rpm)
+    return profile
+
+
+def is_retriable(result):
+    """
+    Check whether a failed generation is worth trying again
+
+    Args:
+        result: Result dict from generate_sfx/voice/music (or None)
+
+    Returns:
+        True for throttling (429), server errors (5xx), timeouts and network
+        errors; False for successes and other client errors
+    """
+    result = result or {}
+    if result.get('success'):
+        return False
+
+    status_code = result.get('status_code')
+    if status_code is not None:
+        return status_code == 429 or status_code >= 500
+
+    error = result.get('error') or ''
+    return bool(_THROTTLE_ERROR_RE.search(error) or _NETWORK_ERROR_RE.search(error))
+
+
+def retry_delay(attempt, retry_after=None):
+    """
+    Seconds to wait before retrying a failed generation
+
+    Args:
+        attempt: Number of retries already made (0 for the first retry)
+        retry_after: Server's Retry-After in seconds, if it sent one
+
+    Returns:
+        Exponential backoff with jitter, but never less than retry_after
+    """
+    delay = min(BACKOFF_MAX_S, RETRY_BASE_DELAY_S * (2 ** attempt)) + random.uniform(0, RETRY_BASE_DELAY_S)
+    return max(delay, retry_after or 0)
+
+
+class RateController:
+    """
+    AIMD concurrency limit with a 429 circuit breaker
+
+    Workers hold a slot for the duration of one API call and report the
+    outcome with record(); the limit is re-read whenever a slot frees up,
+    so a larger pool than the current limit can be started up front.
+    """
+
+    def __init__(self, initial=2, c_min=1, c_max=10, alpha=0.5, beta=0.5, latency_target_s=30.0):
+        """
+        Initialize the controller
+
+        Args:
+            initial: Starting concurrency limit
+            c_min: Lowest concurrency limit
+            c_max: Highest concurrency limit
+            alpha: Limit added after each clean success
+            beta: Factor the limit is multiplied by after a throttled response
+            latency_target_s: Responses slower than this count as throttled
+        """
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target_s = latency_target_s
+
+        self._limit = float(min(max(initial, c_min), c_max))
+        self._in_flight = 0
+        self._cancelled = False
+        self._condition = threading.Condition()
+
+        # Circuit breaker state
+        self._rate_limit_times = []
+        self._backoff_level = 0
+        self._paused_until = 0.0
+
+    @property
+    def limit(self):
+        """Current number of requests allowed in flight"""
+        return int(self._limit)
+
+    def acquire(self):
+        """
+        Block until a request may start (under the limit and not paused)
+
+        Returns:
+            True once a slot is taken, False if cancel() was called
+        """
+        with self._condition:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if self._cancelled:
+                    return False
+                if pause > 0:
+                    self._condition.wait(pause)
+                elif self._in_flight >= int(self._limit):
+                    self._condition.wait()
+                else:
+                    self._in_flight += 1
+                    return True
+
+    def release(self):
+        """Give back a slot taken by acquire()"""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def cancel(self):
+        """Wake every waiting acquire() and refuse new slots (any thread)"""
+        with self._condition:
+            self._cancelled = True
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """
+        Hold a request slot for the duration of a with-block
+
+        Yields:
+            True if the slot was taken, False if the controller was cancelled
+        """
+        acquired = self.acquire()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.release()
+
+    def record(self, result, latency_s):
+        """
+        Adjust the limit from one API call's outcome
+
+        Args:
+            result: Result dict from generate_sfx/voice/music (or None)
+            latency_s: Wall-clock duration of the call in seconds
+        """
+        result = result or {}
+        error = result.get('error') or ''
+        status_code = result.get('status_code')
+        rate_limited = status_code == 429 or bool(error and _RATE_LIMIT_ERROR_RE.search(error))
+        throttled = (
+            rate_limited
+            or (status_code is not None and status_code >= 500)
+            or bool(error and _THROTTLE_ERROR_RE.search(error))
+            or latency_s > self.latency_target_s
+        )
+
+        with self._condition:
+            if throttled:
+                self._limit = max(self.c_min, self._limit * self.beta)
+            elif result.get('success'):
+                self._limit = min(self.c_max, self._limit + self.alpha)
+                self._backoff_level = 0
+
+            if rate_limited:
+                self._record_rate_limit(result.get('retry_after'))
+            else:
+                self._rate_limit_times.clear()
+
+            self._condition.notify_all()
+
+    def _record_rate_limit(self, retry_after=None):
+        """Count a 429 and trip the breaker on a burst (call with the lock held)"""
+        now = time.monotonic()
+        self._rate_limit_times = [t for t in self._rate_limit_times if now - t <= BREAKER_WINDOW_S]
+        self._rate_limit_times.append(now)
+
+        if len(self._rate_limit_times) >= BREAKER_THRESHOLD:
+            # Honour the server's Retry-After when it sent one
+            pause = retry_after or min(BACKOFF_MAX_S, BACKOFF_BASE_S * (2 ** self._backoff_level))
+            self._backoff_level += 1
+            self._paused_until = max(self._paused_until, now + pause)
+            self._rate_limit_times.clear()
+            print(f"⚠ ElevenLabs rate limit hit repeatedly - pausing requests for {pause:.0f}s")
+
+
+class RpmLimiter:
+    """
+    Sliding-window requests-per-minute limiter
+
+    Remembers when each of the last `rpm` requests started; a new request
+    waits until the oldest one is a full window old.
+    """
+
+    def __init__(self, rpm, window_s=RPM_WINDOW_S):
+        """
+        Initialize the limiter
+
+        Args:
+            rpm: Requests allowed per window
+            window_s: Window length in seconds
+        """
+        self.rpm = rpm
+        self.window_s = window_s
+        self.window = deque()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def wait_if_throttled(self, cancel_event=None):
+        """
+        Block until another request fits in the window, then count it
+
+        Args:
+            cancel_event: Optional threading.Event that ends the wait early
+
+        Returns:
+            True once the request is counted, False if cancel_event was set
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self.window and now - self.window[0] >= self.window_s:
+                    self.window.popleft()
+
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif len(self.window) >= self.rpm:
+                    wait = self.window_s - (now - self.window[0])
+                else:
+                    self.window.append(now)
+                    return True
+            if cancel_event is None:
+                time.sleep(wait)
+            elif cancel_event.wait(wait):
+                return False
+
+    def pause(self, seconds):
+        """
+        Hold back new requests for a while (e.g. a server Retry-After)
+
+        Args:
+            seconds: Pause length in seconds
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Tests for the adaptive rate controller and retry decisions"""
+
+import threading
+import time
+
+from services.rate_controller import (
+    RateController, RpmLimiter, is_retriable, retry_delay,
+    BREAKER_THRESHOLD, BACKOFF_BASE_S
+)
+
+
+SUCCESS = {'success': True}
+RATE_LIMITED = {'success': False, 'error': 'status_code: 429, body: too_many_concurrent_requests', 'status_code': 429}
+
+
+def test_additive_increase():
+    """Clean successes add alpha to the limit"""
+    controller = RateController(initial=2, c_max=10, alpha=0.5)
+
+    controller.record(SUCCESS, 1.0)
+    assert controller.limit == 2
+    controller.record(SUCCESS, 1.0)
+    assert controller.limit == 3
+
+    print("✓ Additive increase test passed")
+
+
+def test_batch_limit_can_grow():
+    """A batch's controller starts below the plan cap and climbs to it"""
+    from services.audio_service import BATCH_CONCURRENCY, BATCH_MAX_CONCURRENCY
+
+    controller = RateController(initial=BATCH_CONCURRENCY, c_max=BATCH_MAX_CONCURRENCY)
+    assert controller.limit < BATCH_MAX_CONCURRENCY
+
+    for _ in range(4 * BATCH_MAX_CONCURRENCY):
+        controller.record(SUCCESS, 1.0)
+    assert controller.limit == BATCH_MAX_CONCURRENCY
+
+    print("✓ Batch limit growth test passed")
+
+
+def test_multiplicative_decrease():
+    """Throttled, server-error and slow responses multiply the limit by beta"""
+    controller = RateController(initial=8, c_max=10, beta=0.5, latency_target_s=30.0)
+
+    controller.record({'success': False, 'error': 'server error', 'status_code': 503}, 1.0)
+    assert controller.limit == 4
+
+    # A success slower than the latency target counts as throttled
+    controller.record(SUCCESS, 31.0)
+    assert controller.limit == 2
+
+    # Other client errors leave the limit alone
+    controller.record({'success': False, 'error': 'bad prompt', 'status_code': 422}, 1.0)
+    assert controller.limit == 2
+
+    print("✓ Multiplicative decrease test passed")
+
+
+def test_limit_bounds():
+    """The limit stays within c_min and c_max"""
+    controller = RateController(initial=50, c_min=2, c_max=4)
+    assert controller.limit == 4
+
+    for _ in range(10):
+        controller.record(SUCCESS, 1.0)
+    assert controller.limit == 4
+
+    for _ in range(10):
+        controller.record({'success': False, 'error': 'server error', 'status_code': 500}, 1.0)
+    assert controller.limit == 2
+
+    assert RateController(initial=0, c_min=1).limit == 1
+
+    print("✓ Limit bounds test passed")
+
+
+def test_breaker_trips_on_repeated_429s():
+    """BREAKER_THRESHOLD 429s in a row pause new requests"""
+    controller = RateController(initial=4)
+
+    for _ in range(BREAKER_THRESHOLD - 1):
+        controller.record(RATE_LIMITED, 1.0)
+    assert controller._paused_until <= time.monotonic()
+
+    controller.record(RATE_LIMITED, 1.0)
+    pause = controller._paused_until - time.monotonic()
+    assert 0 < pause <= BACKOFF_BASE_S
+
+    print("✓ Breaker trip test passed")
+
+
+def test_breaker_resets_after_success():
+    """A success between 429s starts the count over"""
+    controller = RateController(initial=4)
+
+    for _ in range(BREAKER_THRESHOLD - 1):
+        controller.record(RATE_LIMITED, 1.0)
+    controller.record(SUCCESS, 1.0)
+    controller.record(RATE_LIMITED, 1.0)
+    assert controller._paused_until <= time.monotonic()
+
+    print("✓ Breaker reset test passed")
+
+
+def test_breaker_honours_retry_after():
+    """The breaker pauses for the server's Retry-After when it sent one"""
+    controller = RateController(initial=4)
+
+    for _ in range(BREAKER_THRESHOLD):
+        controller.record(dict(RATE_LIMITED, retry_after=20.0), 1.0)
+    pause = controller._paused_until - time.monotonic()
+    assert 19.0 < pause <= 20.0
+
+    print("✓ Breaker Retry-After test passed")
+
+
+def test_is_retriable_status_codes():
+    """Status codes decide when the API returned one"""
+    assert is_retriable({'success': False, 'error': 'x', 'status_code': 429})
+    assert is_retriable({'success': False, 'error': 'x', 'status_code': 502})
+    assert not is_retriable({'success': False, 'error': 'x', 'status_code': 400})
+
+    # The status code wins over error text
+    assert not is_retriable({'success': False, 'error': 'Read timed out', 'status_code': 401})
+
+    assert not is_retriable(SUCCESS)
+
+    print("✓ is_retriable status code test passed")
+
+
+def test_is_retriable_error_text():
+    """Without a status code, only SDK-shaped, timeout and network errors retry"""
+    assert is_retriable({'success': False, 'error': 'status_code: 429, body: {}'})
+    assert is_retriable({'success': False, 'error': 'status_code: 503, body: {}'})
+    assert is_retriable({'success': False, 'error': 'The read operation timed out'})
+    assert is_retriable({'success': False, 'error': '[Errno 111] Connection refused'})
+
+    # Messages that merely mention 429 or concurrency are not throttling
+    assert not is_retriable({'success': False, 'error': 'Prompt "Room 429" is too long'})
+    assert not is_retriable({'success': False, 'error': 'concurrent edits not allowed'})
+    assert not is_retriable({'success': False, 'error': 'status_code: 4290'})
+    assert not is_retriable(None)
+
+    print("✓ is_retriable error text test passed")
+
+
+def test_retry_delay():
+    """Backoff grows per attempt and never undercuts Retry-After"""
+    assert 1.0 <= retry_delay(0) <= 2.0
+    assert 4.0 <= retry_delay(2) <= 5.0
+    assert retry_delay(0, retry_after=30.0) == 30.0
+
+    print("✓ retry_delay test passed")
+
+
+def test_rpm_wait_ends_on_cancel():
+    """Setting the cancel event ends a full-window wait early"""
+    limiter = RpmLimiter(1, window_s=60.0)
+    cancel_event = threading.Event()
+    assert limiter.wait_if_throttled(cancel_event)
+
+    threading.Timer(0.1, cancel_event.set).start()
+    started = time.monotonic()
+    assert not limiter.wait_if_throttled(cancel_event)
+    assert time.monotonic() - started < 5.0
+
+    print("✓ RPM cancel test passed")
+
+
+def test_cancel_wakes_paused_acquire():
+    """cancel() releases workers held by the breaker pause"""
+    controller = RateController(initial=4)
+    for _ in range(BREAKER_THRESHOLD):
+        controller.record(dict(RATE_LIMITED, retry_after=60.0), 1.0)
+
+    threading.Timer(0.1, controller.cancel).start()
+    started = time.monotonic()
+    with controller.slot() as acquired:
+        assert not acquired
+    assert time.monotonic() - started < 5.0
+
+    print("✓ Controller cancel test passed")
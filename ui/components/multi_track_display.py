@@ -5,6 +5,7 @@ Displays 5 audio channels with individual waveforms and volume controls
 
 import tkinter as tk
 from tkinter import ttk
+import numpy as np
 from config.color_scheme import COLORS
 
 
@@ -128,7 +129,7 @@ class MultiTrackDisplay:
 
         Args:
             track_id: Track identifier
-            waveform_data: List of amplitude values (normalized -1 to 1)
+            waveform_data: Array or list of amplitude values (normalized -1 to 1)
             channel: "mono" or "stereo" (stereo data should be pre-averaged)
         """
         if track_id not in self.track_widgets:
@@ -140,7 +141,7 @@ class MultiTrackDisplay:
         # Clear existing waveform
         canvas.delete("waveform")
 
-        if not waveform_data or len(waveform_data) == 0:
+        if waveform_data is None or len(waveform_data) == 0:
             print(f"Warning: No waveform data for track {track_id}")
             return
 
@@ -153,14 +154,12 @@ class MultiTrackDisplay:
             print(f"Warning: Invalid canvas dimensions for track {track_id}: {width}x{height}")
             return
 
-        # Draw waveform
+        # Draw waveform (coordinates computed in one pass, listed only for Tk)
         mid_y = height / 2
-        points = []
-
-        for i, amplitude in enumerate(waveform_data):
-            x = (i / len(waveform_data)) * width
-            y = mid_y - (amplitude * (height / 2) * 0.8)  # 80% of half-height
-            points.extend([x, y])
+        amplitudes = np.asarray(waveform_data, dtype=np.float64)
+        xs = (np.arange(len(amplitudes)) / len(amplitudes)) * width
+        ys = mid_y - (amplitudes * (height / 2) * 0.8)  # 80% of half-height
+        points = np.column_stack((xs, ys)).ravel().tolist()
 
         if len(points) >= 4:  # Need at least 2 points
             # Get track color
@@ -10,6 +10,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import os
 from config.color_scheme import COLORS, create_colored_button
+from managers.version_manager import MarkerVersionManager
 from ui.editors.sfx_editor import SfxEditor
 from ui.editors.voice_editor import VoiceEditor
 from ui.editors.music_editor import MusicEditor
@@ -189,14 +190,9 @@ class PromptEditorWindow:
     def update_version_metadata(self):
         """Update the metadata display for selected version"""
         selected_version_num = self.get_selected_version_number()
-        versions = self.marker.get('versions', [])
 
         # Find the selected version data
-        version_data = None
-        for v in versions:
-            if v['version'] == selected_version_num:
-                version_data = v
-                break
+        version_data = MarkerVersionManager.get_version(self.marker, selected_version_num)
 
         if not version_data:
             self.metadata_label.config(text="No metadata available")
@@ -256,14 +252,8 @@ class PromptEditorWindow:
         if self.gui_ref and hasattr(self.gui_ref, 'rollback_to_version'):
             success = self.gui_ref.rollback_to_version(self.marker, selected_version_num)
             if success:
-                # Reload prompt data from selected version
-                versions = self.marker.get('versions', [])
-                for v in versions:
-                    if v['version'] == selected_version_num:
-                        prompt_data_snapshot = v.get('prompt_data_snapshot', {})
-                        self.marker['prompt_data'] = prompt_data_snapshot
-                        self.marker['current_version'] = selected_version_num
-                        break
+                # rollback_to_version already restored prompt_data (as a copy of
+                # the snapshot) and current_version on self.marker
 
                 # Update dropdown to show new current
                 self.version_var.set(f"v{selected_version_num} (current)")
@@ -280,14 +270,9 @@ class PromptEditorWindow:
     def on_play_version(self):
         """Play audio for selected version"""
         selected_version_num = self.get_selected_version_number()
-        versions = self.marker.get('versions', [])
 
         # Find the selected version data
-        version_data = None
-        for v in versions:
-            if v['version'] == selected_version_num:
-                version_data = v
-                break
+        version_data = MarkerVersionManager.get_version(self.marker, selected_version_num)
 
         if not version_data:
             messagebox.showerror(